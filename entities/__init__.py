@@ -1,4 +1,5 @@
 # entities/__init__.py
+import importlib
 
 from .base_drone import BaseDrone
 from .player import PlayerDrone # CORRECTED: Import PlayerDrone directly
@@ -11,10 +12,7 @@ from .collectibles import (
 from .particle import Particle
 from .maze_guardian import MazeGuardian 
 from .escape_zone import EscapeZone
-from .core_reactor import CoreReactor
-from .turret import Turret
 from .maze import Maze # Chapter 1 Maze
-from .maze_chapter2 import MazeChapter2 # Chapter 2 Maze
 
 __all__ = [
     "AncientAlienTerminal",
@@ -41,3 +39,12 @@ __all__ = [
     "VaultLogItem",
     "WeaponUpgradeItem"
 ]
+
+# Maze defense entities (Chapter 2 maze, core reactor, turrets) load on first access, when that mode is entered
+_LAZY_EXPORTS = {"CoreReactor": ".core_reactor", "Turret": ".turret", "MazeChapter2": ".maze_chapter2"}
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None: raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(importlib.import_module(module_name, __name__), name)
+    return value
@@ -70,8 +70,9 @@ class BaseDrone(pygame.sprite.Sprite):
         if self.collision_rect:
             self.collision_rect.center = self.rect.center
 
-    def draw(self, surface):
+    def draw(self, surface, camera=None):
         if self.alive:
+            view_rect = camera.apply(self.rect) if camera else self.rect
             # If a subclass (like PlayerDrone) properly sets and rotates self.image,
             # this will draw the correct rotated sprite.
             # If self.image is the default Surface([self.size, self.size]), this won't show much.
@@ -79,7 +80,7 @@ class BaseDrone(pygame.sprite.Sprite):
             # for debugging if a subclass fails to set its image.
             if self.image and (self.image.get_width() > 1 or self.image.get_height() > 1):
                 # Assumes subclasses handle rotation of their specific original_image into self.image
-                surface.blit(self.image, self.rect)
+                surface.blit(self.image, view_rect)
             else:  # Fallback for basic drawing if self.image is minimal or not set by subclass
                 # Draw a simple triangle if no proper image is set
                 points = [
@@ -91,7 +92,7 @@ class BaseDrone(pygame.sprite.Sprite):
                 pygame.draw.polygon(shape_surf, CYAN, points)
                 
                 rotated_image = pygame.transform.rotate(shape_surf, -self.angle)
-                draw_rect = rotated_image.get_rect(center=self.rect.center)
+                draw_rect = rotated_image.get_rect(center=view_rect.center)
                 surface.blit(rotated_image, draw_rect)
 
     def update(self, maze=None, game_area_x_offset=0):
@@ -10,7 +10,7 @@ from game_settings import (
     PLAYER_BULLET_COLOR, PLAYER_BULLET_SPEED, PLAYER_BULLET_LIFETIME, PLAYER_DEFAULT_BULLET_SIZE,
     MISSILE_COLOR, MISSILE_SPEED, MISSILE_LIFETIME, MISSILE_SIZE, MISSILE_TURN_RATE,
     LIGHTNING_COLOR, LIGHTNING_LIFETIME, LIGHTNING_ZAP_RANGE, LIGHTNING_CORE_COLOR,
-    WIDTH, GAME_PLAY_AREA_HEIGHT, TILE_SIZE, WHITE, RED, YELLOW, MAGENTA, GREEN, CYAN
+    WIDTH, GAME_PLAY_AREA_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT, TILE_SIZE, WHITE, RED, YELLOW, MAGENTA, GREEN, CYAN
 )
 try:
     from .particle import Particle
@@ -83,18 +83,22 @@ class Bullet(pygame.sprite.Sprite):
         self.rect.center = (int(self.x), int(self.y)); self.lifetime -= 1
         if self.lifetime <= 0: self.alive = False
         if self.alive:
-            min_x_bound, max_x_bound = game_area_x_offset, WIDTH; min_y_bound, max_y_bound = 0, GAME_PLAY_AREA_HEIGHT
+            min_x_bound, max_x_bound = game_area_x_offset, WORLD_WIDTH; min_y_bound, max_y_bound = 0, WORLD_HEIGHT
             center_x, center_y, half_size = self.rect.centerx, self.rect.centery, self.size
             if not (min_x_bound < center_x - half_size and center_x + half_size < max_x_bound and \
                     min_y_bound < center_y - half_size and center_y + half_size < max_y_bound):
                 self.alive = False 
         if not self.alive: self.kill()
 
-    def draw(self, surface):
-        if self.alive and self.image and self.rect: surface.blit(self.image, self.rect)
+    def draw(self, surface, camera=None):
+        if self.alive and self.image and self.rect: surface.blit(self.image, camera.apply(self.rect) if camera else self.rect)
 
 
 class Missile(pygame.sprite.Sprite): 
+    # Unrotated missile shape keyed by (size, color), and pre-rotated frames of it keyed by (size, color, frame_count, frame_index); shared by every missile
+    _base_images = {}
+    _rotation_frames = {}
+
     def __init__(self, x, y, initial_angle, damage, enemies_group):
         super().__init__()
         self.id = id(self) 
@@ -102,13 +106,28 @@ class Missile(pygame.sprite.Sprite):
         self.speed = gs.MISSILE_SPEED; self.lifetime = gs.MISSILE_LIFETIME; self.damage = damage
         self.enemies_group = enemies_group; self.target, self.turn_rate = None, gs.MISSILE_TURN_RATE
         self.alive, self.frames_existed = True, 0; self.is_sliding, self.slide_direction_attempts, self.MAX_SLIDE_ATTEMPTS = False, 0, 3
-        missile_w, missile_h = gs.MISSILE_SIZE*1.5, gs.MISSILE_SIZE*2.5; self.original_image_surface = pygame.Surface([missile_w, missile_h], pygame.SRCALPHA)
-        points = [(missile_w*0.5,0),(0,missile_h),(missile_w,missile_h)]; pygame.draw.polygon(self.original_image_surface,gs.MISSILE_COLOR,points)
-        self.original_image = pygame.transform.rotate(self.original_image_surface,-90); self.image = self.original_image
+        self.original_image = self._get_base_image(); self.image = self.original_image
         self.rect = self.image.get_rect(center=(int(self.x), int(self.y))); self._update_image_and_rect() 
 
+    @classmethod
+    def _get_base_image(cls):
+        """The missile shape pointing along angle 0, drawn once per (MISSILE_SIZE, MISSILE_COLOR)."""
+        base_key = (gs.MISSILE_SIZE, gs.MISSILE_COLOR)
+        base_image = cls._base_images.get(base_key)
+        if base_image is None:
+            missile_w, missile_h = gs.MISSILE_SIZE*1.5, gs.MISSILE_SIZE*2.5; surface = pygame.Surface([missile_w, missile_h], pygame.SRCALPHA)
+            pygame.draw.polygon(surface, gs.MISSILE_COLOR, [(missile_w*0.5,0),(0,missile_h),(missile_w,missile_h)])
+            base_image = cls._base_images[base_key] = pygame.transform.rotate(surface, -90)
+        return base_image
+
     def _update_image_and_rect(self):
-        self.image = pygame.transform.rotate(self.original_image, -self.angle)
+        frame_count = max(1, int(gs.get_game_setting("ROTATION_FRAME_COUNT", 64)))
+        frame_index = gs.quantize_angle(-self.angle, frame_count)
+        frame_key = (gs.MISSILE_SIZE, gs.MISSILE_COLOR, frame_count, frame_index)
+        frame = Missile._rotation_frames.get(frame_key)
+        if frame is None:
+            frame = Missile._rotation_frames[frame_key] = pygame.transform.rotate(self.original_image, frame_index * 360.0 / frame_count)
+        self.image = frame
         self.rect = self.image.get_rect(center=(int(self.x), int(self.y)))
 
     def _find_target(self): 
@@ -167,13 +186,49 @@ class Missile(pygame.sprite.Sprite):
         if self.alive and not collided_this_frame: self.x,self.y=next_x,next_y
         self._update_image_and_rect() 
         self.lifetime-=1; out_of_bounds=True
-        if self.rect: out_of_bounds=not(game_area_x_offset-self.rect.width < self.rect.centerx < WIDTH+self.rect.width and \
-                               -self.rect.height < self.rect.centery < GAME_PLAY_AREA_HEIGHT+self.rect.height)
+        if self.rect: out_of_bounds=not(game_area_x_offset-self.rect.width < self.rect.centerx < WORLD_WIDTH+self.rect.width and \
+                               -self.rect.height < self.rect.centery < WORLD_HEIGHT+self.rect.height)
         if self.lifetime<=0 or out_of_bounds: self.alive=False
         if not self.alive: self.kill()
 
-    def draw(self, surface):
-        if self.alive and self.image and self.rect: surface.blit(self.image, self.rect)
+    def draw(self, surface, camera=None):
+        if self.alive and self.image and self.rect: surface.blit(self.image, camera.apply(self.rect) if camera else self.rect)
+
+
+_LIGHTNING_ZAP_IMAGE = pygame.Surface((1, 1), pygame.SRCALPHA) # Zaps draw themselves; their image only satisfies the Sprite interface
+_LIGHTNING_BOLT_TEMPLATES = {} # (segments, branch chance, branch max segments, pool size) -> bolt shapes
+
+
+def _get_lightning_bolt_templates(num_segments, branch_chance, branch_max_segments, pool_size):
+    """
+    A pool of random bolt shapes in a frame normalized to the bolt, generated once per settings combination.
+    Each shape is (points, branches). points holds (t, mid factor, jitter) per segment end: t runs along the bolt
+    and jitter is the sideways offset in units of the bolt's maximum offset. branches holds (start index, branch points),
+    each branch point being (along, across, jag) relative to the inner point it forks from, along/across in segment
+    lengths and jag in units of the branch offset. Drawing scales and rotates a shape onto the bolt's endpoints.
+    """
+    cache_key = (num_segments, branch_chance, branch_max_segments, pool_size)
+    templates = _LIGHTNING_BOLT_TEMPLATES.get(cache_key)
+    if templates is None:
+        templates = []
+        for _ in range(max(1, pool_size)):
+            points = []
+            for i in range(1, num_segments + 1):
+                t = i / num_segments; mid_f = math.sin(t * math.pi)
+                points.append((t, mid_f, (random.random() - 0.5) * 2 * mid_f))
+            branches = []
+            for i in range(num_segments):
+                if random.random() >= branch_chance: continue
+                angle = math.pi / 2 + random.uniform(-math.pi / 3, math.pi / 3) + (math.pi if random.random() < 0.5 else 0) # Off the bolt's perpendicular, either side
+                dir_along, dir_across = math.cos(angle), math.sin(angle)
+                seg_len_base = random.uniform(0.3, 0.7); along = across = 0.0; branch_points = []
+                for j in range(random.randint(1, branch_max_segments)):
+                    step = seg_len_base * (1 - (j / branch_max_segments) * 0.5); along += dir_along * step; across += dir_across * step
+                    branch_points.append((along, across, random.uniform(-1, 1) * math.sin(((j + 1) / branch_max_segments) * math.pi)))
+                branches.append((i, branch_points))
+            templates.append((points, branches))
+        _LIGHTNING_BOLT_TEMPLATES[cache_key] = templates
+    return templates
 
 
 class LightningZap(pygame.sprite.Sprite):
@@ -194,6 +249,18 @@ class LightningZap(pygame.sprite.Sprite):
         if not isinstance(self.color, tuple) or len(self.color) < 3: self.color = gs.CYAN
         self.damage_applied = False
 
+        # Bolt settings are read once per zap rather than on every draw
+        self.bolt_outer_thickness = gs.get_game_setting("LIGHTNING_BASE_THICKNESS", 5) + 2
+        self.bolt_core_thickness = max(2, int(self.bolt_outer_thickness * gs.get_game_setting("LIGHTNING_CORE_THICKNESS_RATIO", 0.4)))
+        self.bolt_branch_thickness = max(2, int(self.bolt_core_thickness * gs.get_game_setting("LIGHTNING_BRANCH_THICKNESS_RATIO", 0.5)))
+        self.bolt_max_offset = gs.get_game_setting("LIGHTNING_MAX_OFFSET", 18)
+        self.bolt_core_offset_ratio = gs.get_game_setting("LIGHTNING_CORE_OFFSET_RATIO", 0.3)
+        self.bolt_branch_max_offset = gs.get_game_setting("LIGHTNING_BRANCH_MAX_OFFSET", 10)
+        self.bolt_num_segments = gs.get_game_setting("LIGHTNING_SEGMENTS", 12)
+        self.bolt_templates = _get_lightning_bolt_templates(self.bolt_num_segments, gs.get_game_setting("LIGHTNING_BRANCH_CHANCE", 0.25),
+                                                            gs.get_game_setting("LIGHTNING_BRANCH_MAX_SEGMENTS", 5), gs.get_game_setting("LIGHTNING_TEMPLATE_POOL_SIZE", 16))
+        self.rect_padding = self.bolt_max_offset + gs.get_game_setting("LIGHTNING_BASE_THICKNESS", 5)
+
         self.current_start_pos = self.player_ref.rect.center if self.player_ref and hasattr(self.player_ref, 'rect') and self.player_ref.rect else (0,0)
         self.initial_target_pos_snapshot = self.initial_target_ref.rect.center if self.initial_target_ref and hasattr(self.initial_target_ref, 'rect') else None
         
@@ -201,7 +268,7 @@ class LightningZap(pygame.sprite.Sprite):
         self.current_target_pos = self._get_wall_collision_point(self.current_start_pos, self.current_target_pos) 
         self.hit_wall_at_end = (self.current_target_pos != self._calculate_potential_target_pos(ignore_snapshot=True)) 
 
-        self.image = pygame.Surface((1,1), pygame.SRCALPHA) 
+        self.image = _LIGHTNING_ZAP_IMAGE
         self.rect = self.image.get_rect(center=self.current_start_pos)
         self._update_rect_for_collision() 
         # logger.debug(f"LZap (ID:{self.id}) __init__: Alive={self.alive}, Lifetime={self.lifetime_frames}, Start:{self.current_start_pos}, Target:{self.current_target_pos}, hit_wall:{self.hit_wall_at_end}, TargetRef: {self.initial_target_ref}")
@@ -249,18 +316,12 @@ class LightningZap(pygame.sprite.Sprite):
             # logger.error(f"LZap (ID:{self.id}) _update_rect_for_collision: Invalid positions. Start: {self.current_start_pos}, Target: {self.current_target_pos}")
             sx = self.current_start_pos[0] if isinstance(self.current_start_pos,tuple) and len(self.current_start_pos)>0 and isinstance(self.current_start_pos[0],(int,float)) else 0
             sy = self.current_start_pos[1] if isinstance(self.current_start_pos,tuple) and len(self.current_start_pos)>1 and isinstance(self.current_start_pos[1],(int,float)) else 0
-            self.image = pygame.Surface((1,1), pygame.SRCALPHA); self.rect = self.image.get_rect(center=(int(sx),int(sy))); return
-
-        all_x = [self.current_start_pos[0], self.current_target_pos[0]]; all_y = [self.current_start_pos[1], self.current_target_pos[1]]
-        min_x, max_x, min_y, max_y = min(all_x), max(all_x), min(all_y), max(all_y)
-        padding = gs.get_game_setting("LIGHTNING_MAX_OFFSET",18) + gs.get_game_setting("LIGHTNING_BASE_THICKNESS",5) 
-        rect_x,rect_y=int(min_x-padding),int(min_y-padding)
-        rect_width,rect_height=max(1,int(max_x-min_x+2*padding)),max(1,int(max_y-min_y+2*padding))
-        try:self.image=pygame.Surface((rect_width,rect_height),pygame.SRCALPHA)
-        except pygame.error: 
-            # logger.error(f"LZap (ID:{self.id}) Pygame error creating surface w={rect_width},h={rect_height}. Using 1x1.")
-            self.image=pygame.Surface((1,1),pygame.SRCALPHA)
-        self.rect=self.image.get_rect(topleft=(rect_x,rect_y))
+            self.rect.size = (1, 1); self.rect.center = (int(sx), int(sy)); return
+
+        # The bounding box of the bolt plus its widest jitter, updated in place
+        min_x, max_x = sorted((self.current_start_pos[0], self.current_target_pos[0])); min_y, max_y = sorted((self.current_start_pos[1], self.current_target_pos[1]))
+        padding = self.rect_padding
+        self.rect.update(int(min_x-padding), int(min_y-padding), max(1,int(max_x-min_x+2*padding)), max(1,int(max_y-min_y+2*padding)))
 
     def update(self,current_time_ms): 
         if not self.alive: 
@@ -315,19 +376,13 @@ class LightningZap(pygame.sprite.Sprite):
                 self.game_controller_ref.explosion_particles_group.add(spark)
             except Exception as e:logger.error(f"LightningZap: Error creating wall crawl particle: {e}")
 
-    def _draw_lightning_bolt_effect(self, surface, p1, p2, base_bolt_color, alpha):
-        base_outer_thickness = gs.get_game_setting("LIGHTNING_BASE_THICKNESS", 5) + 2 
-        outer_thickness = base_outer_thickness 
-        base_core_thickness_ratio = gs.get_game_setting("LIGHTNING_CORE_THICKNESS_RATIO", 0.4)
-        inner_core_thickness = max(2, int(outer_thickness * base_core_thickness_ratio))
-        branch_thickness_ratio = gs.get_game_setting("LIGHTNING_BRANCH_THICKNESS_RATIO", 0.5)
-        branch_thickness = max(2, int(inner_core_thickness * branch_thickness_ratio)) 
-        num_segments = gs.get_game_setting("LIGHTNING_SEGMENTS", 12)
-        outer_max_offset = gs.get_game_setting("LIGHTNING_MAX_OFFSET", 18)
+    def _draw_lightning_bolt_effect(self, surface, p1, p2, base_bolt_color, alpha, camera=None):
+        outer_thickness = self.bolt_outer_thickness
+        inner_core_thickness = self.bolt_core_thickness
+        branch_thickness = self.bolt_branch_thickness
+        outer_max_offset = self.bolt_max_offset
         core_color_rgb = LIGHTNING_CORE_COLOR[:3]
-        branch_chance = gs.get_game_setting("LIGHTNING_BRANCH_CHANCE", 0.25)
-        branch_max_segments = gs.get_game_setting("LIGHTNING_BRANCH_MAX_SEGMENTS", 5)
-        branch_max_offset = gs.get_game_setting("LIGHTNING_BRANCH_MAX_OFFSET", 10)
+        branch_max_offset = self.bolt_branch_max_offset
         
         dx_total,dy_total = p2[0]-p1[0],p2[1]-p1[1]
         dist_total = math.hypot(dx_total,dy_total)
@@ -349,50 +404,39 @@ class LightningZap(pygame.sprite.Sprite):
                     except Exception as e: logger.error(f"LZap: Error creating close-range particle: {e}")
             return 
         
-        # --- Original complex drawing logic (RESTORED) ---
-        perp_dx,perp_dy = -dy_total/dist_total,dx_total/dist_total
+        # A pooled bolt shape is scaled and rotated onto p1->p2: t runs along the bolt, jitter along its perpendicular
+        dir_x,dir_y = dx_total/dist_total,dy_total/dist_total
+        perp_dx,perp_dy = -dir_y,dir_x
         points_outer,points_inner = [p1],[p1]
         target_pull,jitter_reduct = 0.7,0.4
         apply_bend = self.initial_target_ref and hasattr(self.initial_target_ref,'alive')and self.initial_target_ref.alive and hasattr(self.initial_target_ref,'rect')
         max_offset_outer_curr=outer_max_offset*(1.0-jitter_reduct if apply_bend else 1.0)
+        max_offset_inner_curr=outer_max_offset*self.bolt_core_offset_ratio*(1.0-jitter_reduct if apply_bend else 1.0)
         target_pos_actual=self.initial_target_ref.rect.center if apply_bend and self.initial_target_ref and hasattr(self.initial_target_ref, 'rect') else p2 
+        template_points, template_branches = random.choice(self.bolt_templates)
         
-        for i in range(1,num_segments+1):
-            t=i/num_segments
+        for t, mid_f, jitter_f in template_points:
             straight_x,straight_y = p1[0]+dx_total*t,p1[1]+dy_total*t
-            rand_f,mid_f=(random.random()-0.5)*2,math.sin(t*math.pi)
-            jit_out_x,jit_out_y=perp_dx*max_offset_outer_curr*rand_f*mid_f,perp_dy*max_offset_outer_curr*rand_f*mid_f
-            max_offset_inner_curr=outer_max_offset*gs.get_game_setting("LIGHTNING_CORE_OFFSET_RATIO",0.3)*(1.0-jitter_reduct if apply_bend else 1.0)
-            jit_in_x,jit_in_y=perp_dx*max_offset_inner_curr*rand_f*mid_f,perp_dy*max_offset_inner_curr*rand_f*mid_f
-            final_out_x,final_out_y,final_in_x,final_in_y=straight_x+jit_out_x,straight_y+jit_out_y,straight_x+jit_in_x,straight_y+jit_in_y
-            if apply_bend:
-                vec_sl_target_x,vec_sl_target_y=target_pos_actual[0]-straight_x,target_pos_actual[1]-straight_y
-                bend_disp_f=target_pull*mid_f; shift_x,shift_y=vec_sl_target_x*bend_disp_f,vec_sl_target_y*bend_disp_f
-                final_out_x,final_out_y=straight_x+shift_x+jit_out_x,straight_y+shift_y+jit_out_y
-                final_in_x,final_in_y=straight_x+shift_x+jit_in_x,straight_y+shift_y+jit_in_y
-            points_outer.append((final_out_x,final_out_y))
-            points_inner.append((final_in_x,final_in_y))
+            if apply_bend: # Bow the bolt towards the target, most strongly mid-way
+                bend_disp_f=target_pull*mid_f
+                straight_x,straight_y=straight_x+(target_pos_actual[0]-straight_x)*bend_disp_f,straight_y+(target_pos_actual[1]-straight_y)*bend_disp_f
+            points_outer.append((straight_x+perp_dx*max_offset_outer_curr*jitter_f,straight_y+perp_dy*max_offset_outer_curr*jitter_f))
+            points_inner.append((straight_x+perp_dx*max_offset_inner_curr*jitter_f,straight_y+perp_dy*max_offset_inner_curr*jitter_f))
         
         points_outer[-1],points_inner[-1]=p2,p2
+        # Points stay in world space for the impact sparks; only the drawn lines are shifted into view space
+        to_view = (lambda points: [camera.apply_point(point) for point in points]) if camera else (lambda points: points)
         bolt_rgb = base_bolt_color[:3] if isinstance(base_bolt_color, tuple) and len(base_bolt_color) >=3 else gs.CYAN[:3]
         
-        if len(points_outer)>1 and outer_thickness>0:pygame.draw.lines(surface,(*bolt_rgb,int(alpha*0.75)),False,points_outer,outer_thickness)
-        if len(points_inner)>1 and inner_core_thickness>0:pygame.draw.lines(surface,(*core_color_rgb,alpha),False,points_inner,inner_core_thickness)
+        if len(points_outer)>1 and outer_thickness>0:pygame.draw.lines(surface,(*bolt_rgb,int(alpha*0.75)),False,to_view(points_outer),outer_thickness)
+        if len(points_inner)>1 and inner_core_thickness>0:pygame.draw.lines(surface,(*core_color_rgb,alpha),False,to_view(points_inner),inner_core_thickness)
         
-        for i in range(len(points_inner)-1): 
-            if random.random()<branch_chance:
-                branch_start=points_inner[i];seg_dx,seg_dy=points_inner[i+1][0]-branch_start[0],points_inner[i+1][1]-branch_start[1];seg_len=math.hypot(seg_dx,seg_dy)
-                if seg_len==0:continue
-                b_perp_dx,b_perp_dy=-seg_dy/seg_len,seg_dx/seg_len;angle_p=random.uniform(-math.pi/3,math.pi/3);c,s=math.cos(angle_p),math.sin(angle_p)
-                f_branch_dx,f_branch_dy=b_perp_dx*c-b_perp_dy*s,b_perp_dx*s+b_perp_dy*c
-                if random.random()<0.5:f_branch_dx*=-1;f_branch_dy*=-1
-                branch_pts=[branch_start];cur_b_pos=list(branch_start);b_seg_len_base=dist_total/num_segments*random.uniform(0.3,0.7)
-                for j in range(random.randint(1,branch_max_segments)):
-                    cur_b_seg_len=b_seg_len_base*(1-(j/branch_max_segments)*0.5);cur_b_pos[0]+=f_branch_dx*cur_b_seg_len;cur_b_pos[1]+=f_branch_dy*cur_b_seg_len
-                    b_offset_mag=random.uniform(-branch_max_offset,branch_max_offset)*math.sin(((j+1)/branch_max_segments)*math.pi)
-                    b_jag_x,b_jag_y=perp_dx*b_offset_mag,perp_dy*b_offset_mag;branch_pts.append((cur_b_pos[0]+b_jag_x,cur_b_pos[1]+b_jag_y))
-                    if len(branch_pts)>branch_max_segments:break
-                if len(branch_pts)>1 and branch_thickness>0:pygame.draw.lines(surface,(*core_color_rgb,int(alpha*0.9)),False,branch_pts,branch_thickness) 
+        seg_len = dist_total/self.bolt_num_segments
+        for start_index, branch_template in template_branches:
+            start_x,start_y=points_inner[start_index]
+            branch_pts=[(start_x,start_y)]+[(start_x+(dir_x*along+perp_dx*across)*seg_len+perp_dx*jag*branch_max_offset,start_y+(dir_y*along+perp_dy*across)*seg_len+perp_dy*jag*branch_max_offset)
+                                           for along, across, jag in branch_template]
+            if branch_thickness>0:pygame.draw.lines(surface,(*core_color_rgb,int(alpha*0.9)),False,to_view(branch_pts),branch_thickness) 
         
         is_direct_enemy_hit = self.initial_target_ref and not self.hit_wall_at_end
 
@@ -403,7 +447,7 @@ class LightningZap(pygame.sprite.Sprite):
                 normalized_incident_vector = (incident_vec_x / len_inc, incident_vec_y / len_inc)
                 self._draw_wall_crawl_effect(surface, p2, normalized_incident_vector, alpha) 
 
-    def draw(self, surface):
+    def draw(self, surface, camera=None):
         if self.alive:
             current_alpha_perc = 1.0 - (self.frames_existed / self.lifetime_frames) 
             current_alpha = int(255 * (current_alpha_perc ** 1.5))
@@ -414,4 +458,4 @@ class LightningZap(pygame.sprite.Sprite):
                 p2_valid = isinstance(self.current_target_pos, tuple) and len(self.current_target_pos) == 2 and all(isinstance(c, (int, float)) for c in self.current_target_pos)
                 
                 if p1_valid and p2_valid:
-                    self._draw_lightning_bolt_effect(surface, self.current_start_pos, self.current_target_pos, self.color, current_alpha)
+                    self._draw_lightning_bolt_effect(surface, self.current_start_pos, self.current_target_pos, self.color, current_alpha, camera)
@@ -15,7 +15,10 @@ from game_settings import (
 
 class Collectible(pygame.sprite.Sprite):
     """Base class for collectible items with a pulsing shine effect, bobbing, and icon spin."""
-    def __init__(self, x, y, base_color, size, thickness=3, original_icon_surface=None, is_rectangular=False):
+    # Pre-baked (pulse phase x icon angle) frames shared by every collectible with the same look, see _get_baked_frame
+    _frame_sheets = {}
+
+    def __init__(self, x, y, base_color, size, thickness=3, original_icon_surface=None, is_rectangular=False, icon_cache_key=None):
         super().__init__()
         self.center_x = float(x)
         self.center_y = float(y)
@@ -40,6 +43,8 @@ class Collectible(pygame.sprite.Sprite):
         
         self.original_icon_surface = original_icon_surface
         self.icon_surface = original_icon_surface
+        self.icon_cache_key = icon_cache_key # Identifies the icon in the shared frame cache; an icon without one bakes frames for this instance only
+        self._own_frame_sheets = {}
         
         self.collected = False
         self.expired = False  
@@ -57,7 +62,8 @@ class Collectible(pygame.sprite.Sprite):
         self.current_y_offset = 0
 
         self.icon_angle = 0
-        self.icon_rotation_speed = 0.3 if original_icon_surface else 0
+        self.icon_rotation_speed = 0.3 if original_icon_surface else 0 # Degrees per frame at 60 FPS
+        self.spawn_ticks = pygame.time.get_ticks()
         
         # Initial draw and positioning
         self._update_pulse_effect()
@@ -66,11 +72,14 @@ class Collectible(pygame.sprite.Sprite):
         self._render_to_image()
 
     def _update_pulse_effect(self):
-        # (This method's logic remains the same)
         time_ticks = pygame.time.get_ticks()
         pulse_wave = math.sin(time_ticks * self.pulse_speed_factor + self.pulse_time_offset)
-        self.current_pulse_radius = self.base_draw_radius + pulse_wave * self.pulse_radius_amplitude
-        self.current_pulse_radius = max(self.base_draw_radius * 0.65, self.current_pulse_radius)
+        self.current_pulse_radius, self.current_color = self._compute_pulse(pulse_wave)
+
+    def _compute_pulse(self, pulse_wave):
+        """Returns the (radius, color) of the pulse for a wave value in [-1, 1]."""
+        pulse_radius = self.base_draw_radius + pulse_wave * self.pulse_radius_amplitude
+        pulse_radius = max(self.base_draw_radius * 0.65, pulse_radius)
         alpha_normalized = (pulse_wave + 1) / 2
         alpha = int(150 + alpha_normalized * self.pulse_alpha_amplitude)
         alpha = max(100, min(255, alpha))
@@ -79,7 +88,7 @@ class Collectible(pygame.sprite.Sprite):
         brightness_increase = 35
         r_bright, g_bright, b_bright = min(255, r_base + brightness_increase), min(255, g_base + brightness_increase), min(255, b_base + brightness_increase)
         r_pulsed, g_pulsed, b_pulsed = int(r_base + (r_bright - r_base) * lerp_factor_color), int(g_base + (g_bright - g_base) * lerp_factor_color), int(b_base + (b_bright - b_base) * lerp_factor_color)
-        self.current_color = (r_pulsed, g_pulsed, b_pulsed, alpha)
+        return pulse_radius, (r_pulsed, g_pulsed, b_pulsed, alpha)
 
     def _update_bob_effect(self):
         # (This method's logic remains the same)
@@ -90,36 +99,72 @@ class Collectible(pygame.sprite.Sprite):
             self.rect.centerx = int(self.center_x)
 
     def _render_to_image(self):
-        # (This method's logic remains the same)
-        self.image.fill((0, 0, 0, 0))
+        self._draw_frame(self.image, self.current_pulse_radius, self.current_color, self.icon_angle)
+
+    def _draw_frame(self, surface, pulse_radius, color, icon_angle):
+        surface.fill((0, 0, 0, 0))
         surface_center_x, surface_center_y = self.surface_size // 2, self.surface_size // 2
         if not self.is_rectangular:
-            pygame.draw.circle(self.image, self.current_color, (surface_center_x, surface_center_y), int(self.current_pulse_radius), self.thickness)
-            if self.current_pulse_radius > self.base_draw_radius * 0.8:
-                secondary_radius = int(self.current_pulse_radius * 1.15)
-                current_alpha_component = self.current_color[3] if len(self.current_color) == 4 else 255
+            pygame.draw.circle(surface, color, (surface_center_x, surface_center_y), int(pulse_radius), self.thickness)
+            if pulse_radius > self.base_draw_radius * 0.8:
+                secondary_radius = int(pulse_radius * 1.15)
+                current_alpha_component = color[3] if len(color) == 4 else 255
                 denominator = self.pulse_radius_amplitude * 1.2
-                normalized_expansion = (self.current_pulse_radius - self.base_draw_radius * 0.8) / denominator if denominator != 0 else 1.0
+                normalized_expansion = (pulse_radius - self.base_draw_radius * 0.8) / denominator if denominator != 0 else 1.0
                 normalized_expansion = max(0, min(1, normalized_expansion))
                 secondary_alpha = int(current_alpha_component * 0.4 * normalized_expansion)
                 if secondary_alpha > 20:
-                    secondary_color = (*self.current_color[:3], secondary_alpha)
-                    pygame.draw.circle(self.image, secondary_color, (surface_center_x, surface_center_y), secondary_radius, max(1, self.thickness // 2))
+                    secondary_color = (*color[:3], secondary_alpha)
+                    pygame.draw.circle(surface, secondary_color, (surface_center_x, surface_center_y), secondary_radius, max(1, self.thickness // 2))
         else:
             rect_w = self.item_size[0] if isinstance(self.item_size, tuple) else self.item_size
             rect_h = self.item_size[1] if isinstance(self.item_size, tuple) else self.item_size
             temp_rect = pygame.Rect(0,0, int(rect_w), int(rect_h)); temp_rect.center = (surface_center_x, surface_center_y)
-            pygame.draw.rect(self.image, self.current_color, temp_rect, self.thickness, border_radius=3)
+            pygame.draw.rect(surface, color, temp_rect, self.thickness, border_radius=3)
         if self.icon_surface:
-            if self.original_icon_surface and self.icon_rotation_speed > 0: 
-                fps_ratio = gs.get_game_setting("FPS", 60) / 60.0 # Adjust rotation for FPS
-                self.icon_angle = (self.icon_angle + self.icon_rotation_speed * fps_ratio) % 360
-                rotated_icon = pygame.transform.rotate(self.original_icon_surface, self.icon_angle)
+            if self._icon_spins():
+                rotated_icon = pygame.transform.rotate(self.original_icon_surface, icon_angle)
                 icon_rect = rotated_icon.get_rect(center=(surface_center_x, surface_center_y))
-                self.image.blit(rotated_icon, icon_rect)
+                surface.blit(rotated_icon, icon_rect)
             else: 
                 icon_rect = self.icon_surface.get_rect(center=(surface_center_x, surface_center_y))
-                self.image.blit(self.icon_surface, icon_rect)
+                surface.blit(self.icon_surface, icon_rect)
+
+    def _icon_spins(self):
+        return bool(self.icon_surface and self.original_icon_surface and self.icon_rotation_speed > 0)
+
+    def _get_baked_frame(self):
+        """
+        Picks the frame for the current time from the shared, lazily baked sheet for this look.
+        Instances only differ by their pulse phase offset and spawn time, so every ring (or every
+        shield power-up) reuses the same pulse_frames x icon_frames surfaces. An icon with no
+        icon_cache_key can't be told apart from another, so its frames stay with the instance.
+        """
+        pulse_frames = max(1, int(gs.get_game_setting("COLLECTIBLE_PULSE_FRAMES", 16)))
+        icon_frames = max(1, int(gs.get_game_setting("COLLECTIBLE_ICON_FRAMES", 24))) if self._icon_spins() else 1
+        icon_key = self.icon_cache_key if self.icon_surface else None
+        frame_sheets = Collectible._frame_sheets if icon_key is not None or not self.icon_surface else self._own_frame_sheets
+        sheet_key = (icon_key, self.base_color, self.item_size, self.thickness, self.is_rectangular, self.surface_size,
+                     self.pulse_radius_amplitude, self.pulse_alpha_amplitude, pulse_frames, icon_frames)
+        frames = frame_sheets.get(sheet_key)
+        if frames is None: frames = frame_sheets[sheet_key] = [None] * (pulse_frames * icon_frames)
+
+        time_ticks = pygame.time.get_ticks()
+        pulse_phase = (time_ticks * self.pulse_speed_factor + self.pulse_time_offset) % (2 * math.pi)
+        pulse_index = int(pulse_phase * pulse_frames / (2 * math.pi)) % pulse_frames
+        icon_index = 0
+        if icon_frames > 1:
+            self.icon_angle = ((time_ticks - self.spawn_ticks) * self.icon_rotation_speed * 0.06) % 360 # 60 frames per 1000 ms
+            icon_index = int(round(self.icon_angle * icon_frames / 360.0)) % icon_frames
+
+        frame_index = pulse_index * icon_frames + icon_index
+        frame = frames[frame_index]
+        if frame is None:
+            pulse_radius, color = self._compute_pulse(math.sin(pulse_index * 2 * math.pi / pulse_frames))
+            frame = pygame.Surface((self.surface_size, self.surface_size), pygame.SRCALPHA)
+            self._draw_frame(frame, pulse_radius, color, icon_index * 360.0 / icon_frames)
+            frames[frame_index] = frame
+        return frame
 
     def update_collectible_state(self, item_lifetime_ms=None):
         # (This method's logic remains the same)
@@ -128,7 +173,7 @@ class Collectible(pygame.sprite.Sprite):
             if not hasattr(self, 'creation_time'): self.creation_time = pygame.time.get_ticks()
             if pygame.time.get_ticks() - self.creation_time > item_lifetime_ms:
                 self.expired = True; return True
-        self._update_pulse_effect(); self._update_bob_effect(); self._render_to_image()
+        self._update_bob_effect(); self.image = self._get_baked_frame()
         return False
 
     def update(self):
@@ -162,7 +207,7 @@ class WeaponUpgradeItem(Collectible):
         # GameController preload should handle scaling, so we don't scale here
         loaded_original_icon = asset_manager.get_image(icon_asset_key)
 
-        super().__init__(x, y, base_color=item_color, size=POWERUP_SIZE, thickness=4, original_icon_surface=loaded_original_icon)
+        super().__init__(x, y, base_color=item_color, size=POWERUP_SIZE, thickness=4, original_icon_surface=loaded_original_icon, icon_cache_key=icon_asset_key)
         self.creation_time = pygame.time.get_ticks()
 
     def update(self):
@@ -184,7 +229,7 @@ class ShieldItem(Collectible):
         icon_asset_key = "shield_powerup_icon"
         loaded_original_icon = asset_manager.get_image(icon_asset_key)
         
-        super().__init__(x, y, base_color=item_color, size=POWERUP_SIZE, thickness=4, original_icon_surface=loaded_original_icon)
+        super().__init__(x, y, base_color=item_color, size=POWERUP_SIZE, thickness=4, original_icon_surface=loaded_original_icon, icon_cache_key=icon_asset_key)
         self.creation_time = pygame.time.get_ticks()
         self.effect_duration_ms = details.get("duration", 10000)
 
@@ -207,7 +252,7 @@ class SpeedBoostItem(Collectible):
         icon_asset_key = "speed_boost_powerup_icon"
         loaded_original_icon = asset_manager.get_image(icon_asset_key)
 
-        super().__init__(x, y, base_color=item_color, size=POWERUP_SIZE, thickness=4, original_icon_surface=loaded_original_icon)
+        super().__init__(x, y, base_color=item_color, size=POWERUP_SIZE, thickness=4, original_icon_surface=loaded_original_icon, icon_cache_key=icon_asset_key)
         self.creation_time = pygame.time.get_ticks()
         self.effect_duration_ms = details.get("duration", 7000)
         self.speed_multiplier = details.get("multiplier", 1.5)
@@ -238,7 +283,7 @@ class CoreFragmentItem(Collectible):
         loaded_original_icon = asset_manager.get_image(icon_asset_key, scale_to_size=target_icon_size)
         # --- END FIX ---
 
-        super().__init__(x, y, base_color=item_color, size=CORE_FRAGMENT_VISUAL_SIZE, thickness=3, original_icon_surface=loaded_original_icon)
+        super().__init__(x, y, base_color=item_color, size=CORE_FRAGMENT_VISUAL_SIZE, thickness=3, original_icon_surface=loaded_original_icon, icon_cache_key=icon_asset_key)
 
     def update(self):
         if self.collected: self.kill(); return True
@@ -284,6 +329,7 @@ class VaultLogItem(Collectible):
         text_surf = font.render("📝", True, gs.CYAN)
         self.icon_surface = pygame.Surface(text_surf.get_size(), pygame.SRCALPHA)
         self.icon_surface.blit(text_surf, (0,0))
+        self.icon_cache_key = f"vault_log_icon_{font_size}"
 
 
     def update(self):
@@ -307,10 +353,9 @@ class AncientAlienTerminal(pygame.sprite.Sprite):
         self.size = (int(TILE_SIZE * 0.8), int(TILE_SIZE * 1.0))
 
         # Load images from AssetManager
-        self.original_image = self.asset_manager.get_image(self.image_asset_key)
+        self.original_image = self.asset_manager.get_sprite(self.image_asset_key, self.size)
         
         if self.original_image:
-            self.original_image = pygame.transform.smoothscale(self.original_image, self.size)
             self.active_image = self.original_image.copy()
             # Example tint for active state
             self.active_image.fill((0, 50, 0, 100), special_flags=pygame.BLEND_RGBA_ADD)
@@ -360,7 +405,7 @@ class GlyphTabletItem(Collectible):
             loaded_icon.blit(text_surf, (0,0))
 
         super().__init__(x, y, base_color=CYAN, size=item_size_tuple, thickness=2,
-                         original_icon_surface=loaded_icon, is_rectangular=True)
+                         original_icon_surface=loaded_icon, is_rectangular=True, icon_cache_key=f"glyph_tablet_{icon_filename or tablet_id}")
         self.icon_rotation_speed = 0
 
     def update(self):
@@ -385,7 +430,7 @@ class ArchitectEchoItem(Collectible):
         icon_surface.blit(text_surf, (0,0))
 
         super().__init__(x, y, base_color=base_color, size=item_size, thickness=2, 
-                         original_icon_surface=icon_surface, is_rectangular=False)
+                         original_icon_surface=icon_surface, is_rectangular=False, icon_cache_key=f"architect_echo_{icon_char}_{font_size}")
         
         self.icon_rotation_speed = 0.5; self.pulse_speed_factor = 0.008
         self.pulse_radius_amplitude = self.base_draw_radius * 0.4
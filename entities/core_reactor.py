@@ -84,13 +84,14 @@ class CoreReactor(pygame.sprite.Sprite):
             if game_controller_ref and hasattr(game_controller_ref, 'play_sound'):
                 game_controller_ref.play_sound('reactor_destroyed_placeholder')
 
-    def draw_health_bar(self, surface):
+    def draw_health_bar(self, surface, camera=None):
         if not self.alive and self.current_health == 0:
             return
 
+        view_rect = camera.apply(self.rect) if camera else self.rect
         bar_width = self.size * self.health_bar_width_ratio
-        bar_x = self.rect.centerx - bar_width / 2
-        bar_y = self.rect.bottom + self.health_bar_y_offset
+        bar_x = view_rect.centerx - bar_width / 2
+        bar_y = view_rect.bottom + self.health_bar_y_offset
         health_percentage = 0.0
         if self.max_health > 0:
             health_percentage = max(0, self.current_health / self.max_health)
@@ -107,9 +108,9 @@ class CoreReactor(pygame.sprite.Sprite):
         if self.alive:
             self._draw_reactor_visual()
 
-    def draw(self, surface):
+    def draw(self, surface, camera=None):
         if self.image and self.rect:
-             surface.blit(self.image, self.rect)
+             surface.blit(self.image, camera.apply(self.rect) if camera else self.rect)
         if self.alive or self.current_health > 0:
             if self.rect:
-                 self.draw_health_bar(surface)
\ No newline at end of file
+                 self.draw_health_bar(surface, camera)
\ No newline at end of file
@@ -19,7 +19,7 @@ except ImportError:
             self.rect = self.image.get_rect(center=(x,y)); self.alive = True; self.lifetime = lifetime
             self.damage = damage 
         def update(self, maze, offset): self.lifetime -=1; _ = maze; _ = offset; 
-        def draw(self, surface): surface.blit(self.image, self.rect)
+        def draw(self, surface, camera=None): surface.blit(self.image, camera.apply(self.rect) if camera else self.rect)
 
 
 import game_settings as gs
@@ -28,7 +28,7 @@ from game_settings import (
     ENEMY_BULLET_SPEED, ENEMY_BULLET_COOLDOWN, ENEMY_BULLET_LIFETIME,
     ENEMY_BULLET_COLOR, ENEMY_BULLET_DAMAGE,
     PLAYER_DEFAULT_BULLET_SIZE, 
-    WIDTH, GAME_PLAY_AREA_HEIGHT, WHITE, GREEN, RED, YELLOW # <<< FIXED: Added RED and YELLOW
+    WIDTH, GAME_PLAY_AREA_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT, WHITE, GREEN, RED, YELLOW # <<< FIXED: Added RED and YELLOW
 )
 
 logger = logging.getLogger(__name__)
@@ -97,7 +97,7 @@ class Enemy(pygame.sprite.Sprite):
         self.x = float(x)
         self.y = float(y)
         self.angle = 0.0 
-        self.speed = gs.get_game_setting("ENEMY_SPEED", 1.5) 
+        self.speed = gs.get_game_setting("ENEMY_SPEED", ENEMY_SPEED) 
         self.health = gs.get_game_setting("ENEMY_HEALTH", 100)
         self.max_health = gs.get_game_setting("ENEMY_HEALTH", 100)
         self.alive = True
@@ -144,24 +144,15 @@ class Enemy(pygame.sprite.Sprite):
     def _load_sprite(self):
         """Loads the enemy's sprite using the AssetManager."""
         default_size = (int(TILE_SIZE * 0.7), int(TILE_SIZE * 0.7)) 
+        self.sprite_size = default_size
         
-        loaded_image = self.asset_manager.get_image(self.sprite_asset_key)
-
-        if loaded_image:
-            try:
-                self.original_image = pygame.transform.smoothscale(loaded_image, default_size)
-            except pygame.error as e:
-                logger.error(f"Enemy: Error scaling sprite for key '{self.sprite_asset_key}': {e}. Using fallback.")
-                self.original_image = None
-        else:
-            logger.warning(f"Enemy: Sprite for key '{self.sprite_asset_key}' not found in AssetManager.")
-            self.original_image = None
-
-        if self.original_image is None: 
-            self.original_image = pygame.Surface(default_size, pygame.SRCALPHA)
-            self.original_image.fill(ENEMY_COLOR) 
+        # Shared, pre-scaled sprite: every enemy with this key reuses the same Surface
+        self.original_image = self.asset_manager.get_sprite(self.sprite_asset_key, default_size, fallback_factory=self._create_fallback_sprite)
+        if self.original_image is None:
+            logger.warning(f"Enemy: Sprite for key '{self.sprite_asset_key}' unavailable. Using fallback.")
+            self.original_image = self._create_fallback_sprite(default_size)
 
-        self.image = self.original_image.copy() 
+        self.image = self.original_image
         self.rect = self.image.get_rect(center=(int(self.x), int(self.y)))
         
         self.collision_rect_width = self.rect.width * 0.8
@@ -169,6 +160,17 @@ class Enemy(pygame.sprite.Sprite):
         self.collision_rect = pygame.Rect(0, 0, self.collision_rect_width, self.collision_rect_height)
         self.collision_rect.center = self.rect.center
 
+    @staticmethod
+    def _create_fallback_sprite(size):
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill(ENEMY_COLOR)
+        return surface
+
+    def _get_rotated_image(self):
+        """Looks up the pre-rotated frame for the current heading instead of rotating per frame."""
+        frame = self.asset_manager.get_rotated_sprite(self.sprite_asset_key, self.sprite_size, -self.angle)
+        return frame if frame is not None else pygame.transform.rotate(self.original_image, -self.angle)
+
     def update(self, primary_target_pos_pixels, maze, current_time_ms, game_area_x_offset=0, is_defense_mode=False):
         # (Update logic remains the same, as asset loading is done in __init__)
         if not self.alive:
@@ -183,7 +185,7 @@ class Enemy(pygame.sprite.Sprite):
         self._update_ai_with_astar(actual_target_for_pathfinding_pixels, maze, current_time_ms, game_area_x_offset)
         self._update_movement_along_path(maze, game_area_x_offset) 
 
-        self.image = pygame.transform.rotate(self.original_image, -self.angle)
+        self.image = self._get_rotated_image()
         self.rect = self.image.get_rect(center=(int(self.x), int(self.y))) 
         if self.collision_rect: self.collision_rect.center = self.rect.center
 
@@ -276,8 +278,8 @@ class Enemy(pygame.sprite.Sprite):
 
         if self.rect:
             half_width = self.rect.width / 2; half_height = self.rect.height / 2
-            min_x_bound = game_area_x_offset + half_width; max_x_bound = WIDTH - half_width
-            min_y_bound = half_height; max_y_bound = GAME_PLAY_AREA_HEIGHT - half_height
+            min_x_bound = game_area_x_offset + half_width; max_x_bound = WORLD_WIDTH - half_width
+            min_y_bound = half_height; max_y_bound = WORLD_HEIGHT - half_height
             self.x = max(min_x_bound, min(self.x, max_x_bound))
             self.y = max(min_y_bound, min(self.y, max_y_bound))
             self.rect.center = (int(self.x), int(self.y))
@@ -305,9 +307,7 @@ class Enemy(pygame.sprite.Sprite):
         
         # Play sound using the sound key and AssetManager
         if self.shoot_sound_key and self.asset_manager:
-            shoot_sound = self.asset_manager.get_sound(self.shoot_sound_key)
-            if shoot_sound:
-                shoot_sound.play()
+            self.asset_manager.play_sound(self.shoot_sound_key)
 
     def take_damage(self, amount):
         # (No change to this method's logic)
@@ -317,28 +317,42 @@ class Enemy(pygame.sprite.Sprite):
             self.health = 0
             self.alive = False
 
-    def draw(self, surface):
-        """Draws the enemy and its bullets."""
-        if self.alive and self.image and self.rect:
-            surface.blit(self.image, self.rect)
-        self.bullets.draw(surface)
+    def draw(self, surface, camera=None):
+        """Draws the enemy and its bullets. With a camera the enemy is skipped when out of view."""
+        if self.alive and self.image and self.rect and (not camera or camera.is_visible(self.rect)):
+            surface.blit(self.image, camera.apply(self.rect) if camera else self.rect)
+        if camera: camera.draw_group(surface, self.bullets)
+        else: self.bullets.draw(surface)
+
+    def submit_draw(self, render_queue, camera):
+        """Queues the enemy and its bullets on the render queue and its health bar on the overlay, skipping an enemy out of view."""
+        if self.alive and self.image and self.rect and camera.is_visible(self.rect):
+            render_queue.submit(render_queue.LAYER_UNITS, self.image, camera.apply(self.rect))
+            render_queue.submit_health_bar(*self.get_health_bar(camera))
+        render_queue.submit_sprites(render_queue.LAYER_PROJECTILES, self.bullets, camera)
+
+    def get_health_bar(self, camera=None):
+        """(bar rect, filled width, fill color, background color) for the bar above the enemy, or None when dead."""
+        if not (self.alive and self.rect): return None
+        view_rect = camera.apply(self.rect) if camera else self.rect
+        bar_width = view_rect.width * 0.8
+        bar_height = 5
+        bar_x = view_rect.centerx - bar_width / 2
+        bar_y = view_rect.top - bar_height - 2
+        
+        health_percentage = self.health / self.max_health if self.max_health > 0 else 0
+        fill_color = GREEN if health_percentage > 0.6 else YELLOW if health_percentage > 0.3 else RED
+        return (bar_x, bar_y, bar_width, bar_height), int(bar_width * health_percentage), fill_color, (80,0,0)
 
-    def _draw_health_bar(self, surface):
+    def _draw_health_bar(self, surface, camera=None):
         """Draws the enemy's health bar above it."""
-        if self.alive and self.rect:
-            bar_width = self.rect.width * 0.8
-            bar_height = 5
-            bar_x = self.rect.centerx - bar_width / 2
-            bar_y = self.rect.top - bar_height - 2
-            
-            health_percentage = self.health / self.max_health if self.max_health > 0 else 0
-            filled_width = bar_width * health_percentage
-            
-            pygame.draw.rect(surface, (80,0,0), (bar_x, bar_y, bar_width, bar_height)) 
+        health_bar = self.get_health_bar(camera)
+        if health_bar:
+            bar_rect, filled_width, fill_color, background_color = health_bar
+            pygame.draw.rect(surface, background_color, bar_rect) 
             if filled_width > 0:
-                fill_color = GREEN if health_percentage > 0.6 else YELLOW if health_percentage > 0.3 else RED
-                pygame.draw.rect(surface, fill_color, (bar_x, bar_y, int(filled_width), bar_height)) 
-            pygame.draw.rect(surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 1) 
+                pygame.draw.rect(surface, fill_color, (bar_rect[0], bar_rect[1], filled_width, bar_rect[3])) 
+            pygame.draw.rect(surface, WHITE, bar_rect, 1) 
 
 
 class SentinelDrone(Enemy): 
@@ -355,26 +369,14 @@ class SentinelDrone(Enemy):
     def _load_sprite(self): 
         """Overrides the parent _load_sprite to potentially use a different size or fallback."""
         default_size = (int(TILE_SIZE * 0.6), int(TILE_SIZE * 0.6)) 
+        self.sprite_size = default_size
         
-        loaded_image = self.asset_manager.get_image(self.sprite_asset_key)
-
-        if loaded_image:
-            try:
-                self.original_image = pygame.transform.smoothscale(loaded_image, default_size)
-            except (ValueError, pygame.error) as e:
-                logger.error(f"SentinelDrone: Error scaling sprite for key '{self.sprite_asset_key}': {e}. Using fallback.")
-                self.original_image = None
-        else:
-            logger.warning(f"SentinelDrone: Sprite for key '{self.sprite_asset_key}' not found in AssetManager.")
-            self.original_image = None
-
+        self.original_image = self.asset_manager.get_sprite(self.sprite_asset_key, default_size, fallback_factory=self._create_fallback_sprite)
         if self.original_image is None:
-            self.original_image = pygame.Surface(default_size, pygame.SRCALPHA)
-            points = [(default_size[0] // 2, 0), (default_size[0], default_size[1] // 2), (default_size[0] // 2, default_size[1]), (0, default_size[1] // 2)]
-            pygame.draw.polygon(self.original_image, gs.get_game_setting("DARK_PURPLE",(70,0,100)), points) 
-            pygame.draw.polygon(self.original_image, WHITE, points, 1)
+            logger.warning(f"SentinelDrone: Sprite for key '{self.sprite_asset_key}' unavailable. Using fallback.")
+            self.original_image = self._create_fallback_sprite(default_size)
 
-        self.image = self.original_image.copy()
+        self.image = self.original_image
         self.rect = self.image.get_rect(center=(int(self.x), int(self.y))) 
         if self.rect: 
             self.collision_rect_width = self.rect.width * 0.8
@@ -384,6 +386,14 @@ class SentinelDrone(Enemy):
         else:
             self.collision_rect = pygame.Rect(self.x - default_size[0]*0.4, self.y - default_size[1]*0.4, default_size[0]*0.8, default_size[1]*0.8)
 
+    @staticmethod
+    def _create_fallback_sprite(size):
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        points = [(size[0] // 2, 0), (size[0], size[1] // 2), (size[0] // 2, size[1]), (0, size[1] // 2)]
+        pygame.draw.polygon(surface, gs.get_game_setting("DARK_PURPLE",(70,0,100)), points) 
+        pygame.draw.polygon(surface, WHITE, points, 1)
+        return surface
+
 
     def update(self, primary_target_pos_pixels, maze, current_time_ms, game_area_x_offset=0, is_defense_mode=False):
         # SentinelDrone can have its own unique update logic in the future.
@@ -62,6 +62,6 @@ class EscapeZone(pygame.sprite.Sprite):
         self.pulse_time += self.pulse_speed
         self._draw_shape()
 
-    def draw(self, surface): 
-        surface.blit(self.image, self.rect)
+    def draw(self, surface, camera=None): 
+        surface.blit(self.image, camera.apply(self.rect) if camera else self.rect)
 
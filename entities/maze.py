@@ -5,7 +5,7 @@ import logging
 
 import game_settings as gs
 from game_settings import (
-    TILE_SIZE, WIDTH, MAZE_ROWS, GAME_PLAY_AREA_HEIGHT, 
+    TILE_SIZE, WIDTH, MAZE_ROWS, GAME_PLAY_AREA_HEIGHT, WORLD_WIDTH, MAZE_SIZE_SCREENS,
     BLUE, WHITE, ARCHITECT_VAULT_WALL_COLOR
 )
 
@@ -16,8 +16,8 @@ class Maze:
         self.game_area_x_offset = game_area_x_offset 
         self.maze_type = maze_type 
 
-        self.actual_maze_cols = (WIDTH - self.game_area_x_offset) // TILE_SIZE 
-        self.actual_maze_rows = MAZE_ROWS 
+        self.actual_maze_cols = (WORLD_WIDTH - self.game_area_x_offset) // TILE_SIZE 
+        self.actual_maze_rows = MAZE_ROWS * MAZE_SIZE_SCREENS 
         
         # Grid: 1 for wall, 0 for path
         self.grid = [[1 for _ in range(self.actual_maze_cols)] for _ in range(self.actual_maze_rows)] 
@@ -29,22 +29,45 @@ class Maze:
         # The 'walls' attribute is a list of line segments.
         # This is the single source of truth for both drawing and collision detection.
         self.walls = self._create_wall_lines() 
+        # Wall segments bucketed by the tile they start in; a segment reaches at most one tile right or down
+        self.walls_by_tile = {}
+        for line_segment in self.walls:
+            self.walls_by_tile.setdefault((line_segment[0][1] // TILE_SIZE, line_segment[0][0] // TILE_SIZE), []).append(line_segment)
 
     def _generate_maze_grid(self, row, col): 
         """
         Generates the maze grid using Recursive Backtracker. Modifies self.grid.
+        Runs on an explicit stack so mazes several screens large don't hit the recursion limit.
         """
-        self.grid[row][col] = 0 # Mark current cell as part of the path
-        directions = [(0, 1), (0, -1), (1, 0), (-1, 0)] 
-        random.shuffle(directions) 
+        def _visit(r, c):
+            self.grid[r][c] = 0 # Mark current cell as part of the path
+            directions = [(0, 1), (0, -1), (1, 0), (-1, 0)] 
+            random.shuffle(directions) 
+            return (r, c, iter(directions))
 
-        for dr, dc in directions: 
-            new_row, new_col = row + 2 * dr, col + 2 * dc 
-            
-            if 0 <= new_row < self.actual_maze_rows and 0 <= new_col < self.actual_maze_cols: 
-                if self.grid[new_row][new_col] == 1: 
-                    self.grid[row + dr][col + dc] = 0 
-                    self._generate_maze_grid(new_row, new_col) 
+        stack = [_visit(row, col)]
+        while stack:
+            current_row, current_col, directions = stack[-1]
+            for dr, dc in directions: 
+                new_row, new_col = current_row + 2 * dr, current_col + 2 * dc 
+                if 0 <= new_row < self.actual_maze_rows and 0 <= new_col < self.actual_maze_cols and self.grid[new_row][new_col] == 1: 
+                    self.grid[current_row + dr][current_col + dc] = 0 
+                    stack.append(_visit(new_row, new_col))
+                    break
+            else: stack.pop()
+
+    def get_world_size(self):
+        """Pixel extent of the maze including its x offset."""
+        return (self.game_area_x_offset + self.actual_maze_cols * TILE_SIZE, self.actual_maze_rows * TILE_SIZE)
+
+    def _walls_near(self, rect_rel):
+        """Wall segments that can touch rect_rel (maze-relative coordinates), from the tile buckets."""
+        first_row, last_row = rect_rel.top // TILE_SIZE - 1, (rect_rel.bottom - 1) // TILE_SIZE
+        first_col, last_col = rect_rel.left // TILE_SIZE - 1, (rect_rel.right - 1) // TILE_SIZE
+        walls_by_tile = self.walls_by_tile
+        for r in range(max(0, first_row), min(self.actual_maze_rows - 1, last_row) + 1):
+            for c in range(max(0, first_col), min(self.actual_maze_cols - 1, last_col) + 1):
+                yield from walls_by_tile.get((r, c), ())
 
     def _create_wall_lines(self):
         """
@@ -66,9 +89,10 @@ class Maze:
                         lines.append(((x1, y1), (x2, y2))) 
         return lines 
 
-    def draw(self, surface): 
+    def draw(self, surface, camera=None): 
         """
         Draws the maze walls using the pre-computed list of line segments.
+        With a camera only the walls in view are drawn, shifted into view space.
         """
         wall_color = ARCHITECT_VAULT_WALL_COLOR if self.maze_type == "architect_vault" else BLUE
         wall_thickness = 3 if self.maze_type == "architect_vault" else 2
@@ -76,11 +100,13 @@ class Maze:
         if not self.walls:
             return
 
-        for line_segment in self.walls: 
-            p1_relative, p2_relative = line_segment 
-            abs_p1 = (p1_relative[0] + self.game_area_x_offset, p1_relative[1]) 
-            abs_p2 = (p2_relative[0] + self.game_area_x_offset, p2_relative[1]) 
-            pygame.draw.line(surface, wall_color, abs_p1, abs_p2, wall_thickness) 
+        offset_x, offset_y = self.game_area_x_offset, 0
+        visible_walls = self.walls
+        if camera:
+            offset_x -= camera.view_rect.x; offset_y -= camera.view_rect.y
+            visible_walls = self._walls_near(camera.view_rect.move(-self.game_area_x_offset, 0).inflate(2 * wall_thickness, 2 * wall_thickness))
+        for p1_relative, p2_relative in visible_walls: 
+            pygame.draw.line(surface, wall_color, (p1_relative[0] + offset_x, p1_relative[1] + offset_y), (p2_relative[0] + offset_x, p2_relative[1] + offset_y), wall_thickness) 
 
     def is_wall(self, obj_center_x_abs, obj_center_y_abs, obj_width, obj_height): 
         """
@@ -94,12 +120,10 @@ class Maze:
             int(obj_height) 
         ) 
 
-        for line_segment in self.walls: 
-            p1_relative, p2_relative = line_segment 
-            abs_p1 = (p1_relative[0] + self.game_area_x_offset, p1_relative[1]) 
-            abs_p2 = (p2_relative[0] + self.game_area_x_offset, p2_relative[1]) 
-
-            if obj_rect.clipline(abs_p1, abs_p2):
+        # Only the walls bucketed around the object are tested, so the cost doesn't grow with the maze
+        obj_rect_rel = obj_rect.move(-self.game_area_x_offset, 0)
+        for p1_relative, p2_relative in self._walls_near(obj_rect_rel): 
+            if obj_rect_rel.clipline(p1_relative, p2_relative):
                 return True # Collision detected
         return False # No collision with any wall line segment
 
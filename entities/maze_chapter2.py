@@ -360,11 +360,19 @@ class MazeChapter2:
                 logger.warning(f"MazeChapter2 WARNING (id:{id(self)}): Attempted to mark non-'T' spot ({grid_r},{grid_c}) as occupied. Current value: {original_value_in_current_grid}")
         return False
 
-    def draw(self, surface):
-        for r_idx, row_data in enumerate(self.grid):
-            for c_idx, tile_type in enumerate(row_data):
-                x = c_idx * TILE_SIZE + self.game_area_x_offset
-                y = r_idx * TILE_SIZE
+    def draw(self, surface, camera=None):
+        # With a camera only the tiles in view are drawn, shifted into view space
+        offset_x, offset_y = (camera.view_rect.x, camera.view_rect.y) if camera else (0, 0)
+        first_row, last_row, first_col, last_col = 0, self.actual_maze_rows - 1, 0, self.actual_maze_cols - 1
+        if camera:
+            first_row = max(0, offset_y // TILE_SIZE); last_row = min(last_row, (camera.view_rect.bottom - 1) // TILE_SIZE)
+            first_col = max(0, (offset_x - self.game_area_x_offset) // TILE_SIZE); last_col = min(last_col, (camera.view_rect.right - 1 - self.game_area_x_offset) // TILE_SIZE)
+        for r_idx in range(first_row, last_row + 1):
+            row_data = self.grid[r_idx]
+            for c_idx in range(first_col, last_col + 1):
+                tile_type = row_data[c_idx]
+                x = c_idx * TILE_SIZE + self.game_area_x_offset - offset_x
+                y = r_idx * TILE_SIZE - offset_y
                 rect = (x, y, TILE_SIZE, TILE_SIZE)
 
                 if tile_type == 1: # Wall
@@ -393,17 +401,21 @@ class MazeChapter2:
             # Draw enemy spawn points (magenta circles)
             for r_spawn, c_spawn in self.ENEMY_SPAWN_GRID_POSITIONS: # Use the instance variable
                  abs_spawn_x, abs_spawn_y = self._grid_to_pixel_center(r_spawn, c_spawn)
-                 pygame.draw.circle(surface, (255, 0, 255), (int(abs_spawn_x), int(abs_spawn_y)), TILE_SIZE // 4)
+                 pygame.draw.circle(surface, (255, 0, 255), (int(abs_spawn_x - offset_x), int(abs_spawn_y - offset_y)), TILE_SIZE // 4)
             
             # Draw calculated paths (orange lines)
             for (spawn_r, spawn_c), path_pixel_coords in self.enemy_paths_to_core.items():
                 if path_pixel_coords and len(path_pixel_coords) > 1:
-                    pygame.draw.lines(surface, (255, 165, 0), False, path_pixel_coords, 2) 
+                    pygame.draw.lines(surface, (255, 165, 0), False, [(px - offset_x, py - offset_y) for px, py in path_pixel_coords], 2) 
 
     def toggle_debug(self):
         self.debug_mode = not self.debug_mode
         logger.info(f"MazeChapter2: Debug mode {'enabled' if self.debug_mode else 'disabled'}.")
 
+    def get_world_size(self):
+        """Pixel extent of the tilemap including its x offset."""
+        return (self.game_area_x_offset + self.actual_maze_cols * TILE_SIZE, self.actual_maze_rows * TILE_SIZE)
+
     def get_core_reactor_spawn_position_abs(self):
         return self.core_reactor_abs_spawn_pos
 
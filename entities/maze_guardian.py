@@ -6,7 +6,7 @@ import os
 
 import game_settings as gs
 from game_settings import (
-    TILE_SIZE, WIDTH, GAME_PLAY_AREA_HEIGHT,
+    TILE_SIZE, WIDTH, GAME_PLAY_AREA_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT,
     MAZE_GUARDIAN_SPRITE_PATH, MAZE_GUARDIAN_COLOR,
     MAZE_GUARDIAN_SPEED, MAZE_GUARDIAN_HEALTH,
     MAZE_GUARDIAN_LASER_COOLDOWN, MAZE_GUARDIAN_MINION_SPAWN_COOLDOWN_MS,
@@ -59,24 +59,15 @@ class MazeGuardian(BaseDrone):
 
     def _load_sprite(self):
         """Loads the boss sprite from the AssetManager."""
-        loaded_image = self.asset_manager.get_image(self.sprite_asset_key)
-        
-        if loaded_image:
-            try:
-                self.original_image = pygame.transform.smoothscale(loaded_image, self.visual_size)
-            except (ValueError, pygame.error) as e:
-                print(f"MazeGuardian: Error scaling sprite for key '{self.sprite_asset_key}': {e}")
-                self.original_image = None
-        else:
-            print(f"MazeGuardian: Sprite for key '{self.sprite_asset_key}' not found. Using fallback.")
-            self.original_image = None
+        self.original_image = self.asset_manager.get_sprite(self.sprite_asset_key, self.visual_size)
         
         if self.original_image is None: # Fallback if sprite loading failed
+            print(f"MazeGuardian: Sprite for key '{self.sprite_asset_key}' not found. Using fallback.")
             self.original_image = pygame.Surface(self.visual_size, pygame.SRCALPHA)
             self.original_image.fill(gs.get_game_setting("MAZE_GUARDIAN_COLOR", (80,0,120)))
             pygame.draw.rect(self.original_image, WHITE, self.original_image.get_rect(), 3)
         
-        self.image = self.original_image.copy()
+        self.image = self.original_image
 
 
     def _initialize_corners(self):
@@ -169,8 +160,8 @@ class MazeGuardian(BaseDrone):
                 self.x, self.y = self.target_pos; self.target_pos = None
         self.rect.center = (int(self.x), int(self.y))
         if self.collision_rect : self.collision_rect.center = self.rect.center
-        min_x = game_area_x_offset + self.rect.width / 2; max_x = WIDTH - self.rect.width / 2
-        min_y = self.rect.height / 2; max_y = GAME_PLAY_AREA_HEIGHT - self.rect.height / 2
+        min_x = game_area_x_offset + self.rect.width / 2; max_x = WORLD_WIDTH - self.rect.width / 2
+        min_y = self.rect.height / 2; max_y = WORLD_HEIGHT - self.rect.height / 2
         self.x = max(min_x, min(self.x, max_x)); self.y = max(min_y, min(self.y, max_y))
         self.rect.center = (int(self.x), int(self.y))
         if self.collision_rect: self.collision_rect.center = self.rect.center
@@ -188,22 +179,34 @@ class MazeGuardian(BaseDrone):
         # (This method remains empty)
         pass
 
-    def draw(self, surface):
+    def draw(self, surface, camera=None):
         # (This method's logic remains the same)
         if not self.image or not self.rect: return
-        surface.blit(self.image, self.rect)
+        surface.blit(self.image, camera.apply(self.rect) if camera else self.rect)
+        self._draw_corners(surface, camera)
+        if camera: camera.draw_group(surface, self.laser_beams)
+        else: self.laser_beams.draw(surface)
+
+    def submit_draw(self, render_queue, camera):
+        """Queues the guardian and its corners on the units layer and its laser beams above them."""
+        if not self.image or not self.rect: return
+        render_queue.submit(render_queue.LAYER_UNITS, self.image, camera.apply(self.rect))
+        render_queue.submit_callback(render_queue.LAYER_UNITS, lambda target: self._draw_corners(target, camera))
+        render_queue.submit_sprites(render_queue.LAYER_PROJECTILES, self.laser_beams, camera)
+
+    def _draw_corners(self, surface, camera=None):
         for corner in self.corners:
-            pygame.draw.rect(surface, corner['color'], corner['rect'])
+            corner_rect = camera.apply(corner['rect']) if camera else corner['rect']
+            pygame.draw.rect(surface, corner['color'], corner_rect)
             border_color = WHITE if corner['status'] != 'destroyed' else DARK_GREY
-            pygame.draw.rect(surface, border_color, corner['rect'], 2)
+            pygame.draw.rect(surface, border_color, corner_rect, 2)
             if corner['status'] != 'destroyed' and corner['health'] < corner['max_health']:
-                bar_width = corner['rect'].width * 0.8; bar_height = 4
-                bar_x = corner['rect'].centerx - bar_width / 2
-                bar_y = corner['rect'].top - bar_height - 2
+                bar_width = corner_rect.width * 0.8; bar_height = 4
+                bar_x = corner_rect.centerx - bar_width / 2
+                bar_y = corner_rect.top - bar_height - 2
                 health_perc = corner['health'] / corner['max_health']
                 filled_width = bar_width * health_perc
                 fill_c = RED if health_perc < 0.33 else YELLOW if health_perc < 0.66 else GREEN
                 pygame.draw.rect(surface, (50,50,50), (bar_x, bar_y, bar_width, bar_height))
                 if filled_width > 0: pygame.draw.rect(surface, fill_c, (bar_x, bar_y, filled_width, bar_height))
                 pygame.draw.rect(surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
-        self.laser_beams.draw(surface)
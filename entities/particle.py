@@ -116,6 +116,6 @@ class Particle(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(center=(int(self.x), int(self.y)))
 
 
-    def draw(self, surface): 
+    def draw(self, surface, camera=None): 
         if self.alive(): 
-            surface.blit(self.image, self.rect)
+            surface.blit(self.image, camera.apply(self.rect) if camera else self.rect)
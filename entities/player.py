@@ -157,21 +157,11 @@ class PlayerDrone(BaseDrone):
             self.collision_rect = pygame.Rect(self.x - col_size/2, self.y - col_size/2, col_size, col_size)
 
     def _load_sprite(self):
-        loaded_image = self.asset_manager.get_image(self.sprite_asset_key)
-        if loaded_image:
-            try:
-                self.original_image = pygame.transform.smoothscale(loaded_image, self.drone_visual_size)
-            except (ValueError, pygame.error) as e:
-                logger.error(f"PlayerDrone: Error scaling sprite '{self.sprite_asset_key}': {e}")
-                self.original_image = None
-        else:
-            logger.warning(f"PlayerDrone: Sprite for key '{self.sprite_asset_key}' not found in AssetManager.")
-            self.original_image = None
+        self.original_image = self.asset_manager.get_sprite(self.sprite_asset_key, self.drone_visual_size, fallback_factory=self._create_fallback_sprite)
         if self.original_image is None:
-            self.original_image = self.asset_manager._create_fallback_surface(
-                size=self.drone_visual_size, text=self.drone_id[:1], color=(0,200,0,150)
-            )
-        self.image = self.original_image.copy()
+            logger.warning(f"PlayerDrone: Sprite for key '{self.sprite_asset_key}' not found in AssetManager.")
+            self.original_image = self._create_fallback_sprite(self.drone_visual_size)
+        self.image = self.original_image
         self.rect = self.image.get_rect(center=(int(self.x), int(self.y)))
         self.drone_visual_size = self.rect.size
         self.flame_port_offset_distance = self.drone_visual_size[1] * 0.4
@@ -180,6 +170,25 @@ class PlayerDrone(BaseDrone):
         self.collision_rect = pygame.Rect(0,0, self.collision_rect_width, self.collision_rect_height)
         self.collision_rect.center = self.rect.center
 
+    def _create_fallback_sprite(self, size):
+        return self.asset_manager._create_fallback_surface(size=size, text=self.drone_id[:1], color=(0,200,0,150))
+
+    def _get_rotated_image(self, alpha=255):
+        """Looks up the shared pre-rotated (and, when cloaked, pre-faded) frame for the current angle."""
+        frame = self.asset_manager.get_rotated_sprite(self.sprite_asset_key, self.drone_visual_size, -self.angle, alpha)
+        if frame is not None: return frame
+        rotated_image = pygame.transform.rotate(self.original_image, -self.angle).convert_alpha()
+        rotated_image.set_alpha(alpha)
+        return rotated_image
+
+    def _get_shield_outline(self):
+        """Outline points of the current frame, cached per rotation frame by the AssetManager."""
+        alpha = self.phantom_cloak_alpha if self.is_cloaked_visual else 255
+        outline_points = self.asset_manager.get_rotated_outline(self.sprite_asset_key, self.drone_visual_size, -self.angle, alpha)
+        if outline_points is None: # No shared sheet for this sprite, fall back to a per-frame mask
+            outline_points = pygame.mask.from_surface(self.image).outline(1)
+        return outline_points
+
     def _update_weapon_attributes(self):
         # (This method's logic remains largely the same as it deals with game settings and internal state)
         if self.current_weapon_mode == WEAPON_MODE_BIG_SHOT:
@@ -275,9 +284,7 @@ class PlayerDrone(BaseDrone):
             current_alpha_to_set = self.phantom_cloak_alpha
         
         if self.original_image:
-            rotated_image = pygame.transform.rotate(self.original_image, -self.angle) 
-            self.image = rotated_image.convert_alpha()
-            self.image.set_alpha(current_alpha_to_set)
+            self.image = self._get_rotated_image(current_alpha_to_set)
             if self.rect:
                 self.rect = self.image.get_rect(center=(int(self.x), int(self.y)))
                 if self.collision_rect:
@@ -358,8 +365,7 @@ class PlayerDrone(BaseDrone):
         if self.current_weapon_mode not in [WEAPON_MODE_HEATSEEKER, WEAPON_MODE_LIGHTNING]: # Exclude missile/lightning only modes
             if can_shoot_primary:
                 if sound_asset_key and self.asset_manager: 
-                    sound = self.asset_manager.get_sound(sound_asset_key)
-                    if sound: sound.play()
+                    self.asset_manager.play_sound(sound_asset_key)
                 self.last_shot_time = current_time_ms
                 angles_to_fire = [0] 
                 if self.current_weapon_mode == WEAPON_MODE_TRI_SHOT or self.current_weapon_mode == WEAPON_MODE_RAPID_TRI:
@@ -388,8 +394,7 @@ class PlayerDrone(BaseDrone):
         if self.current_weapon_mode == WEAPON_MODE_HEATSEEKER or self.current_weapon_mode == WEAPON_MODE_HEATSEEKER_PLUS_BULLETS:
             if can_shoot_missile:
                 if missile_sound_asset_key and self.asset_manager: 
-                    sound = self.asset_manager.get_sound(missile_sound_asset_key)
-                    if sound: sound.play()
+                    self.asset_manager.play_sound(missile_sound_asset_key)
                 self.last_missile_shot_time = current_time_ms
                 missile_dmg = get_game_setting("MISSILE_DAMAGE") * self.bullet_damage_multiplier
                 # Missile constructor may need asset_manager if it uses a sprite
@@ -399,8 +404,7 @@ class PlayerDrone(BaseDrone):
             # Extra bullets for WEAPON_MODE_HEATSEEKER_PLUS_BULLETS
             if self.current_weapon_mode == WEAPON_MODE_HEATSEEKER_PLUS_BULLETS and can_shoot_primary:
                 if sound_asset_key and self.asset_manager: 
-                    sound = self.asset_manager.get_sound(sound_asset_key)
-                    if sound: sound.play()
+                    self.asset_manager.play_sound(sound_asset_key)
                 self.last_shot_time = current_time_ms # Separate cooldown for bullets
                 std_bullet_size = get_game_setting("PLAYER_DEFAULT_BULLET_SIZE")
                 std_bullet_speed = get_game_setting("PLAYER_BULLET_SPEED")
@@ -417,8 +421,7 @@ class PlayerDrone(BaseDrone):
             if can_shoot_lightning:
                 # Assuming lightning sound is same as primary shoot sound for now
                 if sound_asset_key and self.asset_manager: 
-                    sound = self.asset_manager.get_sound(sound_asset_key)
-                    if sound: sound.play()
+                    self.asset_manager.play_sound(sound_asset_key)
                 self.last_lightning_time = current_time_ms
                 
                 closest_enemy_for_zap = None
@@ -460,14 +463,12 @@ class PlayerDrone(BaseDrone):
         
         if self.shield_active: # Shield absorbs damage
             if sound_key_on_hit and self.asset_manager: 
-                 sound = self.asset_manager.get_sound(sound_key_on_hit)
-                 if sound: sound.play() 
+                 self.asset_manager.play_sound(sound_key_on_hit)
             return # No damage taken
 
         self.health -= effective_amount
         if sound_key_on_hit and self.asset_manager:
-            sound = self.asset_manager.get_sound(sound_key_on_hit)
-            if sound: sound.play()
+            self.asset_manager.play_sound(sound_key_on_hit)
         
         if self.health <= 0:
             self.health = 0
@@ -579,7 +580,7 @@ class PlayerDrone(BaseDrone):
             self._load_sprite()
         else:
             if self.original_image:
-                self.image = pygame.transform.rotate(self.original_image, -self.angle)
+                self.image = self._get_rotated_image()
                 if self.rect: self.rect = self.image.get_rect(center=(int(self.x), int(self.y)))
         
         if self.image and not self.rect:
@@ -625,70 +626,93 @@ class PlayerDrone(BaseDrone):
         # (This method's logic remains the same)
         return (self.x, self.y)
 
-    def draw(self, surface):
+    def draw(self, surface, camera=None):
         # (This method's drawing logic remains largely the same, using self.image)
         if not self.alive and not self.bullets_group and not self.missiles_group and not self.lightning_zaps_group and not self.thrust_particles:
             return # Nothing to draw if dead and no lingering effects
         
-        self.thrust_particles.draw(surface) # Draw thrust particles first (behind drone)
+        # Draw thrust particles first (behind drone)
+        if camera: camera.draw_group(surface, self.thrust_particles)
+        else: self.thrust_particles.draw(surface)
+        view_rect = camera.apply(self.rect) if camera else self.rect
         
         if self.alive and self.image and self.original_image: # Ensure images are loaded  
-            surface.blit(self.image, self.rect) # self.image is the rotated, alpha-set version
+            surface.blit(self.image, view_rect) # self.image is the rotated, alpha-set version
             
             # Shield visual effect
-            if self.shield_active:
-                current_time = pygame.time.get_ticks()
-                # Sinusoidal pulse for shield alpha and size
-                pulse_factor = (math.sin(current_time * 0.012 + self.shield_glow_pulse_time_offset) + 1) / 2 # Ranges 0 to 1
-                shield_alpha = int(180 + pulse_factor * 75) # Pulse alpha between 180 and 255
-                shield_color_tuple = POWERUP_TYPES.get("shield", {}).get("color", LIGHT_BLUE) # Get base color
-                final_shield_color = (*shield_color_tuple[:3], shield_alpha) # Apply alpha
-                
-                # Draw shield outline using mask (more precise than just drawing a circle around rect)
-                try:
-                    if self.image.get_width() > 0 and self.image.get_height() > 0: # Ensure image has dimensions
-                        drone_mask = pygame.mask.from_surface(self.image) # Use current image (could be cloaked)
-                        outline_points = drone_mask.outline(1) # Get outline points of the drone sprite
-                        if outline_points:
-                            # Translate outline points to screen coordinates
-                            screen_outline_points = [(p[0] + self.rect.left, p[1] + self.rect.top) for p in outline_points]
-                            line_thickness = int(2 + pulse_factor * 2) # Pulse line thickness
-                            pygame.draw.polygon(surface, final_shield_color, screen_outline_points, line_thickness)
-                except pygame.error as e: # Catch potential errors from mask creation or drawing
-                    # logger.warning(f"PlayerDrone: Error drawing shield effect: {e}")
-                    # Fallback: draw a simple circle if mask fails
-                    shield_radius = max(self.rect.width, self.rect.height) / 2 * 1.1 # Slightly larger than drone
-                    pygame.draw.circle(surface, final_shield_color, self.rect.center, int(shield_radius), 3)
+            if self.shield_active: self._draw_shield(surface, view_rect)
         
         # Draw projectiles
-        self.bullets_group.draw(surface)
-        self.missiles_group.draw(surface)
+        if camera: camera.draw_group(surface, self.bullets_group); camera.draw_group(surface, self.missiles_group)
+        else: self.bullets_group.draw(surface); self.missiles_group.draw(surface)
         
         if self.lightning_zaps_group:
             for zap in list(self.lightning_zaps_group): # Iterate over a copy if zaps can be removed during draw
                 if hasattr(zap, 'draw') and callable(getattr(zap, 'draw')):
                     if hasattr(zap, 'alive') and zap.alive: # Only draw if zap is alive
-                        zap.draw(surface) # LightningZap has its own complex draw method
+                        zap.draw(surface, camera) # LightningZap has its own complex draw method
             
         # Draw health bar only if alive
         if self.alive:
-            self.draw_health_bar(surface)
+            self.draw_health_bar(surface, camera)
 
-    def draw_health_bar(self, surface):
-        # (This method's logic remains the same)
-        if not self.alive or not self.rect: return 
+    def _draw_shield(self, surface, view_rect):
+        current_time = pygame.time.get_ticks()
+        # Sinusoidal pulse for shield alpha and size
+        pulse_factor = (math.sin(current_time * 0.012 + self.shield_glow_pulse_time_offset) + 1) / 2 # Ranges 0 to 1
+        shield_alpha = int(180 + pulse_factor * 75) # Pulse alpha between 180 and 255
+        shield_color_tuple = POWERUP_TYPES.get("shield", {}).get("color", LIGHT_BLUE) # Get base color
+        final_shield_color = (*shield_color_tuple[:3], shield_alpha) # Apply alpha
         
-        bar_width = self.rect.width * 0.8; bar_height = 5
-        bar_x = self.rect.centerx - bar_width / 2; bar_y = self.rect.top - bar_height - 3 # Position above drone
+        # Draw shield outline using mask (more precise than just drawing a circle around rect)
+        try:
+            if self.image.get_width() > 0 and self.image.get_height() > 0: # Ensure image has dimensions
+                outline_points = self._get_shield_outline() # Cached per rotation frame (could be cloaked)
+                if outline_points:
+                    # Translate outline points to screen coordinates
+                    screen_outline_points = [(p[0] + view_rect.left, p[1] + view_rect.top) for p in outline_points]
+                    line_thickness = int(2 + pulse_factor * 2) # Pulse line thickness
+                    pygame.draw.polygon(surface, final_shield_color, screen_outline_points, line_thickness)
+        except pygame.error as e: # Catch potential errors from mask creation or drawing
+            # logger.warning(f"PlayerDrone: Error drawing shield effect: {e}")
+            # Fallback: draw a simple circle if mask fails
+            shield_radius = max(self.rect.width, self.rect.height) / 2 * 1.1 # Slightly larger than drone
+            pygame.draw.circle(surface, final_shield_color, view_rect.center, int(shield_radius), 3)
+
+    def submit_draw(self, render_queue, camera):
+        """Queues the drone, its thrust, shield and projectiles on the render queue, and its health bar on the overlay."""
+        render_queue.submit_sprites(render_queue.LAYER_UNITS, self.thrust_particles, camera) # Behind the drone
+        view_rect = camera.apply(self.rect)
+        if self.alive and self.image and self.original_image:
+            render_queue.submit(render_queue.LAYER_UNITS, self.image, view_rect)
+            if self.shield_active: render_queue.submit_callback(render_queue.LAYER_UNITS, lambda target: self._draw_shield(target, view_rect))
+        render_queue.submit_sprites(render_queue.LAYER_PROJECTILES, self.bullets_group, camera)
+        render_queue.submit_sprites(render_queue.LAYER_PROJECTILES, self.missiles_group, camera)
+        for zap in self.lightning_zaps_group:
+            if getattr(zap, 'alive', False): render_queue.submit_callback(render_queue.LAYER_PROJECTILES, lambda target, zap=zap: zap.draw(target, camera))
+        health_bar = self.get_health_bar(camera)
+        if health_bar: render_queue.submit_health_bar(*health_bar)
+
+    def get_health_bar(self, camera=None):
+        """(bar rect, filled width, fill color, background color) for the bar above the drone, or None when dead."""
+        if not self.alive or not self.rect: return None
+        view_rect = camera.apply(self.rect) if camera else self.rect
+        
+        bar_width = view_rect.width * 0.8; bar_height = 5
+        bar_x = view_rect.centerx - bar_width / 2; bar_y = view_rect.top - bar_height - 3 # Position above drone
         
         health_percentage = max(0, self.health / self.max_health) if self.max_health > 0 else 0
-        filled_width = bar_width * health_percentage
-        
-        pygame.draw.rect(surface, (80,0,0) if health_percentage < 0.3 else (50,50,50), (bar_x, bar_y, bar_width, bar_height)) # Background
         
         fill_color = RED
         if health_percentage >= 0.6: fill_color = GREEN
         elif health_percentage >= 0.3: fill_color = YELLOW
         
-        if filled_width > 0: pygame.draw.rect(surface, fill_color, (bar_x, bar_y, filled_width, bar_height)) # Filled portion
-        pygame.draw.rect(surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 1) # Border
+        return (bar_x, bar_y, bar_width, bar_height), bar_width * health_percentage, fill_color, (80,0,0) if health_percentage < 0.3 else (50,50,50)
+
+    def draw_health_bar(self, surface, camera=None):
+        health_bar = self.get_health_bar(camera)
+        if not health_bar: return
+        bar_rect, filled_width, fill_color, background_color = health_bar
+        pygame.draw.rect(surface, background_color, bar_rect) # Background
+        if filled_width > 0: pygame.draw.rect(surface, fill_color, (bar_rect[0], bar_rect[1], filled_width, bar_rect[3])) # Filled portion
+        pygame.draw.rect(surface, WHITE, bar_rect, 1) # Border
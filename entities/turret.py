@@ -28,8 +28,8 @@ except ImportError:
             super().__init__(); self.image = pygame.Surface([max(1,size*2), max(1,size*2)], pygame.SRCALPHA); self.image.fill(color if color else (255,0,0))
             self.rect = self.image.get_rect(center=(x,y)); self.alive = True; self.lifetime = lifetime; self.damage = damage
         def update(self, maze, offset): self.lifetime -=1; _=maze; _=offset
-        def draw(self, surface):
-            if self.alive and self.rect and self.image: surface.blit(self.image, self.rect)
+        def draw(self, surface, camera=None):
+            if self.alive and self.rect and self.image: surface.blit(self.image, camera.apply(self.rect) if camera else self.rect)
 
     class Missile(Bullet): pass
     class LightningZap(Bullet):
@@ -37,8 +37,8 @@ except ImportError:
             x, y = player_ref.x, player_ref.y; angle = player_ref.angle
             super().__init__(x, y, angle, 0, lifetime_frames, 5, color_override if color_override else LIGHTNING_COLOR, damage)
             self.current_start_pos = (x,y); self.current_target_pos = (x + 50, y)
-        def draw(self, surface):
-             if self.alive and self.rect: pygame.draw.line(surface, self.image.get_at((0,0)), self.current_start_pos, self.current_target_pos, 2)
+        def draw(self, surface, camera=None):
+             if self.alive and self.rect: pygame.draw.line(surface, self.image.get_at((0,0)), *((camera.apply_point(self.current_start_pos), camera.apply_point(self.current_target_pos)) if camera else (self.current_start_pos, self.current_target_pos)), 2)
 
 
 logger = logging.getLogger(__name__)
@@ -68,6 +68,7 @@ class Turret(pygame.sprite.Sprite):
 
     BASE_RANGE = TILE_SIZE * 3
     SPRITE_SIZE = (int(TILE_SIZE * 0.8), int(TILE_SIZE * 0.8))
+    BASE_COLOR_FALLBACK = (100, 100, 120) # Procedural body colour when the sprite is unavailable
 
     def __init__(self, x, y, game_controller_ref, asset_manager):
         super().__init__()
@@ -105,7 +106,6 @@ class Turret(pygame.sprite.Sprite):
         self.missiles = pygame.sprite.Group()
         self.lightning_zaps = pygame.sprite.Group()
 
-        self.turret_base_color_fallback = (100, 100, 120)
         self._ensure_drawable_state()
 
     def _ensure_drawable_state(self):
@@ -132,29 +132,24 @@ class Turret(pygame.sprite.Sprite):
         """Loads the turret sprite from the AssetManager based on the current weapon mode."""
         asset_key = TURRET_ASSET_KEYS.get(self.current_weapon_mode, TURRET_ASSET_KEYS[WEAPON_MODE_DEFAULT])
         
-        # Get the pre-loaded image from the asset manager
-        loaded_image = self.asset_manager.get_image(asset_key)
-
-        if loaded_image:
-            try:
-                # Scale the loaded image to the correct sprite size for the turret
-                self.original_image = pygame.transform.smoothscale(loaded_image, self.SPRITE_SIZE)
-            except (ValueError, pygame.error) as e:
-                logger.error(f"Turret: Error scaling sprite for key '{asset_key}': {e}. Using fallback.")
-                self.original_image = None
-        else:
-            logger.warning(f"Turret: Sprite for key '{asset_key}' not found in AssetManager.")
-            self.original_image = None
-
-        # Fallback procedural sprite if image loading failed
+        # Shared, pre-scaled sprite from the asset manager; upgrades only swap the reference
+        self.sprite_asset_key = asset_key
+        self.original_image = self.asset_manager.get_sprite(asset_key, self.SPRITE_SIZE, fallback_factory=self._create_fallback_sprite)
         if self.original_image is None:
-            self.original_image = pygame.Surface(self.SPRITE_SIZE, pygame.SRCALPHA)
-            pygame.draw.rect(self.original_image, self.turret_base_color_fallback, self.original_image.get_rect(), border_radius=3)
-            barrel_rect = pygame.Rect(self.SPRITE_SIZE[0] * 0.4, self.SPRITE_SIZE[1] * 0.7, self.SPRITE_SIZE[0] * 0.2, self.SPRITE_SIZE[1] * 0.3)
-            pygame.draw.rect(self.original_image, (50,50,50), barrel_rect)
+            logger.warning(f"Turret: Sprite for key '{asset_key}' unavailable. Using fallback.")
+            self.original_image = self._create_fallback_sprite(self.SPRITE_SIZE)
         
         self._draw_turret() # Update self.image with the newly loaded original
 
+    @classmethod
+    def _create_fallback_sprite(cls, size):
+        """Fallback procedural sprite if image loading failed."""
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, cls.BASE_COLOR_FALLBACK, surface.get_rect(), border_radius=3)
+        barrel_rect = pygame.Rect(size[0] * 0.4, size[1] * 0.7, size[0] * 0.2, size[1] * 0.3)
+        pygame.draw.rect(surface, (50,50,50), barrel_rect)
+        return surface
+
     def _update_weapon_attributes(self):
         """Recalculates turret stats based on upgrade level and weapon mode."""
         self.current_weapon_mode = WEAPON_MODES_SEQUENCE[self.weapon_mode_index]
@@ -184,14 +179,15 @@ class Turret(pygame.sprite.Sprite):
         self._load_sprite_for_weapon_mode()
 
     def _draw_turret(self):
-        """Rotates the original sprite to create the current image."""
+        """Picks the pre-rotated frame of the current sprite for the turret's angle."""
         if not self.original_image:
              # This fallback should ideally not be needed if _load_sprite_for_weapon_mode works
              self.original_image = pygame.Surface(self.SPRITE_SIZE, pygame.SRCALPHA)
-             self.original_image.fill(self.turret_base_color_fallback)
+             self.original_image.fill(self.BASE_COLOR_FALLBACK)
         
         current_center = self.rect.center if self.rect else (int(self.x), int(self.y))
-        self.image = pygame.transform.rotate(self.original_image, -self.angle)
+        frame = self.asset_manager.get_rotated_sprite(self.sprite_asset_key, self.SPRITE_SIZE, -self.angle) if getattr(self, 'sprite_asset_key', None) else None
+        self.image = frame if frame is not None else pygame.transform.rotate(self.original_image, -self.angle)
         self.rect = self.image.get_rect(center=current_center)
 
     def find_target(self, enemies_group):
@@ -296,28 +292,47 @@ class Turret(pygame.sprite.Sprite):
         self.missiles.update(enemies_group, maze_ref, game_area_x_offset)
         self.lightning_zaps.update(pygame.time.get_ticks())
 
-    def draw(self, surface):
+    def draw(self, surface, camera=None):
         # (No change to this method's logic)
+        view_rect = camera.apply(self.rect) if camera and self.rect else self.rect
         if self.image and self.rect:
-            surface.blit(self.image, self.rect)
+            surface.blit(self.image, view_rect)
         else:
              fallback_rect = self.rect if self.rect else pygame.Rect(int(self.x - self.SPRITE_SIZE[0]//2), int(self.y - self.SPRITE_SIZE[1]//2), self.SPRITE_SIZE[0], self.SPRITE_SIZE[1])
-             pygame.draw.rect(surface, gs.ORANGE, fallback_rect, 3)
+             pygame.draw.rect(surface, gs.ORANGE, camera.apply(fallback_rect) if camera else fallback_rect, 3)
              if not self.image: logger.warning(f"Turret ID {id(self)} DRAWING FALLBACK (Orange Rect) because self.image is None.")
              if not self.rect: logger.warning(f"Turret ID {id(self)} DRAWING FALLBACK (Orange Rect) because self.rect is None.")
 
         if self.show_range_indicator and self.rect:
-            range_color = (0,100,255, 70)
-            temp_range_surface = pygame.Surface((int(self.current_range * 2), int(self.current_range * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(temp_range_surface, range_color, (int(self.current_range), int(self.current_range)), int(self.current_range))
-            surface.blit(temp_range_surface, (self.rect.centerx - self.current_range, self.rect.centery - self.current_range))
+            surface.blit(self._get_range_indicator_surface(), (view_rect.centerx - self.current_range, view_rect.centery - self.current_range))
 
-        if self.bullets and len(self.bullets) > 0: self.bullets.draw(surface)
-        if self.missiles and len(self.missiles) > 0: self.missiles.draw(surface)
+        for projectile_group in (self.bullets, self.missiles):
+            if projectile_group and len(projectile_group) > 0:
+                if camera: camera.draw_group(surface, projectile_group)
+                else: projectile_group.draw(surface)
         if self.lightning_zaps and len(self.lightning_zaps) > 0:
             for zap in self.lightning_zaps:
                 if hasattr(zap, 'draw') and callable(getattr(zap, 'draw')):
-                     zap.draw(surface)
+                     zap.draw(surface, camera)
+
+    def _get_range_indicator_surface(self):
+        range_color = (0,100,255, 70)
+        temp_range_surface = pygame.Surface((int(self.current_range * 2), int(self.current_range * 2)), pygame.SRCALPHA)
+        pygame.draw.circle(temp_range_surface, range_color, (int(self.current_range), int(self.current_range)), int(self.current_range))
+        return temp_range_surface
+
+    def submit_draw(self, render_queue, camera):
+        """Queues the turret and its range indicator on the structures layer and its projectiles above the units."""
+        if self.image and self.rect:
+            view_rect = camera.apply(self.rect)
+            render_queue.submit(render_queue.LAYER_STRUCTURES, self.image, view_rect)
+            if self.show_range_indicator:
+                render_queue.submit(render_queue.LAYER_STRUCTURES, self._get_range_indicator_surface(), (view_rect.centerx - self.current_range, view_rect.centery - self.current_range))
+        else: render_queue.submit_callback(render_queue.LAYER_STRUCTURES, lambda target: self.draw(target, camera)) # Fallback outline, logged by draw()
+        render_queue.submit_sprites(render_queue.LAYER_PROJECTILES, self.bullets, camera)
+        render_queue.submit_sprites(render_queue.LAYER_PROJECTILES, self.missiles, camera)
+        for zap in self.lightning_zaps:
+            render_queue.submit_callback(render_queue.LAYER_PROJECTILES, lambda target, zap=zap: zap.draw(target, camera))
 
     def take_damage(self, amount):
         # Turrets are currently invulnerable
@@ -3,24 +3,89 @@ import pygame
 # ==========================
 # General Display Settings
 # ==========================
-WIDTH = 1920
-HEIGHT = 1080
+RENDER_SCALE = 1.0 # Internal render resolution as a fraction of the 1920x1080 layout (e.g. 0.5, 0.66), upscaled on present. Fixed at import, not a runtime setting
+
+def scaled_px(value, as_int=False):
+    """Scales a pixel quantity (size, distance or per-tick speed) authored for the 1920x1080 layout to the internal render resolution."""
+    if RENDER_SCALE == 1.0: return value
+    return max(1, round(value * RENDER_SCALE)) if as_int else value * RENDER_SCALE
+
+def quantize_angle(rotation_deg, frame_count):
+    """Maps an angle in degrees to the nearest of frame_count evenly spaced frame indices (pre-rotated sprite sheets)."""
+    return int(round((rotation_deg % 360.0) * frame_count / 360.0)) % frame_count
+
+WIDTH = scaled_px(1920, as_int=True)
+HEIGHT = scaled_px(1080, as_int=True)
 FPS = 60
 FULLSCREEN_MODE = True 
 MUSIC_VOLUME_MULTIPLIER = 0.5 
 SFX_VOLUME_MULTIPLIER = 0.7   
 
+# ==========================
+# Rendering & Performance Settings
+# ==========================
+ROTATION_FRAME_COUNT = 64 # Quantized angles per pre-rotated sprite sheet
+COLLECTIBLE_PULSE_FRAMES = 16 # Pre-baked pulse phases per collectible look
+COLLECTIBLE_ICON_FRAMES = 24 # Pre-baked icon angles per spinning collectible look
+TEXT_CACHE_MAX_BYTES = 8 * 1024 * 1024 # Pixel budget for cached UI text surfaces
+MENU_STAR_COUNT = 200 # Stars in the scrolling menu starfield
+MENU_STAR_LAYERS = 1 # Parallax depths the menu stars are spread over
+DIRTY_RECT_PRESENTATION = True # Present only the changed screen areas on static scenes
+DIRTY_RECT_FULL_FLIP_RATIO = 0.5 # Full flip once the changed areas cover this fraction of the screen
+FRAME_STATS_WINDOW = 120 # Frames averaged by the frame profiler
+FRAME_STATS_LOG_INTERVAL_MS = 0 # Log frame profiler stats this often (0 disables)
+IDLE_THROTTLE_ENABLED = True # Slow the main loop down on static scenes and idle menus
+IDLE_FPS = 20 # Frame rate for animated menus and pause after IDLE_INPUT_TIMEOUT_MS without input
+IDLE_INPUT_TIMEOUT_MS = 10000 # Time without input before a menu or pause counts as idle
+IDLE_STATIC_WAIT_MS = 250 # Longest event wait between frames on a scene that presented nothing
+SIMULATION_TICK_RATE = 60 # Fixed simulation ticks per second; per-tick speeds and lifetimes are tuned for 60
+SIMULATION_MAX_TICKS_PER_FRAME = 5 # Catch-up cap, further backlog is dropped
+SPRITE_INTERPOLATION = True # Draw moving sprites between their last two simulated positions
+CAMERA_CULL_MARGIN = scaled_px(64, as_int=True) # Pixels kept around the view when culling, for effects drawn outside sprite rects
+LIGHTNING_TEMPLATE_POOL_SIZE = 16 # Pre-generated bolt shapes that lightning zaps pick from each frame
+ASSET_PRELOAD_ALL = False # Decode every image and sound at startup instead of per scene on demand
+ASYNC_ASSET_LOADING = True # Decode scene assets on a background thread behind a loading screen
+ASSET_CONVERT_BUDGET_MS = 4 # Main-thread time per tick spent converting background-loaded images
+ASSET_DISK_CACHE = True # Keep decoded and scaled images as raw pixels on disk for fast warm starts
+ASSET_CACHE_DIR = ".asset_cache" # Relative to the project root; safe to delete, entries rebuild on demand
+ASSET_MANIFEST_PATH = "data/asset_manifest.json" # Every asset with its size, format, hash and scenes (check with tools/validate_assets.py)
+TEXTURE_ATLAS_ENABLED = True # Pack the manifest's small original images into shared atlas pages, handed out as subsurfaces
+ATLAS_PAGE_SIZE = 512 # Side of each square atlas page in pixels
+ATLAS_MAX_IMAGE_SIZE = 128 # Images larger than this on either side keep their own surface
+ASSET_MEMORY_BUDGET_MB = 256 # Decoded images and sounds beyond this are evicted least-recently-used (current scene's are pinned)
+AUDIO_CHANNEL_GROUPS = {"ui": 2, "player": 4, "enemy": 6, "explosion": 4, "world": 4} # Reserved mixer channels per sound group
+# Per-sound playback: channel group, priority (higher steals lower), max simultaneous copies, min ms between starts
+SOUND_PLAYBACK_RULES = {
+    "ui_select": {"group": "ui", "priority": 3, "max_voices": 1}, "ui_confirm": {"group": "ui", "priority": 3, "max_voices": 1},
+    "ui_denied": {"group": "ui", "priority": 3, "max_voices": 1, "min_interval_ms": 100},
+    "shoot": {"group": "player", "priority": 2, "max_voices": 2, "min_interval_ms": 40}, "missile_launch": {"group": "player", "priority": 2, "max_voices": 2, "min_interval_ms": 60},
+    "crash": {"group": "player", "priority": 3, "max_voices": 1, "min_interval_ms": 120}, "cloak_activate": {"group": "player", "priority": 3, "max_voices": 1},
+    "enemy_shoot": {"group": "enemy", "priority": 1, "max_voices": 3, "min_interval_ms": 50},
+    "prototype_drone_explode": {"group": "explosion", "priority": 2, "max_voices": 3, "min_interval_ms": 30},
+    "turret_shoot_placeholder": {"group": "enemy", "priority": 1, "max_voices": 2, "min_interval_ms": 60},
+    "reactor_hit_placeholder": {"group": "world", "priority": 3, "max_voices": 1, "min_interval_ms": 150},
+    "boss_intro": {"group": "world", "priority": 4, "max_voices": 1}, "boss_hit": {"group": "world", "priority": 3, "max_voices": 1, "min_interval_ms": 80},
+    "boss_death": {"group": "world", "priority": 4, "max_voices": 1}, "reactor_destroyed_placeholder": {"group": "world", "priority": 4, "max_voices": 1},
+    "vault_alarm": {"group": "world", "priority": 4, "max_voices": 1}, "timer_out": {"group": "world", "priority": 4, "max_voices": 1},
+    "level_up": {"group": "world", "priority": 3, "max_voices": 1}, "collect_ring": {"group": "world", "priority": 2, "max_voices": 2, "min_interval_ms": 40},
+}
+STARTUP_REPORT_PATH = "startup_report.json" # Where main.py --startup-report writes the startup timeline (unless given a path)
+STARTUP_SLOW_FILE_MS = 5.0 # Asset files taking at least this long to load are listed individually in the startup report
+
 # ==========================
 # UI & Layout Settings
 # ==========================
-BOTTOM_PANEL_HEIGHT = 120 
+BOTTOM_PANEL_HEIGHT = scaled_px(120, as_int=True) 
 GAME_PLAY_AREA_HEIGHT = HEIGHT - BOTTOM_PANEL_HEIGHT 
 
 # ==========================
 # Tile & Maze Settings
 # ==========================
-TILE_SIZE = 80            
+TILE_SIZE = scaled_px(80, as_int=True)            
 MAZE_ROWS = GAME_PLAY_AREA_HEIGHT // TILE_SIZE 
+MAZE_SIZE_SCREENS = 1 # Maze extent in screens along each axis; larger mazes scroll with the player
+WORLD_WIDTH = WIDTH * MAZE_SIZE_SCREENS
+WORLD_HEIGHT = GAME_PLAY_AREA_HEIGHT * MAZE_SIZE_SCREENS
 
 # ==========================
 # Color Definitions
@@ -55,15 +120,15 @@ ARCHITECT_VAULT_ACCENT_COLOR = GOLD
 # Player Drone Base Settings
 # ==========================
 PLAYER_MAX_HEALTH = 100
-PLAYER_SPEED = 3
+PLAYER_SPEED = scaled_px(3)
 PLAYER_LIVES = 3
 ROTATION_SPEED = 5
 PLAYER_INVINCIBILITY = False 
 
-PLAYER_DEFAULT_BULLET_SIZE = 4
+PLAYER_DEFAULT_BULLET_SIZE = scaled_px(4, as_int=True)
 PLAYER_BIG_BULLET_SIZE = PLAYER_DEFAULT_BULLET_SIZE * 3
 PLAYER_BULLET_COLOR = GOLD
-PLAYER_BULLET_SPEED = 7
+PLAYER_BULLET_SPEED = scaled_px(7)
 PLAYER_BULLET_LIFETIME = 200 
 
 PLAYER_BASE_SHOOT_COOLDOWN = 500 
@@ -75,7 +140,7 @@ PIERCING_BULLET_MAX_PIERCES = 1
 MISSILE_COLOR = MAGENTA
 MISSILE_SPEED = PLAYER_BULLET_SPEED * 0.8
 MISSILE_LIFETIME = PLAYER_BULLET_LIFETIME * 2 
-MISSILE_SIZE = 8 
+MISSILE_SIZE = scaled_px(8, as_int=True) 
 MISSILE_TURN_RATE = 8 # Increased from 4
 MISSILE_COOLDOWN = 3000 
 MISSILE_DAMAGE = 50
@@ -85,16 +150,16 @@ LIGHTNING_COLOR = ELECTRIC_BLUE
 LIGHTNING_DAMAGE = 15
 LIGHTNING_LIFETIME = 30 # In frames (0.5 seconds at 60 FPS)
 LIGHTNING_COOLDOWN = 750 
-LIGHTNING_ZAP_RANGE = 250 
-LIGHTNING_BASE_THICKNESS = 5
+LIGHTNING_ZAP_RANGE = scaled_px(250) 
+LIGHTNING_BASE_THICKNESS = scaled_px(5, as_int=True)
 LIGHTNING_CORE_THICKNESS_RATIO = 0.4
 LIGHTNING_SEGMENTS = 12
-LIGHTNING_MAX_OFFSET = 18
+LIGHTNING_MAX_OFFSET = scaled_px(18)
 LIGHTNING_CORE_OFFSET_RATIO = 0.3
 LIGHTNING_CORE_COLOR = WHITE
 LIGHTNING_BRANCH_CHANCE = 0.25
 LIGHTNING_BRANCH_MAX_SEGMENTS = 5
-LIGHTNING_BRANCH_MAX_OFFSET = 10
+LIGHTNING_BRANCH_MAX_OFFSET = scaled_px(10)
 LIGHTNING_BRANCH_THICKNESS_RATIO = 0.5
 LIGHTNING_WALL_CRAWL_MIN_TENDRILS = 1
 LIGHTNING_WALL_CRAWL_MAX_TENDRILS = 4
@@ -154,40 +219,40 @@ PHANTOM_CLOAK_ALPHA_SETTING = 70
 # ==========================
 THRUST_PARTICLE_SPREAD_ANGLE = 45 
 THRUST_PARTICLE_LIFETIME_BLAST = 25 
-THRUST_PARTICLE_START_SIZE_BLAST_MIN = 5
-THRUST_PARTICLE_START_SIZE_BLAST_MAX = 10
-THRUST_PARTICLE_SPEED_MIN_BLAST = 1.5
-THRUST_PARTICLE_SPEED_MAX_BLAST = 3.0
+THRUST_PARTICLE_START_SIZE_BLAST_MIN = scaled_px(5, as_int=True)
+THRUST_PARTICLE_START_SIZE_BLAST_MAX = scaled_px(10, as_int=True)
+THRUST_PARTICLE_SPEED_MIN_BLAST = scaled_px(1.5)
+THRUST_PARTICLE_SPEED_MAX_BLAST = scaled_px(3.0)
 THRUST_PARTICLE_SHRINK_RATE_BLAST = 0.15 
 
 # ==========================
 # Enemy Base Settings
 # ==========================
-ENEMY_SPEED = 1.5
+ENEMY_SPEED = scaled_px(1.5)
 ENEMY_HEALTH = 100
 ENEMY_COLOR = RED 
 REGULAR_ENEMY_SPRITE_PATH = "assets/images/enemies/TR-3B_enemy.png"
-ENEMY_BULLET_SPEED = 5
+ENEMY_BULLET_SPEED = scaled_px(5)
 ENEMY_BULLET_COOLDOWN = 1500 
 ENEMY_BULLET_LIFETIME = 75 
 ENEMY_BULLET_COLOR = ORANGE
 ENEMY_BULLET_DAMAGE = 10
 
 PROTOTYPE_DRONE_HEALTH = 150
-PROTOTYPE_DRONE_SPEED = 2.0
+PROTOTYPE_DRONE_SPEED = scaled_px(2.0)
 PROTOTYPE_DRONE_COLOR = MAGENTA 
 PROTOTYPE_DRONE_SHOOT_COOLDOWN = 1200
-PROTOTYPE_DRONE_BULLET_SPEED = 6
+PROTOTYPE_DRONE_BULLET_SPEED = scaled_px(6)
 PROTOTYPE_DRONE_SPRITE_PATH = "assets/images/enemies/prototype_enemy.png"
 
 # ==========================
 # MAZE_GUARDIAN Boss Settings
 # ==========================
 MAZE_GUARDIAN_HEALTH = 5000
-MAZE_GUARDIAN_SPEED = 1.0
+MAZE_GUARDIAN_SPEED = scaled_px(1.0)
 MAZE_GUARDIAN_COLOR = (80, 0, 120) 
 MAZE_GUARDIAN_SPRITE_PATH = "assets/images/enemies/maze_guardian.png"
-MAZE_GUARDIAN_BULLET_SPEED = 6
+MAZE_GUARDIAN_BULLET_SPEED = scaled_px(6)
 MAZE_GUARDIAN_BULLET_LIFETIME = 80
 MAZE_GUARDIAN_BULLET_COLOR = RED
 MAZE_GUARDIAN_BULLET_DAMAGE = 15
@@ -201,7 +266,7 @@ MAZE_GUARDIAN_ARENA_SHIFT_DURATION_MS = 1000
 MAZE_GUARDIAN_MINION_SPAWN_COOLDOWN_MS = 7000
 
 SENTINEL_DRONE_HEALTH = 75
-SENTINEL_DRONE_SPEED = 3.0
+SENTINEL_DRONE_SPEED = scaled_px(3.0)
 SENTINEL_DRONE_SPRITE_PATH = "assets/images/enemies/sentinel_drone.png"
 
 # ==========================
@@ -309,6 +374,7 @@ GAME_STATE_ARCHITECT_VAULT_FAILURE = "architect_vault_failure"
 GAME_STATE_RING_PUZZLE = "ring_puzzle_active"
 GAME_STATE_GAME_INTRO_SCROLL = "game_intro_scroll"
 GAME_STATE_MAZE_DEFENSE = "maze_defense_mode" 
+GAME_STATE_LOADING = "loading" # Shown while a scene's critical assets load in the background
 
 
 # ==============================================================================
@@ -318,6 +384,20 @@ GAME_STATE_MAZE_DEFENSE = "maze_defense_mode"
 DEFAULT_SETTINGS = {
     "WIDTH": WIDTH, "HEIGHT": HEIGHT, "FPS": FPS, "FULLSCREEN_MODE": FULLSCREEN_MODE,
     "MUSIC_VOLUME_MULTIPLIER": MUSIC_VOLUME_MULTIPLIER, "SFX_VOLUME_MULTIPLIER": SFX_VOLUME_MULTIPLIER,
+    "ROTATION_FRAME_COUNT": ROTATION_FRAME_COUNT,
+    "COLLECTIBLE_PULSE_FRAMES": COLLECTIBLE_PULSE_FRAMES, "COLLECTIBLE_ICON_FRAMES": COLLECTIBLE_ICON_FRAMES,
+    "TEXT_CACHE_MAX_BYTES": TEXT_CACHE_MAX_BYTES, "MENU_STAR_COUNT": MENU_STAR_COUNT, "MENU_STAR_LAYERS": MENU_STAR_LAYERS,
+    "DIRTY_RECT_PRESENTATION": DIRTY_RECT_PRESENTATION, "DIRTY_RECT_FULL_FLIP_RATIO": DIRTY_RECT_FULL_FLIP_RATIO,
+    "FRAME_STATS_WINDOW": FRAME_STATS_WINDOW, "FRAME_STATS_LOG_INTERVAL_MS": FRAME_STATS_LOG_INTERVAL_MS,
+    "IDLE_THROTTLE_ENABLED": IDLE_THROTTLE_ENABLED, "IDLE_FPS": IDLE_FPS, "IDLE_INPUT_TIMEOUT_MS": IDLE_INPUT_TIMEOUT_MS, "IDLE_STATIC_WAIT_MS": IDLE_STATIC_WAIT_MS,
+    "SIMULATION_TICK_RATE": SIMULATION_TICK_RATE, "SIMULATION_MAX_TICKS_PER_FRAME": SIMULATION_MAX_TICKS_PER_FRAME, "SPRITE_INTERPOLATION": SPRITE_INTERPOLATION,
+    "CAMERA_CULL_MARGIN": CAMERA_CULL_MARGIN, "MAZE_SIZE_SCREENS": MAZE_SIZE_SCREENS,
+    "LIGHTNING_TEMPLATE_POOL_SIZE": LIGHTNING_TEMPLATE_POOL_SIZE, "ASSET_PRELOAD_ALL": ASSET_PRELOAD_ALL,
+    "ASYNC_ASSET_LOADING": ASYNC_ASSET_LOADING, "ASSET_CONVERT_BUDGET_MS": ASSET_CONVERT_BUDGET_MS,
+    "ASSET_DISK_CACHE": ASSET_DISK_CACHE, "ASSET_CACHE_DIR": ASSET_CACHE_DIR, "ASSET_MANIFEST_PATH": ASSET_MANIFEST_PATH,
+    "TEXTURE_ATLAS_ENABLED": TEXTURE_ATLAS_ENABLED, "ATLAS_PAGE_SIZE": ATLAS_PAGE_SIZE, "ATLAS_MAX_IMAGE_SIZE": ATLAS_MAX_IMAGE_SIZE,
+    "ASSET_MEMORY_BUDGET_MB": ASSET_MEMORY_BUDGET_MB, "AUDIO_CHANNEL_GROUPS": AUDIO_CHANNEL_GROUPS, "SOUND_PLAYBACK_RULES": SOUND_PLAYBACK_RULES,
+    "STARTUP_REPORT_PATH": STARTUP_REPORT_PATH, "STARTUP_SLOW_FILE_MS": STARTUP_SLOW_FILE_MS,
     "BOTTOM_PANEL_HEIGHT": BOTTOM_PANEL_HEIGHT, "TILE_SIZE": TILE_SIZE,
     "PLAYER_MAX_HEALTH": PLAYER_MAX_HEALTH, "PLAYER_LIVES": PLAYER_LIVES,
     "PLAYER_SPEED": PLAYER_SPEED, "ROTATION_SPEED": ROTATION_SPEED,
@@ -1,4 +1,5 @@
 # hyperdrone_core/__init__.py
+import importlib
 
 # Import the main GameController class to be accessible when importing hyperdrone_core
 from .game_loop import GameController
@@ -8,8 +9,6 @@ from .scene_manager import SceneManager
 from .event_manager import EventManager
 from .player_actions import PlayerActions
 from .enemy_manager import EnemyManager
-from .ring_puzzle_module import RingPuzzle # Assuming this is the correct name and location
-from .wave_manager import WaveManager
 
 # Import NEW sub-controller classes
 from .combat_controller import CombatController
@@ -18,6 +17,18 @@ from .ui_flow_controller import UIFlowController
 
 # Import the NEW AssetManager class
 from .asset_manager import AssetManager # <<< ADDED THIS LINE
+from .asset_cache import AssetDiskCache
+from .texture_atlas import TextureAtlas
+from .asset_memory_cache import AssetMemoryCache
+from .audio_manager import AudioManager
+
+from .frame_presenter import FramePresenter
+from .frame_pacer import FramePacer
+from .sprite_interpolator import SpriteInterpolator
+from .frame_profiler import FrameProfiler
+from .startup_profiler import StartupProfiler, startup_profiler
+from .camera import Camera
+from .render_queue import RenderQueue
 
 # Import the leaderboard module directly if it contains functions to be used
 from . import leaderboard
@@ -36,9 +47,31 @@ __all__ = [
     "PuzzleController",
     "UIFlowController",
     "AssetManager",         # <<< ADDED AssetManager HERE
+    "AssetDiskCache",
+    "TextureAtlas",
+    "AssetMemoryCache",
+    "AudioManager",
+    "FramePresenter",
+    "FramePacer",
+    "SpriteInterpolator",
+    "FrameProfiler",
+    "StartupProfiler",
+    "startup_profiler",
+    "Camera",
+    "RenderQueue",
     "leaderboard"
 ]
 
+# Mode-specific classes, imported the first time they're asked for (ring puzzle terminals, maze defense)
+# rather than with the package, so sessions that never reach those modes never load them
+_LAZY_EXPORTS = {"RingPuzzle": ".ring_puzzle_module", "WaveManager": ".wave_manager"}
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None: raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(importlib.import_module(module_name, __name__), name)
+    return value
+
 # You can also add any package-level initialization code here if needed,
 # though for this structure, it's often not necessary.
 # Consider moving the "Hyperdrone Core Systems Initialized" print to a logging statement
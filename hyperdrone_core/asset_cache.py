@@ -0,0 +1,128 @@
+# hyperdrone_core/asset_cache.py
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import threading
+
+import pygame
+
+from .asset_manifest import hash_asset_file
+
+logger = logging.getLogger(__name__)
+
+
+class AssetDiskCache:
+    """
+    Build-once cache of decoded images. Each entry is one file of raw RGBA pixels behind a small header
+    recording the source file's mtime and size, so loading it is a memory map and a pixel format
+    conversion instead of a PNG decode (and, for scaled entries, a smoothscale).
+    Entries are named after the source path relative to source_root plus the target size; an entry whose
+    header no longer matches its source is a miss and is overwritten by the next store(), so edited assets
+    invalidate themselves. When the caller passes the asset manifest's content hash, the entry is named after
+    the hash instead, so identical files share it. Its header still carries the file stamp: on a mismatch the
+    source is hashed once, and the entry is restamped and served if it still matches the hash (a checkout or
+    move that only changed the mtime), or bypassed for the path-named entry if it doesn't (an edited asset whose
+    manifest wasn't updated). Files are written under a temporary name and renamed into place, which keeps
+    concurrent writers (the loader thread and the main thread) from ever exposing a partial entry.
+    """
+    MAGIC = b"HDAC"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHqqII") # magic, version, source mtime_ns, source size, width, height
+    STAMP = struct.Struct("<qq") # The header's source mtime_ns and size, rewritten in place by _restamp()
+    STAMP_OFFSET = 6
+
+    def __init__(self, cache_dir, source_root, enabled=True):
+        self.cache_dir = cache_dir
+        self.source_root = source_root
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._hash_checks = {} # (source_path, source stamp) -> whether that version of the file has its manifest hash
+        if self.enabled:
+            try: os.makedirs(self.cache_dir, exist_ok=True)
+            except OSError as e: logger.warning(f"AssetDiskCache: Could not create cache directory '{self.cache_dir}', caching disabled: {e}"); self.enabled = False
+
+    def _entry_path(self, source_path, size, content_hash=None):
+        source_tag = f"sha256:{content_hash}" if content_hash else os.path.relpath(source_path, self.source_root).replace(os.sep, "/")
+        size_tag = f"{int(size[0])}x{int(size[1])}" if size else "original"
+        return os.path.join(self.cache_dir, hashlib.sha1(f"{source_tag}|{size_tag}".encode("utf-8")).hexdigest() + ".rgba")
+
+    @staticmethod
+    def _source_stamp(source_path):
+        source_stat = os.stat(source_path)
+        return source_stat.st_mtime_ns, source_stat.st_size
+
+    def _verified_hash(self, source_path, content_hash, source_stamp):
+        """content_hash if the file at source_stamp still hashes to it, else None (cache it by path). Each version is hashed once."""
+        if not content_hash: return None
+        version_key = (source_path, source_stamp)
+        if version_key not in self._hash_checks:
+            self._hash_checks[version_key] = hash_asset_file(source_path) == content_hash
+            if not self._hash_checks[version_key]:
+                logger.warning(f"AssetDiskCache: '{source_path}' changed since the asset manifest was updated (run tools/validate_assets.py --update), caching it by path.")
+        return content_hash if self._hash_checks[version_key] else None
+
+    def _restamp(self, entry_path, source_stamp):
+        try:
+            with open(entry_path, "r+b") as entry_file: entry_file.seek(self.STAMP_OFFSET); entry_file.write(self.STAMP.pack(*source_stamp))
+        except OSError as e: logger.warning(f"AssetDiskCache: Could not restamp cache entry '{entry_path}': {e}")
+
+    def _read_entry(self, entry_path, source_path, source_stamp, content_hash, convert):
+        """
+        The pixels of one entry file, or None if it is missing, damaged or stale. A hash-named entry with a stale
+        stamp whose source still has content_hash is restamped and served.
+        """
+        try:
+            with open(entry_path, "rb") as entry_file, \
+                 mmap.mmap(entry_file.fileno(), 0, access=mmap.ACCESS_READ) as entry_map:
+                magic, version, mtime_ns, source_size, width, height = self.HEADER.unpack_from(entry_map)
+                if (magic, version) != (self.MAGIC, self.VERSION) or len(entry_map) != self.HEADER.size + width * height * 4: return None
+                stamp_changed = (mtime_ns, source_size) != source_stamp
+                if stamp_changed and self._verified_hash(source_path, content_hash, source_stamp) is None: return None
+                pixels = memoryview(entry_map)[self.HEADER.size:]
+                try:
+                    surface = pygame.image.frombuffer(pixels, (width, height), "RGBA")
+                    surface = surface.convert_alpha() if convert else surface.copy() # frombuffer borrows the mapping, so copy before it closes
+                finally: pixels.release()
+        except (OSError, TypeError, ValueError, struct.error, pygame.error): return None
+        if stamp_changed: self._restamp(entry_path, source_stamp)
+        return surface
+
+    def load(self, source_path, size=None, convert=True, content_hash=None):
+        """
+        The cached pixels of source_path (scaled to size, or as decoded when size is None), or None on a miss.
+        convert=True returns a display-format copy (main thread only); convert=False an unconverted copy,
+        for the loader thread. Either way the returned Surface owns its pixels and the file is unmapped.
+        """
+        if not self.enabled: return None
+        try:
+            source_stamp = self._source_stamp(source_path)
+            surface = self._read_entry(self._entry_path(source_path, size, content_hash), source_path, source_stamp, content_hash, convert)
+            if surface is None and content_hash and self._verified_hash(source_path, content_hash, source_stamp) is None:
+                surface = self._read_entry(self._entry_path(source_path, size), source_path, source_stamp, None, convert) # The manifest hash is stale
+        except OSError: surface = None
+        if surface is None: self.misses += 1; return None
+        self.hits += 1
+        return surface
+
+    def store(self, source_path, surface, size=None, content_hash=None):
+        """Writes surface as the cache entry for source_path at size. Colour-keyed surfaces are skipped, RGBA can't carry the key."""
+        if not self.enabled or surface is None or surface.get_colorkey() is not None: return
+        try:
+            source_stamp = self._source_stamp(source_path)
+            entry_path = self._entry_path(source_path, size, self._verified_hash(source_path, content_hash, source_stamp))
+        except OSError as e:
+            logger.warning(f"AssetDiskCache: Could not stat '{source_path}' for its cache entry: {e}"); return
+        temp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            width, height = surface.get_size()
+            with open(temp_path, "wb") as entry_file:
+                entry_file.write(self.HEADER.pack(self.MAGIC, self.VERSION, *source_stamp, width, height))
+                entry_file.write(pygame.image.tobytes(surface, "RGBA"))
+            os.replace(temp_path, entry_path)
+        except (OSError, pygame.error) as e:
+            logger.warning(f"AssetDiskCache: Could not write cache entry for '{source_path}': {e}")
+            try: os.remove(temp_path)
+            except OSError: pass
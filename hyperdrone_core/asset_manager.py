@@ -1,23 +1,66 @@
 # hyperdrone_core/asset_manager.py
 import pygame
 import os
+import queue
+import threading
+import time
 import logging
 
+import game_settings as gs
+from .asset_cache import AssetDiskCache
+from .texture_atlas import TextureAtlas
+from .asset_memory_cache import AssetMemoryCache
+from .startup_profiler import startup_profiler
+
 logger = logging.getLogger(__name__)
 
+
 class AssetManager:
     """
     Manages loading and caching of game assets like images, sounds, and fonts.
+    Images and sounds from a registered manifest are decoded on first use. Scenes declare the
+    keys they need with register_scene_manifest() and load_scene_assets() fetches them up front,
+    so a scene change pays for its own assets instead of startup paying for every scene.
+    request_scene_assets() does the same on a worker thread: files are read and decoded there,
+    and process_async_loads() converts and caches the results on the main thread each frame.
+    Decoded and scaled images are also kept in an AssetDiskCache, so warm runs map raw pixels
+    from disk instead of decoding PNGs and smoothscaling them again.
+    Small original images from the manifest (icons, glyphs, small sprites) are packed into a
+    TextureAtlas and handed out as subsurfaces of its pages; scaled variants keep their own Surfaces.
+    Everything decoded lives in an AssetMemoryCache: byte-accounted, evicted least-recently-used
+    beyond ASSET_MEMORY_BUDGET_MB, with the current scene's assets pinned.
+    Fonts are created on first use and shared: every key and size that renders with the same face
+    at the same pixel size gets the same Font object.
     """
     def __init__(self, base_asset_folder_name="assets"):
         script_dir = os.path.dirname(os.path.abspath(__file__))
         project_root = os.path.dirname(script_dir)
         self.base_asset_path = os.path.join(project_root, base_asset_folder_name)
         
-        self.images = {}
-        self.sounds = {}
-        self.fonts = {}
+        # Categories: "images" (originals by key), "scaled" (get_image scale_to_size results), "sprites" ((key, (w, h)) shared
+        # scaled Surfaces, treat as read-only), "rotations" ((key, (w, h), alpha, frame_count) lazily filled sheets), "sounds"
+        self.memory_cache = AssetMemoryCache(gs.get_game_setting("ASSET_MEMORY_BUDGET_MB", 256) * 1024 * 1024)
+        self.font_manifest = {} # font key -> relative path, None for the system font
+        self.fonts = {} # (relative path or None, render size) -> Font, shared by every key on that face and size
+        self._font_lookup = {} # (font key, layout size) -> Font, so repeat lookups skip resolving the face
+        self._logged_font_misses = set() # (font key, layout size) already reported as unknown
+        self.audio_manager = None # Attached by GameController; play_sound() routes through it
         self.music_paths = {}
+        self.image_manifest = {} # key -> manifest entry, decoded by get_image/get_sprite on first use
+        self._content_hashes = {} # image key -> manifest sha256 once checked against the file's size, None to cache by path
+        self.sound_manifest = {} # key -> relative path, decoded by get_sound on first use
+        self.scene_manifests = {} # scene key -> {"images": [...], "sounds": [...], "critical": {...}}
+        self.async_loading = gs.get_game_setting("ASYNC_ASSET_LOADING", True)
+        self._load_requests = queue.Queue() # (kind, key, full path, content hash) for the loader thread
+        self._load_results = queue.Queue() # (kind, key, decoded Surface/Sound or None) back to the main thread
+        self._pending_loads = set() # (kind, key) queued or decoding; only touched on the main thread
+        self._failed_loads = set() # (kind, key) the loader couldn't decode, never re-queued
+        self._critical_loads = [] # (kind, key) the current scene transition is waiting for
+        self._load_thread = None
+        self.disk_cache = AssetDiskCache(os.path.join(project_root, gs.get_game_setting("ASSET_CACHE_DIR", ".asset_cache")), self.base_asset_path,
+                                         enabled=gs.get_game_setting("ASSET_DISK_CACHE", True))
+        self.texture_atlas = TextureAtlas(gs.get_game_setting("ATLAS_PAGE_SIZE", 512), gs.get_game_setting("ATLAS_MAX_IMAGE_SIZE", 128)) \
+                             if gs.get_game_setting("TEXTURE_ATLAS_ENABLED", True) else None
 
         if not os.path.exists(self.base_asset_path):
             logger.error(f"AssetManager: CRITICAL - Base asset path does not exist at '{self.base_asset_path}'!")
@@ -28,54 +71,196 @@ class AssetManager:
             return relative_path
         return os.path.join(self.base_asset_path, relative_path)
 
+    @staticmethod
+    def _surface_bytes(surface):
+        """Pixel bytes a Surface owns; texture atlas subsurfaces own none, their pages are charged to the memory cache as "atlas"."""
+        if surface is None or surface.get_parent() is not None: return 0
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    @staticmethod
+    def _sound_bytes(sound):
+        mixer_init = pygame.mixer.get_init()
+        if not mixer_init: return 0
+        frequency, sample_format, channels = mixer_init
+        return int(sound.get_length() * frequency) * channels * (abs(sample_format) // 8)
+
     def load_image(self, relative_path, key=None, use_convert_alpha=True, colorkey=None):
         """Loads an image and caches its original, unscaled version."""
         if key is None: key = relative_path
-        if key in self.images: return self.images[key]
+        if self.memory_cache.contains("images", key): return self.memory_cache.get("images", key)
         full_path = self._get_full_path(relative_path)
         if not os.path.exists(full_path):
             logger.error(f"AssetManager: Image file not found at '{full_path}' for key '{key}'.")
             return None
         try:
-            image = pygame.image.load(full_path)
-            image = image.convert_alpha() if use_convert_alpha else image.convert()
+            with startup_profiler.measure_asset("images", relative_path):
+                content_hash = self._get_content_hash(key)
+                image = self.disk_cache.load(full_path, content_hash=content_hash) if use_convert_alpha else None
+                if image is None:
+                    image = pygame.image.load(full_path)
+                    image = image.convert_alpha() if use_convert_alpha else image.convert()
+                    if use_convert_alpha: self.disk_cache.store(full_path, image, content_hash=content_hash)
+            if use_convert_alpha: image = self._pack_image(key, image)
             if colorkey: image.set_colorkey(colorkey)
-            self.images[key] = image
-            return image
+            return self.memory_cache.put("images", key, image, self._surface_bytes(image))
         except pygame.error as e:
             logger.error(f"AssetManager: Pygame error loading image '{full_path}': {e}")
             return None
 
+    def _get_original_image(self, key):
+        """The unscaled image for key: cached, loaded from the registered manifest, or loaded with key as a relative path."""
+        image = self.memory_cache.get("images", key)
+        if image is not None: return image
+        config = self.image_manifest.get(key)
+        if config: return self.load_image(config["path"], key=key)
+        return self.load_image(key)
+
+    def _pack_image(self, key, image):
+        """
+        image, or its subsurface in the texture atlas if it is a manifest original small enough to be packed.
+        Only manifest keys are packed, so the atlas is bounded by the manifest; scaled variants (any number of
+        sizes) and images loaded by path keep their own Surfaces, which the memory cache can evict.
+        """
+        if self.texture_atlas is None or key not in self.image_manifest or not self.texture_atlas.accepts(image): return image
+        packed_image = self.texture_atlas.add(key, image)
+        self.memory_cache.set_external_bytes("atlas", self.texture_atlas.get_page_bytes()) # A new page counts against the budget
+        return packed_image
+
+    def _get_image_source_path(self, key):
+        config = self.image_manifest.get(key)
+        return self._get_full_path(config["path"] if config else key)
+
+    def _get_content_hash(self, key):
+        """
+        The manifest's sha256 for image key, which names its disk cache entries, or None to cache it by path.
+        A file that no longer has the manifest's byte size is cached by path straight away; same-size edits are
+        caught by the disk cache, which rehashes a source whenever its stamp changes.
+        """
+        if key in self._content_hashes: return self._content_hashes[key]
+        config = self.image_manifest.get(key) or {}
+        content_hash = config.get("sha256")
+        if content_hash:
+            try: size_matches = os.path.getsize(self._get_full_path(config["path"])) == config.get("bytes")
+            except OSError: size_matches = False
+            if not size_matches:
+                logger.warning(f"AssetManager: '{config['path']}' doesn't match the asset manifest (run tools/validate_assets.py --update), caching it by path.")
+                content_hash = None
+        self._content_hashes[key] = content_hash
+        return content_hash
+
+    def _smoothscale_cached(self, key, size):
+        """The original image for key smoothscaled to size, from the disk cache when it has it. None if the source is missing."""
+        source_path, content_hash = self._get_image_source_path(key), self._get_content_hash(key)
+        scaled_image = self.disk_cache.load(source_path, size, content_hash=content_hash)
+        if scaled_image is not None: return scaled_image
+        original_image = self._get_original_image(key)
+        if not original_image: return None
+        scaled_image = pygame.transform.smoothscale(original_image, size)
+        self.disk_cache.store(source_path, scaled_image, size, content_hash=content_hash)
+        return scaled_image
+
     def get_image(self, key, scale_to_size=None, default_surface_params=None):
         """
         Retrieves an image. If scale_to_size is provided, it returns a scaled version,
         creating and caching it for future requests if it doesn't exist.
         """
         if not scale_to_size:
-            if key in self.images: return self.images[key]
-            elif self.load_image(key): return self.images.get(key)
+            original_image = self._get_original_image(key)
+            if original_image: return original_image
         
         if scale_to_size:
             try:
                 scaled_key = f"{key}_scaled_{int(scale_to_size[0])}x{int(scale_to_size[1])}"
-                if scaled_key in self.images: return self.images[scaled_key]
-                
-                original_image = self.images.get(key) or self.load_image(key)
-
-                if original_image:
-                    scaled_w, scaled_h = int(scale_to_size[0]), int(scale_to_size[1])
-                    if scaled_w <= 0 or scaled_h <= 0: raise ValueError("Image scaling dimensions must be positive.")
-                    scaled_image = pygame.transform.smoothscale(original_image, (scaled_w, scaled_h))
-                    self.images[scaled_key] = scaled_image
-                    return scaled_image
+                scaled_image = self.memory_cache.get("scaled", scaled_key)
+                if scaled_image is not None: return scaled_image
+
+                scaled_w, scaled_h = int(scale_to_size[0]), int(scale_to_size[1])
+                if scaled_w <= 0 or scaled_h <= 0: raise ValueError("Image scaling dimensions must be positive.")
+                scaled_image = self._smoothscale_cached(key, (scaled_w, scaled_h))
+
+                if scaled_image:
+                    return self.memory_cache.put("scaled", scaled_key, scaled_image, self._surface_bytes(scaled_image), source_key=key)
             except (ValueError, TypeError, pygame.error) as e:
                 logger.error(f"AssetManager: Error scaling image for key '{key}' to {scale_to_size}: {e}")
-                return self.images.get(key)
+                return self.memory_cache.get("images", key)
 
         logger.warning(f"AssetManager: Image with key '{key}' not found.")
         if default_surface_params: return self._create_fallback_surface(**default_surface_params)
         return None
-        
+
+    def get_sprite(self, key, size, fallback_factory=None):
+        """
+        Returns the shared sprite for (key, size), smoothscaling the source image only the
+        first time a given size is requested. Every entity using the same key and size gets
+        the same Surface, so callers must never draw onto or alpha-modify it.
+        If the source image is missing, fallback_factory(size) is called once and its result
+        is cached in the same slot.
+        """
+        size = (int(size[0]), int(size[1]))
+        cache_key = (key, size)
+        sprite = self.memory_cache.get("sprites", cache_key)
+        if sprite is not None: return sprite
+
+        try:
+            if size[0] <= 0 or size[1] <= 0: raise ValueError("Sprite dimensions must be positive.")
+            sprite = self._smoothscale_cached(key, size)
+            if sprite is None: logger.warning(f"AssetManager: Sprite source for key '{key}' not found.")
+        except (ValueError, pygame.error) as e:
+            logger.error(f"AssetManager: Error scaling sprite '{key}' to {size}: {e}")
+
+        if sprite is None and fallback_factory: sprite = fallback_factory(size)
+        if sprite is not None: self.memory_cache.put("sprites", cache_key, sprite, self._surface_bytes(sprite), source_key=key)
+        return sprite
+
+    def _get_rotation_sheet(self, key, size, alpha=255):
+        """Returns the lazily filled rotation sheet for (key, size, alpha), or None if the base sprite is missing."""
+        frame_count = max(1, int(gs.get_game_setting("ROTATION_FRAME_COUNT", 64)))
+        sheet_key = (key, (int(size[0]), int(size[1])), int(alpha), frame_count)
+        sheet = self.memory_cache.get("rotations", sheet_key)
+        if sheet is None:
+            base = self.get_sprite(key, size)
+            if base is None: return None
+            if alpha < 255:
+                base = base.copy()
+                base.fill((255, 255, 255, int(alpha)), special_flags=pygame.BLEND_RGBA_MULT)
+            sheet = {"key": sheet_key, "base": base, "frames": [None] * frame_count, "outlines": [None] * frame_count}
+            self.memory_cache.put("rotations", sheet_key, sheet, self._surface_bytes(base) if alpha < 255 else 0, source_key=key) # An opaque sheet's base is the shared sprite
+        return sheet
+
+    def get_rotated_sprite(self, key, size, rotation_deg, alpha=255):
+        """
+        Returns a shared pre-rotated frame of the (key, size) sprite. rotation_deg uses the
+        same convention as pygame.transform.rotate and is quantized to ROTATION_FRAME_COUNT
+        steps. Frames are rendered lazily the first time an angle is requested, so a sheet
+        only ever holds the angles that have actually been drawn.
+        An alpha below 255 selects a separately cached, pre-faded sheet (e.g. for cloaking).
+        Returns None if the base sprite is not in the sprite cache.
+        """
+        sheet = self._get_rotation_sheet(key, size, alpha)
+        if sheet is None: return None
+        frames = sheet["frames"]
+        frame_index = gs.quantize_angle(rotation_deg, len(frames))
+        frame = frames[frame_index]
+        if frame is None:
+            frame = frames[frame_index] = pygame.transform.rotate(sheet["base"], frame_index * 360.0 / len(frames))
+            self.memory_cache.grow("rotations", sheet["key"], self._surface_bytes(frame))
+        return frame
+
+    def get_rotated_outline(self, key, size, rotation_deg, alpha=255):
+        """
+        Returns the mask outline points of the matching get_rotated_sprite frame, relative to
+        the frame's top-left corner. Computed once per frame and cached alongside it; callers
+        only need to translate the points. Returns None if the sprite is missing.
+        """
+        frame = self.get_rotated_sprite(key, size, rotation_deg, alpha)
+        if frame is None: return None
+        outlines = self._get_rotation_sheet(key, size, alpha)["outlines"]
+        frame_index = gs.quantize_angle(rotation_deg, len(outlines))
+        outline = outlines[frame_index]
+        if outline is None:
+            outline = outlines[frame_index] = tuple(pygame.mask.from_surface(frame).outline(1))
+        return outline
+
     def _create_fallback_surface(self, size=(32,32), color=(128,0,128), text=None, text_color=(255,255,255), font_key=None, font_size=20):
         surface = pygame.Surface(size, pygame.SRCALPHA); surface.fill(color)
         if text:
@@ -89,54 +274,67 @@ class AssetManager:
 
     def load_sound(self, relative_path, key=None):
         if key is None: key = relative_path
-        if key in self.sounds: return self.sounds[key]
+        if self.memory_cache.contains("sounds", key): return self.memory_cache.get("sounds", key)
         full_path = self._get_full_path(relative_path)
         if not os.path.exists(full_path):
             logger.error(f"AssetManager: Sound file not found: '{full_path}'.")
             return None
         try:
-            sound = pygame.mixer.Sound(full_path); self.sounds[key] = sound; return sound
+            with startup_profiler.measure_asset("sounds", relative_path): sound = pygame.mixer.Sound(full_path)
+            return self.memory_cache.put("sounds", key, sound, self._sound_bytes(sound))
         except pygame.error as e: logger.error(f"AssetManager: Error loading sound '{full_path}': {e}"); return None
 
     def get_sound(self, key):
-        sound = self.sounds.get(key)
+        sound = self.memory_cache.get("sounds", key)
+        if not sound and key in self.sound_manifest: sound = self.load_sound(self.sound_manifest[key], key=key)
         if not sound: logger.warning(f"AssetManager: Sound with key '{key}' not found.")
         return sound
 
+    def play_sound(self, key, volume_multiplier=1.0):
+        """Plays a sound effect through the attached AudioManager (channel groups, voice limits), for entities that only hold the AssetManager."""
+        if self.audio_manager: return self.audio_manager.play(key, volume_multiplier)
+        sound = self.get_sound(key)
+        if sound: sound.play()
+        return None
+
     def load_font(self, relative_path, size, base_key):
-        """Loads a font of a specific size and caches it using a composite key."""
-        font_cache_key = f"{base_key}_{size}"
-        if font_cache_key in self.fonts:
-            return self.fonts[font_cache_key]
+        """Registers base_key as the font file at relative_path (None for the system font) and returns it at size."""
+        self.font_manifest[base_key] = relative_path
+        self._font_lookup.clear()
+        return self.get_font(base_key, size)
 
+    def _get_face_font(self, relative_path, render_size):
+        """The one Font for a face (relative path, None for the system font) at a render size, created on first use.
+        A face that fails to load is logged once and served by the system font at that size from then on."""
+        face_key = (relative_path, render_size)
+        font = self.fonts.get(face_key)
+        if font is not None: return font
         full_path = self._get_full_path(relative_path) if relative_path else None
-        
         try:
-            font = pygame.font.Font(full_path, size)
-            self.fonts[font_cache_key] = font
-            logger.debug(f"AssetManager: Loaded font '{full_path or 'System Font'}' size {size} as '{font_cache_key}'.")
-            return font
-        except pygame.error as e:
-            logger.error(f"AssetManager: Pygame error loading font '{full_path or 'System Font'}' size {size}: {e}")
-            try:
-                logger.warning(f"AssetManager: Attempting fallback to system font for key '{base_key}' size {size}.")
-                font = pygame.font.Font(None, size)
-                self.fonts[font_cache_key] = font
-                return font
-            except pygame.error as e_sys:
-                logger.error(f"AssetManager: Pygame error loading system font as fallback: {e_sys}")
-                return None
+            with startup_profiler.measure_asset("fonts", f"{relative_path or 'System Font'}@{render_size}"): font = pygame.font.Font(full_path, render_size)
+            logger.debug(f"AssetManager: Loaded font '{full_path or 'System Font'}' at {render_size}px.")
+        except (pygame.error, OSError) as e: # FileNotFoundError included
+            if relative_path is None:
+                logger.error(f"AssetManager: Could not create the system font at {render_size}px: {e}"); return None
+            logger.error(f"AssetManager: Error loading font '{full_path}' at {render_size}px, using the system font: {e}")
+            font = self._get_face_font(None, render_size)
+            if font is None: return None
+        self.fonts[face_key] = font
+        return font
 
     def get_font(self, base_key, size):
-        """Retrieves a pre-loaded font by its base key and size."""
-        cache_key = f"{base_key}_{size}"
-        font = self.fonts.get(cache_key)
-        if not font:
-            logger.warning(f"AssetManager: Font '{cache_key}' not found. Check manifest or use load_font first.")
-            try:
-                return pygame.font.Font(None, size)
-            except pygame.error:
-                return None
+        """
+        The font registered as base_key at a layout size, created on first use and shared by every key and size
+        that resolve to the same face and render size. An unknown key gets the system font; the miss is logged once.
+        A base_key of None asks for the system font directly.
+        """
+        font = self._font_lookup.get((base_key, size))
+        if font is not None: return font
+        if base_key is not None and base_key not in self.font_manifest and (base_key, size) not in self._logged_font_misses:
+            self._logged_font_misses.add((base_key, size))
+            logger.warning(f"AssetManager: Font '{base_key}_{size}' not found in the manifest. Using the system font.")
+        font = self._get_face_font(self.font_manifest.get(base_key), gs.scaled_px(size, as_int=True)) # Layout size, rendered at the internal resolution
+        if font is not None: self._font_lookup[(base_key, size)] = font
         return font
 
     def add_music_path(self, key, relative_path):
@@ -148,32 +346,156 @@ class AssetManager:
         logger.warning(f"AssetManager: Music path for key '{key}' not found.")
         return None
 
+    def register_manifest(self, manifest_dict):
+        """
+        Records where every image and sound in the manifest lives without decoding any of them;
+        they load on first use or with their scene. Fonts are created on first use too, one per face
+        and size, and music is only ever a path.
+        """
+        for key, config in manifest_dict.get("images", {}).items():
+            if not config.get("path"): logger.error(f"AssetManager (Manifest): Path missing for image key '{key}'."); continue
+            self.image_manifest[key] = config
+        for key, entry in manifest_dict.get("sounds", {}).items():
+            path = self._get_manifest_path(entry)
+            if not path: logger.error(f"AssetManager (Manifest): Path missing for sound key '{key}'."); continue
+            self.sound_manifest[key] = path
+        self._load_manifest_fonts_and_music(manifest_dict)
+        logger.info(f"AssetManager: Registered {len(self.image_manifest)} images and {len(self.sound_manifest)} sounds for on-demand loading.")
+
+    @staticmethod
+    def _get_manifest_path(entry):
+        """The relative path of a sound or music manifest entry, given as {"path": ...} or as the bare path."""
+        return entry.get("path") if isinstance(entry, dict) else entry
+
+    def register_scene_manifest(self, scene_key, image_keys=(), sound_keys=(), critical_keys=None):
+        """
+        Declares the images and sounds scene_key needs. Image keys may also be relative paths.
+        critical_keys are the ones the scene can't start without (all of them by default); the
+        rest stream in after the scene has started.
+        """
+        image_keys, sound_keys = list(image_keys), list(sound_keys)
+        self.scene_manifests[scene_key] = {"images": image_keys, "sounds": sound_keys,
+                                           "critical": set(image_keys + sound_keys if critical_keys is None else critical_keys)}
+
+    def load_scene_assets(self, *scene_keys):
+        """Loads every asset the given scenes declare that isn't cached yet. Returns the number of assets loaded."""
+        start_time = time.perf_counter(); loaded_count = 0
+        self.pin_scene_assets(*scene_keys)
+        for scene_key in scene_keys:
+            scene_manifest = self.scene_manifests.get(scene_key)
+            if scene_manifest is None: logger.warning(f"AssetManager: No asset manifest registered for scene '{scene_key}'."); continue
+            for key in scene_manifest["images"]:
+                if not self.memory_cache.contains("images", key) and self._get_original_image(key) is not None: loaded_count += 1
+            for key in scene_manifest["sounds"]:
+                if not self.memory_cache.contains("sounds", key) and key in self.sound_manifest and self.load_sound(self.sound_manifest[key], key=key): loaded_count += 1
+        if loaded_count: logger.info(f"AssetManager: Loaded {loaded_count} assets for {', '.join(scene_keys)} in {(time.perf_counter() - start_time) * 1000:.0f} ms.")
+        return loaded_count
+
+    def request_scene_assets(self, *scene_keys):
+        """
+        Queues every uncached asset of the given scenes on the loader thread, critical ones first.
+        Returns True if the critical ones are already cached, so the scene can start straight away;
+        otherwise progress is reported by get_load_progress() until scene_assets_ready().
+        With ASYNC_ASSET_LOADING off everything loads here and this always returns True.
+        """
+        if not self.async_loading: self.load_scene_assets(*scene_keys); return True
+        self.pin_scene_assets(*scene_keys)
+        critical_loads, streamed_loads = [], []
+        for scene_key in scene_keys:
+            scene_manifest = self.scene_manifests.get(scene_key)
+            if scene_manifest is None: logger.warning(f"AssetManager: No asset manifest registered for scene '{scene_key}'."); continue
+            for kind, keys in (("image", scene_manifest["images"]), ("sound", scene_manifest["sounds"])):
+                for key in keys: (critical_loads if key in scene_manifest["critical"] else streamed_loads).append((kind, key))
+        for kind, key in critical_loads + streamed_loads: self._queue_async_load(kind, key)
+        self._critical_loads = [load for load in critical_loads if load in self._pending_loads]
+        return not self._critical_loads
+
+    def _queue_async_load(self, kind, key):
+        if self.memory_cache.contains("images" if kind == "image" else "sounds", key) or (kind, key) in self._pending_loads or (kind, key) in self._failed_loads: return
+        if kind == "image": relative_path = self.image_manifest[key]["path"] if key in self.image_manifest else key
+        else: relative_path = self.sound_manifest.get(key)
+        full_path = self._get_full_path(relative_path) if relative_path else None
+        if not full_path or not os.path.exists(full_path): return # Left for the synchronous path, which logs it on first use
+        if self._load_thread is None:
+            self._load_thread = threading.Thread(target=self._load_worker, name="AssetLoader", daemon=True); self._load_thread.start()
+        content_hash = self._get_content_hash(key) if kind == "image" else None
+        self._pending_loads.add((kind, key)); self._load_requests.put((kind, key, full_path, content_hash))
+
+    def _load_worker(self):
+        """Loader thread: reads and decodes files only. Caches and the display are left to the main thread."""
+        while True:
+            kind, key, full_path, content_hash = self._load_requests.get()
+            try:
+                with startup_profiler.measure_asset(f"{kind}s", os.path.relpath(full_path, self.base_asset_path)):
+                    if kind == "image":
+                        asset = self.disk_cache.load(full_path, convert=False, content_hash=content_hash)
+                        if asset is None: asset = pygame.image.load(full_path); self.disk_cache.store(full_path, asset, content_hash=content_hash)
+                    else: asset = pygame.mixer.Sound(full_path)
+            except Exception as e: logger.error(f"AssetManager: Background load of '{full_path}' failed: {e}"); asset = None
+            self._load_results.put((kind, key, asset))
+
+    def process_async_loads(self, time_budget_ms=4):
+        """
+        Main-thread half of background loading: converts decoded images to the display format and
+        caches finished assets, stopping once time_budget_ms is spent. Called every tick.
+        A key that was needed early and loaded synchronously meanwhile keeps its cached version.
+        """
+        deadline = time.perf_counter() + time_budget_ms / 1000.0
+        while time.perf_counter() < deadline:
+            try: kind, key, asset = self._load_results.get_nowait()
+            except queue.Empty: break
+            self._pending_loads.discard((kind, key))
+            if asset is None: self._failed_loads.add((kind, key))
+            elif kind == "sound":
+                if not self.memory_cache.contains("sounds", key): self.memory_cache.put("sounds", key, asset, self._sound_bytes(asset))
+            elif not self.memory_cache.contains("images", key):
+                try:
+                    image = self._pack_image(key, asset.convert_alpha())
+                    self.memory_cache.put("images", key, image, self._surface_bytes(image))
+                except pygame.error as e: logger.error(f"AssetManager: Error converting background-loaded image '{key}': {e}"); self._failed_loads.add((kind, key))
+
+    def pin_scene_assets(self, *scene_keys):
+        """Pins the images and sounds the given scenes declare (and everything scaled from them), unpinning the previous scene's."""
+        pinned_keys = set()
+        for scene_key in scene_keys:
+            scene_manifest = self.scene_manifests.get(scene_key)
+            if scene_manifest: pinned_keys.update(scene_manifest["images"]); pinned_keys.update(scene_manifest["sounds"])
+        self.memory_cache.set_pinned(pinned_keys)
+
+    def get_memory_stats(self):
+        """Memory cache stats (bytes per category including the atlas pages, hit rate, evictions) plus disk cache hits."""
+        stats = self.memory_cache.get_stats()
+        stats["atlas_bytes"] = self.memory_cache.external_bytes.get("atlas", 0)
+        stats["disk_cache_hits"], stats["disk_cache_misses"] = self.disk_cache.hits, self.disk_cache.misses
+        stats["font_faces"] = len(self.fonts)
+        return stats
+
+    def scene_assets_ready(self):
+        """True once every critical asset of the last request_scene_assets() call has loaded (or failed to)."""
+        return not any(load in self._pending_loads for load in self._critical_loads)
+
+    def get_load_progress(self):
+        """Fraction of the last request's critical assets that are done, 1.0 when it had none outstanding."""
+        if not self._critical_loads: return 1.0
+        return sum(1 for load in self._critical_loads if load not in self._pending_loads) / len(self._critical_loads)
+
     def preload_manifest(self, manifest_dict):
+        """Registers the manifest and decodes every image and sound in it immediately."""
         logger.info("AssetManager: Starting preload from manifest...")
-        if "images" in manifest_dict:
-            for key, config in manifest_dict["images"].items():
-                if not config.get("path"): logger.error(f"AssetManager (Manifest): Path missing for image key '{key}'."); continue
-                self.load_image(config["path"], key=key)
-        
-        if "sounds" in manifest_dict:
-            for key, path in manifest_dict["sounds"].items():
-                if not path: logger.error(f"AssetManager (Manifest): Path missing for sound key '{key}'."); continue
-                self.load_sound(path, key=key)
-        
-        # <<< CORRECTED FONT PRELOADING LOGIC >>>
-        if "fonts" in manifest_dict:
-            for base_key, config in manifest_dict["fonts"].items():
-                font_path = config.get("path")
-                sizes_to_load = config.get("sizes", [])
-                if not isinstance(sizes_to_load, list):
-                    logger.error(f"AssetManager (Manifest): 'sizes' for font key '{base_key}' must be a list of integers.")
-                    continue
-                for size in sizes_to_load:
-                    self.load_font(font_path, size, base_key=base_key)
+        self.register_manifest(manifest_dict)
+        for key, config in manifest_dict.get("images", {}).items():
+            if config.get("path"): self.load_image(config["path"], key=key)
+        for key, entry in manifest_dict.get("sounds", {}).items():
+            if self._get_manifest_path(entry): self.load_sound(self._get_manifest_path(entry), key=key)
+        logger.info("AssetManager: Preload from manifest complete.")
+
+    def _load_manifest_fonts_and_music(self, manifest_dict):
+        for base_key, config in manifest_dict.get("fonts", {}).items():
+            self.font_manifest[base_key] = config.get("path") # Its "sizes" are documentation; any size is created on first use
+        self._font_lookup.clear()
 
         if "music" in manifest_dict:
-            for key, path in manifest_dict["music"].items():
+            for key, entry in manifest_dict["music"].items():
+                path = self._get_manifest_path(entry)
                 if not path: logger.error(f"AssetManager (Manifest): Path missing for music key '{key}'."); continue
                 self.add_music_path(key, path)
-                
-        logger.info("AssetManager: Preload from manifest complete.")
@@ -0,0 +1,136 @@
+# hyperdrone_core/asset_manifest.py
+import hashlib
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+ASSET_CATEGORIES = ("images", "sounds", "fonts", "music")
+# Leading bytes of each file format the game ships; the manifest's "format" must match both these and the extension
+FORMAT_SIGNATURES = {
+    "png": (b"\x89PNG\r\n\x1a\n",), "jpg": (b"\xff\xd8\xff",), "wav": (b"RIFF",), "ogg": (b"OggS",),
+    "otf": (b"OTTO",), "ttf": (b"\x00\x01\x00\x00", b"true"),
+}
+FILE_FIELDS = ("format", "bytes", "sha256")
+
+
+def hash_asset_file(file_path):
+    """SHA-256 of a file's contents, as the manifest records it."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as asset_file:
+        for chunk in iter(lambda: asset_file.read(1 << 20), b""): digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sniff_format(file_path):
+    """The format whose signature the file starts with, or None."""
+    with open(file_path, "rb") as asset_file: header = asset_file.read(8)
+    return next((file_format for file_format, signatures in FORMAT_SIGNATURES.items() if header.startswith(signatures)), None)
+
+
+def empty_manifest():
+    return {"version": MANIFEST_VERSION, "scenes": [], **{category: {} for category in ASSET_CATEGORIES}}
+
+
+def read_asset_manifest(manifest_path):
+    """
+    Reads the asset manifest. Each category maps an asset key to {"path", "format", "bytes", "sha256"}, plus "sizes"
+    for fonts, and "scenes"/"critical_scenes" tags for images and sounds. A font path of null is the default system font.
+    Raises OSError or ValueError if the file can't be read or isn't a manifest of this version.
+    """
+    with open(manifest_path, "r", encoding="utf-8") as manifest_file: manifest = json.load(manifest_file)
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"not a version {MANIFEST_VERSION} asset manifest")
+    for category in ASSET_CATEGORIES: manifest.setdefault(category, {})
+    manifest.setdefault("scenes", [])
+    return manifest
+
+
+def load_asset_manifest(manifest_path):
+    """read_asset_manifest() for the game: an unusable manifest is logged and replaced by an empty one, so assets fall back at first use."""
+    try: return read_asset_manifest(manifest_path)
+    except (OSError, ValueError) as e:
+        logger.error(f"AssetManifest: Could not load '{manifest_path}': {e}. No assets are registered.")
+        return empty_manifest()
+
+
+def get_scene_assets(manifest):
+    """scene key -> {"images": [...], "sounds": [...], "critical": [...]} built from the manifest's scene tags, in manifest order."""
+    scene_assets = {scene_key: {"images": [], "sounds": [], "critical": []} for scene_key in manifest.get("scenes", [])}
+    for category in ("images", "sounds"):
+        for key, entry in manifest.get(category, {}).items():
+            for scene_key in entry.get("scenes", []):
+                if scene_key not in scene_assets: continue
+                scene_assets[scene_key][category].append(key)
+                if scene_key in entry.get("critical_scenes", []): scene_assets[scene_key]["critical"].append(key)
+    return scene_assets
+
+
+def validate_asset_manifest(manifest, asset_root, check_hashes=True):
+    """
+    Checks the manifest against the files under asset_root. Returns (errors, warnings) as lists of messages.
+    Errors: missing or unreadable files, paths outside asset_root, size, format or hash mismatches, bad scene tags
+    or font sizes. Warnings: files under asset_root no entry refers to.
+    """
+    errors, warnings = [], []
+    if manifest.get("version") != MANIFEST_VERSION: errors.append(f"version is {manifest.get('version')!r}, expected {MANIFEST_VERSION}")
+    declared_scenes = set(manifest.get("scenes", []))
+    root = os.path.abspath(asset_root)
+    referenced_paths = set()
+    for category in ASSET_CATEGORIES:
+        for key, entry in manifest.get(category, {}).items():
+            label = f"{category}/{key}"
+            if not isinstance(entry, dict): errors.append(f"{label}: entry must be an object"); continue
+            if category == "fonts":
+                sizes = entry.get("sizes")
+                if not isinstance(sizes, list) or not sizes or not all(isinstance(size, int) and size > 0 for size in sizes):
+                    errors.append(f"{label}: 'sizes' must be a non-empty list of positive integers")
+            if category in ("images", "sounds"):
+                scenes, critical_scenes = set(entry.get("scenes", [])), set(entry.get("critical_scenes", []))
+                if scenes - declared_scenes: errors.append(f"{label}: unknown scenes {sorted(scenes - declared_scenes)}")
+                if critical_scenes - scenes: errors.append(f"{label}: critical in scenes it isn't tagged with {sorted(critical_scenes - scenes)}")
+            relative_path = entry.get("path")
+            if relative_path is None and category == "fonts": continue # The default system font
+            if not isinstance(relative_path, str) or not relative_path: errors.append(f"{label}: missing 'path'"); continue
+            full_path = os.path.abspath(os.path.join(root, relative_path))
+            if os.path.commonpath([root, full_path]) != root: errors.append(f"{label}: '{relative_path}' is outside the asset folder"); continue
+            referenced_paths.add(full_path)
+            if not os.path.isfile(full_path): errors.append(f"{label}: file '{relative_path}' does not exist"); continue
+            missing_fields = [field for field in FILE_FIELDS if field not in entry]
+            if missing_fields: errors.append(f"{label}: missing {', '.join(missing_fields)} (run with --update)"); continue
+            try:
+                if os.path.getsize(full_path) != entry["bytes"]: errors.append(f"{label}: '{relative_path}' is {os.path.getsize(full_path)} bytes, manifest says {entry['bytes']}")
+                extension = os.path.splitext(relative_path)[1].lower().lstrip(".")
+                if entry["format"] != extension: errors.append(f"{label}: format '{entry['format']}' doesn't match the '.{extension}' extension")
+                elif sniff_format(full_path) != entry["format"]: errors.append(f"{label}: '{relative_path}' is not a valid {entry['format']} file")
+                if check_hashes and hash_asset_file(full_path) != entry["sha256"]: errors.append(f"{label}: '{relative_path}' content changed since the manifest was updated")
+            except OSError as e: errors.append(f"{label}: could not read '{relative_path}': {e}")
+    for directory, _, file_names in os.walk(root):
+        for file_name in sorted(file_names):
+            full_path = os.path.join(directory, file_name)
+            if full_path not in referenced_paths: warnings.append(f"'{os.path.relpath(full_path, root).replace(os.sep, '/')}' is not in the manifest")
+    return errors, warnings
+
+
+def update_asset_manifest(manifest, asset_root):
+    """Rewrites each existing file's format, bytes and sha256 from disk. Returns the number of entries that changed."""
+    changed_count = 0
+    for category in ASSET_CATEGORIES:
+        for entry in manifest.get(category, {}).values():
+            relative_path = entry.get("path") if isinstance(entry, dict) else None
+            full_path = os.path.join(asset_root, relative_path) if relative_path else None
+            if not full_path or not os.path.isfile(full_path): continue
+            file_fields = {"format": os.path.splitext(relative_path)[1].lower().lstrip("."), "bytes": os.path.getsize(full_path), "sha256": hash_asset_file(full_path)}
+            if any(entry.get(field) != value for field, value in file_fields.items()): entry.update(file_fields); changed_count += 1
+    return changed_count
+
+
+def save_asset_manifest(manifest, manifest_path):
+    """Writes the manifest one asset per line, so diffs show exactly which assets changed."""
+    sections = [f'  "version": {json.dumps(manifest.get("version", MANIFEST_VERSION))}', f'  "scenes": {json.dumps(manifest.get("scenes", []))}']
+    for category in ASSET_CATEGORIES:
+        entry_lines = ",\n".join(f"    {json.dumps(key)}: {json.dumps(entry, ensure_ascii=False)}" for key, entry in manifest.get(category, {}).items())
+        sections.append(f'  "{category}": {{\n{entry_lines}\n  }}' if entry_lines else f'  "{category}": {{}}')
+    with open(manifest_path, "w", encoding="utf-8") as manifest_file: manifest_file.write("{\n" + ",\n".join(sections) + "\n}\n")
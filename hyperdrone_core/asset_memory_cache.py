@@ -0,0 +1,100 @@
+# hyperdrone_core/asset_memory_cache.py
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class AssetMemoryCache:
+    """
+    Byte-accounted LRU store behind AssetManager's images, scaled images, sprites, rotation sheets and sounds.
+    Entries are addressed by (category, key) and remember the asset key they were made from. Once the total
+    exceeds max_bytes, entries are evicted least-recently-used first, skipping any whose source key is pinned
+    (the assets of the current scene) and any that own no memory of their own (texture atlas subsurfaces).
+    Memory held outside the entries, the atlas pages those subsurfaces share, is charged with
+    set_external_bytes(): it counts against max_bytes but is never evicted.
+    Like TextRenderCache it only drops its own reference: a Surface still held by an entity or the UI stays
+    alive until they let go of it, and an evicted asset is simply loaded again the next time it is asked for.
+    """
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self.max_bytes = int(max_bytes)
+        self._entries = OrderedDict() # (category, key) -> [asset, byte_size, source_key]
+        self.pinned_sources = set()
+        self.external_bytes = {} # category -> bytes charged by set_external_bytes()
+        self.current_bytes = 0
+        self.bytes_by_category = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+
+    def contains(self, category, key):
+        return (category, key) in self._entries
+
+    def get(self, category, key):
+        """The cached asset, marked as most recently used, or None (counted as a miss)."""
+        entry = self._entries.get((category, key))
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end((category, key))
+        self.hits += 1
+        return entry[0]
+
+    def put(self, category, key, asset, byte_size, source_key=None):
+        """Caches asset under (category, key), then evicts down to the budget. Returns asset."""
+        self.discard(category, key)
+        self._entries[(category, key)] = [asset, int(byte_size), key if source_key is None else source_key]
+        self._account(category, int(byte_size))
+        self._evict()
+        return asset
+
+    def grow(self, category, key, extra_bytes):
+        """Adds extra_bytes to an entry that filled in more data after it was cached (rotation frames)."""
+        entry = self._entries.get((category, key))
+        if entry is None or extra_bytes <= 0: return
+        entry[1] += int(extra_bytes); self._account(category, int(extra_bytes))
+        self._evict()
+
+    def set_external_bytes(self, category, byte_count):
+        """Charges byte_count bytes under category for memory the cache doesn't own, then evicts down to the budget."""
+        byte_delta = int(byte_count) - self.external_bytes.get(category, 0)
+        if not byte_delta: return
+        self.external_bytes[category] = int(byte_count); self._account(category, byte_delta)
+        self._evict()
+
+    def discard(self, category, key):
+        entry = self._entries.pop((category, key), None)
+        if entry: self._account(category, -entry[1])
+
+    def set_pinned(self, source_keys):
+        """Replaces the pinned asset keys; entries made from them are never evicted."""
+        self.pinned_sources = set(source_keys)
+        self._evict()
+
+    def _account(self, category, byte_delta):
+        self.current_bytes += byte_delta
+        self.bytes_by_category[category] = self.bytes_by_category.get(category, 0) + byte_delta
+
+    def _evict(self):
+        if self.current_bytes <= self.max_bytes: return
+        newest_key = next(reversed(self._entries), None) # The entry just used is never its own victim
+        for entry_key in list(self._entries):
+            if self.current_bytes <= self.max_bytes: break
+            _, byte_size, source_key = self._entries[entry_key]
+            if entry_key == newest_key or byte_size <= 0 or source_key in self.pinned_sources: continue
+            self.discard(*entry_key)
+            self.evictions += 1; self.evicted_bytes += byte_size
+            logger.debug(f"AssetMemoryCache: Evicted {entry_key[0]} '{entry_key[1]}' ({byte_size / 1024:.0f} KB).")
+        if self.current_bytes > self.max_bytes:
+            logger.debug(f"AssetMemoryCache: {self.current_bytes / 1048576:.1f} MB still cached, over the {self.max_bytes / 1048576:.1f} MB budget (pinned or in use).")
+
+    def get_stats(self):
+        lookups = self.hits + self.misses
+        pinned_bytes = sum(byte_size for _, byte_size, source_key in self._entries.values() if source_key in self.pinned_sources)
+        return {
+            "entries": len(self._entries), "bytes": self.current_bytes, "max_bytes": self.max_bytes,
+            "bytes_by_category": {category: byte_count for category, byte_count in self.bytes_by_category.items() if byte_count},
+            "pinned_bytes": pinned_bytes, "hits": self.hits, "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0, "evictions": self.evictions, "evicted_bytes": self.evicted_bytes
+        }
@@ -0,0 +1,86 @@
+# hyperdrone_core/audio_manager.py
+import logging
+
+import pygame
+
+import game_settings as gs
+
+logger = logging.getLogger(__name__)
+
+
+class AudioManager:
+    """
+    Plays sound effects on reserved mixer channel groups instead of letting Sound.play() grab any free channel.
+    Each sound key has a playback rule (SOUND_PLAYBACK_RULES): the channel group it plays in, a priority, a cap
+    on how many copies may sound at once and a minimum interval between starts. A request inside the interval is
+    throttled; one over its voice cap restarts the key's oldest voice; and a full group steals its lowest-priority
+    (then oldest) voice, or drops the request if every voice outranks it. Volume is set on the channel per play,
+    so the shared Sound objects are never modified.
+    """
+    DEFAULT_RULE = {"group": "world", "priority": 1, "max_voices": 2, "min_interval_ms": 0}
+
+    def __init__(self, asset_manager, channel_groups=None, playback_rules=None, free_channels=4):
+        self.asset_manager = asset_manager
+        self.playback_rules = playback_rules if playback_rules is not None else gs.get_game_setting("SOUND_PLAYBACK_RULES", {})
+        channel_groups = channel_groups if channel_groups is not None else gs.get_game_setting("AUDIO_CHANNEL_GROUPS", {"world": 8})
+        self.groups = {} # group name -> [Channel, ...]
+        self._voices = {} # Channel -> (sound key, priority, start ticks) of what it was last asked to play
+        self._last_play_time = {} # sound key -> ticks of its last start
+        self.played = 0; self.throttled = 0; self.dropped = 0; self.stolen = 0
+        if not pygame.mixer.get_init():
+            logger.warning("AudioManager: Mixer not initialized, sound effects are disabled."); return
+        reserved_count = sum(channel_groups.values())
+        pygame.mixer.set_num_channels(reserved_count + free_channels)
+        pygame.mixer.set_reserved(reserved_count) # Sound.play() and anything else outside the groups only get the free channels
+        channel_index = 0
+        for group_name, channel_count in channel_groups.items():
+            self.groups[group_name] = [pygame.mixer.Channel(channel_index + i) for i in range(channel_count)]
+            channel_index += channel_count
+
+    def get_rule(self, sound_key):
+        rule = self.playback_rules.get(sound_key)
+        return {**self.DEFAULT_RULE, **rule} if rule else self.DEFAULT_RULE
+
+    def _pick_channel(self, sound_key, rule, channels):
+        """The channel a new voice of sound_key should use, or None if it must be dropped."""
+        busy_voices = [(channel, self._voices[channel]) for channel in channels if channel.get_busy() and channel in self._voices]
+        same_key_voices = [(channel, voice) for channel, voice in busy_voices if voice[0] == sound_key]
+        if len(same_key_voices) >= rule["max_voices"]: return min(same_key_voices, key=lambda item: item[1][2])[0] # Restart its oldest copy
+        free_channel = next((channel for channel in channels if not channel.get_busy()), None)
+        if free_channel is not None: return free_channel
+        if not busy_voices: return None
+        victim, (_, victim_priority, _) = min(busy_voices, key=lambda item: (item[1][1], item[1][2]))
+        return victim if victim_priority <= rule["priority"] else None
+
+    def play(self, sound_key, volume_multiplier=0.7):
+        """Plays sound_key under its playback rule at SFX volume x volume_multiplier. Returns the Channel, or None if not played."""
+        rule = self.get_rule(sound_key)
+        current_time = pygame.time.get_ticks()
+        last_play_time = self._last_play_time.get(sound_key)
+        if last_play_time is not None and current_time - last_play_time < rule["min_interval_ms"]:
+            self.throttled += 1; return None
+        sound = self.asset_manager.get_sound(sound_key)
+        channels = self.groups.get(rule["group"]) or self.groups.get(self.DEFAULT_RULE["group"])
+        if not sound or not channels: return None
+        channel = self._pick_channel(sound_key, rule, channels)
+        if channel is None: self.dropped += 1; return None
+        if channel.get_busy(): self.stolen += 1
+        try:
+            channel.play(sound)
+            channel.set_volume(gs.get_game_setting("SFX_VOLUME_MULTIPLIER", 0.7) * volume_multiplier) # After play(), which may reset it
+        except pygame.error as e:
+            logger.error(f"AudioManager: Error playing sound '{sound_key}': {e}"); return None
+        self._voices[channel] = (sound_key, rule["priority"], current_time)
+        self._last_play_time[sound_key] = current_time
+        self.played += 1
+        return channel
+
+    def stop_all(self):
+        for channels in self.groups.values():
+            for channel in channels: channel.stop()
+
+    def get_stats(self):
+        return {
+            "played": self.played, "throttled": self.throttled, "dropped": self.dropped, "stolen": self.stolen,
+            "active_voices": {group_name: sum(1 for channel in channels if channel.get_busy()) for group_name, channels in self.groups.items()}
+        }
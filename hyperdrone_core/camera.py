@@ -0,0 +1,64 @@
+# hyperdrone_core/camera.py
+import logging
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+class Camera:
+    """
+    Viewport onto the game world. The view is the size of the play area; follow() centres it on a target
+    and clamps it to the world bounds, so a world no larger than the screen never scrolls.
+    Draw code maps world positions to the screen with apply()/apply_point() and skips anything outside
+    the view. cull_margin pads the view for effects drawn outside a sprite's rect (shields, health bars).
+    """
+    def __init__(self, view_size, world_size, cull_margin=64):
+        self.view_rect = pygame.Rect((0, 0), view_size)
+        self.world_rect = pygame.Rect((0, 0), world_size)
+        self.cull_margin = cull_margin
+        self.cull_rect = self.view_rect.inflate(2 * cull_margin, 2 * cull_margin)
+        self.sprites_drawn = 0
+        self.sprites_culled = 0
+
+    @property
+    def offset(self):
+        return self.view_rect.topleft
+
+    def set_world_size(self, world_size):
+        """Resizes the world; the view is clamped to it on the next follow()."""
+        self.world_rect.size = world_size
+
+    def follow(self, target_rect):
+        """Centres the view on target_rect (or keeps it where it is for None), clamped to the world."""
+        if target_rect is not None: self.view_rect.center = target_rect.center
+        self.view_rect.x = max(0, min(self.view_rect.x, self.world_rect.right - self.view_rect.width))
+        self.view_rect.y = max(0, min(self.view_rect.y, self.world_rect.bottom - self.view_rect.height))
+        self.cull_rect.center = self.view_rect.center
+
+    def reset_stats(self):
+        self.sprites_drawn = 0; self.sprites_culled = 0
+
+    def apply(self, rect):
+        return rect.move(-self.view_rect.x, -self.view_rect.y)
+
+    def apply_point(self, pos):
+        return (pos[0] - self.view_rect.x, pos[1] - self.view_rect.y)
+
+    def screen_to_world(self, pos):
+        return (pos[0] + self.view_rect.x, pos[1] + self.view_rect.y)
+
+    def is_visible(self, rect):
+        return self.cull_rect.colliderect(rect)
+
+    def visible_sprites(self, sprites):
+        """The sprites whose rects touch the padded view, in their original order."""
+        sprites = [sprite for sprite in sprites if getattr(sprite, 'rect', None)]
+        visible = [sprites[i] for i in self.cull_rect.collidelistall([sprite.rect for sprite in sprites])]
+        self.sprites_drawn += len(visible); self.sprites_culled += len(sprites) - len(visible)
+        return visible
+
+    def draw_group(self, surface, group):
+        """Group.draw for world sprites: blits only the visible ones, shifted into view space."""
+        offset_x, offset_y = self.view_rect.x, self.view_rect.y
+        surface.blits([(sprite.image, sprite.rect.move(-offset_x, -offset_y)) for sprite in self.visible_sprites(group) if getattr(sprite, 'image', None)], False)
@@ -15,12 +15,10 @@ from game_settings import (
 from entities import (
     PlayerDrone, Enemy, SentinelDrone, MazeGuardian,
     Bullet, Missile, LightningZap, Particle,
-    WeaponUpgradeItem, ShieldItem, SpeedBoostItem,
-    Turret, CoreReactor, MazeChapter2 
+    WeaponUpgradeItem, ShieldItem, SpeedBoostItem
 )
 
 from .enemy_manager import EnemyManager
-from .wave_manager import WaveManager
 
 
 class CombatController:
@@ -32,7 +30,7 @@ class CombatController:
         
         # EnemyManager will also need the asset_manager for its entities
         self.enemy_manager = EnemyManager(game_controller_ref, self.asset_manager)
-        self.wave_manager = WaveManager(game_controller_ref) 
+        self.wave_manager = None # Maze defense only, built by get_wave_manager() when that mode starts
 
         self.turrets_group = pygame.sprite.Group() 
         self.power_ups_group = pygame.sprite.Group()
@@ -47,6 +45,12 @@ class CombatController:
         self.architect_vault_gauntlet_current_wave = 0
         # print("CombatController initialized.")
 
+    def get_wave_manager(self):
+        if self.wave_manager is None:
+            from .wave_manager import WaveManager
+            self.wave_manager = WaveManager(self.game_controller)
+        return self.wave_manager
+
     def set_active_entities(self, player, maze, core_reactor=None, turrets_group=None, power_ups_group=None, explosion_particles_group=None):
         self.player = player
         self.maze = maze
@@ -373,8 +377,8 @@ class CombatController:
         # Pass asset_manager to MazeGuardian constructor
         if not self.player or not self.maze: return
         self.enemy_manager.reset_all() 
-        boss_spawn_x = self.maze.game_area_x_offset + (gs.WIDTH - self.maze.game_area_x_offset) / 2
-        boss_spawn_y = gs.GAME_PLAY_AREA_HEIGHT / 2
+        boss_spawn_x = self.maze.game_area_x_offset + (gs.WORLD_WIDTH - self.maze.game_area_x_offset) / 2
+        boss_spawn_y = gs.WORLD_HEIGHT / 2
         self.maze_guardian = MazeGuardian(x=boss_spawn_x, y=boss_spawn_y, 
                                           player_ref=self.player, maze_ref=self.maze, 
                                           game_controller_ref=self.game_controller,
@@ -402,7 +406,8 @@ class CombatController:
 
     def reset_combat_state(self):
         # (No change needed here)
-        self.enemy_manager.reset_all(); self.wave_manager.reset() 
+        self.enemy_manager.reset_all()
+        if self.wave_manager: self.wave_manager.reset()
         self.turrets_group.empty(); self.power_ups_group.empty(); self.explosion_particles_group.empty()
         if self.player:
             if hasattr(self.player, 'bullets_group'): self.player.bullets_group.empty()
@@ -413,6 +418,7 @@ class CombatController:
 
     def try_place_turret(self, screen_pos):
         # Pass asset_manager to Turret constructor
+        from entities import MazeChapter2, Turret # Maze defense only, loaded with the mode
         if not self.maze or not self.core_reactor or not isinstance(self.maze, MazeChapter2):
             self.game_controller.play_sound('ui_denied', 0.6); return False
         grid_c = int((screen_pos[0] - self.maze.game_area_x_offset) / TILE_SIZE); grid_r = int(screen_pos[1] / TILE_SIZE)
@@ -437,6 +443,7 @@ class CombatController:
     def try_upgrade_turret(self, turret_to_upgrade):
         # (No change needed here, uses play_sound with key)
         if turret_to_upgrade and turret_to_upgrade in self.turrets_group:
+            from entities import Turret
             upgrade_cost = Turret.UPGRADE_COST 
             if self.game_controller.drone_system.get_player_cores() >= upgrade_cost:
                 if turret_to_upgrade.upgrade(): 
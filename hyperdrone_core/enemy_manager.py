@@ -24,7 +24,7 @@ class EnemyManager:
                 "class": Enemy,
                 "sprite_asset_key": "regular_enemy_sprite_key", # Key for AssetManager
                 "health": gs.get_game_setting("ENEMY_HEALTH", 100),
-                "speed": gs.get_game_setting("ENEMY_SPEED", 1.5),
+                "speed": gs.get_game_setting("ENEMY_SPEED", gs.ENEMY_SPEED),
                 "shoot_cooldown": gs.get_game_setting("ENEMY_BULLET_COOLDOWN", 1500),
                 "contact_damage": 25
             },
@@ -32,7 +32,7 @@ class EnemyManager:
                 "class": Enemy,
                 "sprite_asset_key": "regular_enemy_sprite_key", # Can reuse or use a new one e.g., "fast_enemy_sprite_key"
                 "health": int(gs.get_game_setting("ENEMY_HEALTH", 100) * 0.7),
-                "speed": gs.get_game_setting("ENEMY_SPEED", 1.5) * 1.5,
+                "speed": gs.get_game_setting("ENEMY_SPEED", gs.ENEMY_SPEED) * 1.5,
                 "shoot_cooldown": int(gs.get_game_setting("ENEMY_BULLET_COOLDOWN", 1500) * 0.8),
                 "contact_damage": 20
             },
@@ -40,7 +40,7 @@ class EnemyManager:
                 "class": Enemy,
                 "sprite_asset_key": "regular_enemy_sprite_key", # Can reuse or use a new one e.g., "armored_enemy_sprite_key"
                 "health": int(gs.get_game_setting("ENEMY_HEALTH", 100) * 1.8),
-                "speed": gs.get_game_setting("ENEMY_SPEED", 1.5) * 0.7,
+                "speed": gs.get_game_setting("ENEMY_SPEED", gs.ENEMY_SPEED) * 0.7,
                 "shoot_cooldown": int(gs.get_game_setting("ENEMY_BULLET_COOLDOWN", 1500) * 1.2),
                 "contact_damage": 35
             },
@@ -196,12 +196,16 @@ class EnemyManager:
             elif not enemy_obj.bullets and hasattr(enemy_obj, '_exploded'):
                  enemy_obj.kill()
 
-    def draw_all(self, surface):
-        """Draws all managed enemies and their health bars."""
+    def draw_all(self, surface, camera=None):
+        """Draws all managed enemies and their health bars, skipping enemies outside the camera's view."""
         for enemy in self.enemies: 
-            enemy.draw(surface)
-            if enemy.alive and hasattr(enemy, '_draw_health_bar'):
-                enemy._draw_health_bar(surface)
+            enemy.draw(surface, camera)
+            if enemy.alive and hasattr(enemy, '_draw_health_bar') and (not camera or camera.is_visible(enemy.rect)):
+                enemy._draw_health_bar(surface, camera)
+
+    def submit_all(self, render_queue, camera):
+        """Queues all managed enemies, their bullets and health bars on the render queue."""
+        for enemy in self.enemies: enemy.submit_draw(render_queue, camera)
 
     def reset_all(self):
         """Removes all enemies from the manager."""
@@ -28,8 +28,9 @@ class EventManager:
 
     def process_events(self):
         """
-        Processes all events in the Pygame event queue and handles continuous key presses.
-        This is called once per frame from the main game loop.
+        Processes all events in the Pygame event queue.
+        This is called once per frame from the main game loop; held keys are applied per
+        simulation tick by process_continuous_input.
         """
         current_time_ms = pygame.time.get_ticks()
         current_game_state = self.scene_manager.get_current_state()
@@ -38,6 +39,8 @@ class EventManager:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.game_controller.quit_game()
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED): # The window contents must be presented again in full
+                self.game_controller.frame_presenter.mark_full()
             
             # --- Keyboard Down Events ---
             if event.type == pygame.KEYDOWN:
@@ -91,8 +94,14 @@ class EventManager:
                     if self.game_controller.ui_manager.build_menu.handle_input(event, mouse_pos):
                         continue # Input was handled by the build menu
 
-        # --- Continuous Input (for actions that happen as long as a key is held) ---
-        # The PlayerActions class now uses internal flags (e.g., self.move_forward)
+    def process_continuous_input(self):
+        """
+        Applies held-key actions (turning, shooting). Called once per fixed simulation tick by the
+        game loop rather than once per rendered frame, so turn rates don't depend on the frame rate.
+        """
+        current_time_ms = pygame.time.get_ticks()
+        current_game_state = self.scene_manager.get_current_state()
+        # The PlayerActions class uses internal flags (e.g., self.turn_left)
         # which are set by the KEYDOWN/KEYUP events. This method updates the player's
         # state based on those flags.
         is_gameplay_state_for_continuous = current_game_state in [GAME_STATE_PLAYING, GAME_STATE_BONUS_LEVEL_PLAYING] or \
@@ -0,0 +1,55 @@
+# hyperdrone_core/frame_pacer.py
+import logging
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+class FramePacer:
+    """
+    Decides how long the main loop waits before each frame. Normally it ticks the clock at the target FPS.
+    A static scene (the last frame presented nothing) blocks in pygame.event.wait for up to static_wait_ms,
+    and an idle-capable scene (menus, pause) that has seen no input for idle_after_ms drops to idle_fps.
+    Both idle modes wake on the first queued event, which is put back for the event manager, and any input
+    or scene change restores the full rate immediately.
+    """
+    INPUT_EVENT_TYPES = [
+        pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+        pygame.MOUSEMOTION, pygame.MOUSEWHEEL, pygame.JOYBUTTONDOWN, pygame.JOYAXISMOTION, pygame.JOYHATMOTION
+    ]
+
+    def __init__(self, clock, enabled=True, idle_fps=20, idle_after_ms=10000, static_wait_ms=250):
+        self.clock = clock
+        self.enabled = enabled
+        self.idle_fps = max(1, idle_fps)
+        self.idle_after_ms = idle_after_ms
+        self.static_wait_ms = max(1, int(static_wait_ms))
+        self.scene_key = None
+        self.last_activity_time = pygame.time.get_ticks()
+        self.last_tick_time = self.last_activity_time
+        self.idle_frames = 0
+
+    def note_activity(self):
+        self.last_activity_time = pygame.time.get_ticks()
+
+    def tick(self, target_fps, scene_key, scene_static=False, idle_allowed=False):
+        """Waits for the next frame and returns the elapsed milliseconds to simulate, like Clock.tick."""
+        current_time = pygame.time.get_ticks()
+        if scene_key != self.scene_key or pygame.event.peek(self.INPUT_EVENT_TYPES):
+            self.scene_key = scene_key; self.last_activity_time = current_time
+        throttled = idle_allowed and current_time - self.last_activity_time >= self.idle_after_ms
+        if not self.enabled or not (scene_static or throttled):
+            delta_time_ms = self.clock.tick(target_fps)
+        else:
+            self.idle_frames += 1
+            wait_ms = self.static_wait_ms if scene_static else int(1000 / self.idle_fps) - (current_time - self.last_tick_time)
+            if wait_ms > 0:
+                event = pygame.event.wait(wait_ms)
+                if event.type != pygame.NOEVENT:
+                    pygame.event.post(event)
+                    if event.type in self.INPUT_EVENT_TYPES: self.note_activity()
+            delta_time_ms = self.clock.tick()
+            if scene_static: delta_time_ms = min(delta_time_ms, 1000 // max(1, target_fps)) # Time spent blocked on a frozen scene isn't simulated
+        self.last_tick_time = pygame.time.get_ticks()
+        return delta_time_ms
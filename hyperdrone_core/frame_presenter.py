@@ -0,0 +1,53 @@
+# hyperdrone_core/frame_presenter.py
+import logging
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+class FramePresenter:
+    """
+    Presents the finished frame to the display. Renderers report what they changed with mark_dirty(rect)
+    or mark_full(); present() then pushes only those rects with pygame.display.update, falls back to a full
+    pygame.display.flip once they cover more than full_flip_ratio of the screen, and presents nothing at all
+    when no renderer reported a change. The display surface being replaced always forces a full flip.
+    """
+    def __init__(self, enabled=True, full_flip_ratio=0.5):
+        self.enabled = enabled
+        self.full_flip_ratio = full_flip_ratio
+        self._dirty_rects = []
+        self._full = True
+        self._surface = None
+        self.full_flips = 0
+        self.partial_updates = 0
+        self.skipped_frames = 0
+
+    def mark_dirty(self, rect):
+        if not self._full: self._dirty_rects.append(pygame.Rect(rect))
+
+    def mark_full(self):
+        self._full = True
+        self._dirty_rects.clear()
+
+    def present(self):
+        """Presents the frame and returns the number of pixels pushed to the display."""
+        surface = pygame.display.get_surface()
+        if surface is None: return 0
+        if surface is not self._surface: self._surface = surface; self._full = True
+        screen_rect = surface.get_rect()
+        screen_area = screen_rect.width * screen_rect.height
+        rects = [] if self._full else [clipped for clipped in (rect.clip(screen_rect) for rect in self._dirty_rects) if clipped.width and clipped.height]
+        pixels = sum(rect.width * rect.height for rect in rects)
+        if not self.enabled or self._full or pixels > screen_area * self.full_flip_ratio:
+            pygame.display.flip()
+            pixels = screen_area; self.full_flips += 1
+        elif rects:
+            pygame.display.update(rects)
+            self.partial_updates += 1
+        else: self.skipped_frames += 1
+        self._dirty_rects.clear(); self._full = False
+        return pixels
+
+    def get_stats(self):
+        return {"full_flips": self.full_flips, "partial_updates": self.partial_updates, "skipped_frames": self.skipped_frames}
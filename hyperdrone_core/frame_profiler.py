@@ -0,0 +1,46 @@
+# hyperdrone_core/frame_profiler.py
+import logging
+from collections import deque
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+class FrameProfiler:
+    """
+    Rolling per-frame statistics for the main loop: frame time as measured by the loop clock and
+    the number of pixels pushed to the display. Optionally logs a summary every log_interval_ms.
+    """
+    def __init__(self, window_size=120, log_interval_ms=0):
+        self.frame_times_ms = deque(maxlen=max(1, int(window_size)))
+        self.pixels_presented = deque(maxlen=max(1, int(window_size)))
+        self.total_frames = 0
+        self.total_pixels_presented = 0
+        self.log_interval_ms = int(log_interval_ms)
+        self._last_log_time = pygame.time.get_ticks()
+
+    def record_frame(self, frame_time_ms, pixels_presented=0):
+        self.frame_times_ms.append(frame_time_ms)
+        self.pixels_presented.append(pixels_presented)
+        self.total_frames += 1
+        self.total_pixels_presented += pixels_presented
+        if self.log_interval_ms > 0:
+            current_time = pygame.time.get_ticks()
+            if current_time - self._last_log_time >= self.log_interval_ms:
+                self._last_log_time = current_time
+                stats = self.get_stats()
+                logger.info(f"FrameProfiler: {stats['fps']:.1f} FPS, avg {stats['avg_frame_ms']:.2f} ms (max {stats['max_frame_ms']:.2f} ms), "
+                            f"avg {stats['avg_pixels_presented']:.0f} px presented per frame")
+
+    def get_stats(self):
+        frame_count = len(self.frame_times_ms)
+        avg_frame_ms = sum(self.frame_times_ms) / frame_count if frame_count else 0.0
+        return {
+            "frames": self.total_frames, "avg_frame_ms": avg_frame_ms,
+            "max_frame_ms": max(self.frame_times_ms) if frame_count else 0.0,
+            "fps": (1000.0 / avg_frame_ms) if avg_frame_ms > 0 else 0.0,
+            "avg_pixels_presented": sum(self.pixels_presented) / frame_count if frame_count else 0.0,
+            "last_pixels_presented": self.pixels_presented[-1] if frame_count else 0,
+            "total_pixels_presented": self.total_pixels_presented
+        }
@@ -17,12 +17,21 @@ from .puzzle_controller import PuzzleController
 from .ui_flow_controller import UIFlowController
 from ui import UIManager
 from .asset_manager import AssetManager
+from .audio_manager import AudioManager
+from .frame_presenter import FramePresenter
+from .frame_pacer import FramePacer
+from .frame_profiler import FrameProfiler
+from .startup_profiler import startup_profiler
+from .asset_manifest import load_asset_manifest, get_scene_assets
+from .sprite_interpolator import SpriteInterpolator
+from .camera import Camera
+from .render_queue import RenderQueue
 
 from entities import (
     PlayerDrone, Ring as CollectibleRing, WeaponUpgradeItem, ShieldItem, SpeedBoostItem,
     CoreFragmentItem, VaultLogItem, GlyphTabletItem, AncientAlienTerminal,
-    ArchitectEchoItem, CoreReactor, Turret, LightningZap, Missile, Particle,
-    MazeGuardian, SentinelDrone, EscapeZone, Maze, MazeChapter2, Bullet
+    ArchitectEchoItem, LightningZap, Missile, Particle,
+    MazeGuardian, SentinelDrone, EscapeZone, Maze, Bullet
 )
 from drone_management import DroneSystem, DRONE_DATA
 import game_settings as gs
@@ -50,27 +59,46 @@ if not hasattr(gs, 'GAME_STATE_MAZE_DEFENSE'):
     gs.GAME_STATE_MAZE_DEFENSE = "maze_defense_mode"
 GAME_STATE_MAZE_DEFENSE = gs.GAME_STATE_MAZE_DEFENSE
 
+# Menu screens the frame pacer may throttle once input stops (pause is handled separately)
+IDLE_THROTTLE_STATES = (
+    GAME_STATE_MAIN_MENU, GAME_STATE_DRONE_SELECT, GAME_STATE_SETTINGS, GAME_STATE_LEADERBOARD, GAME_STATE_CODEX,
+    GAME_STATE_GAME_OVER, GAME_STATE_ENTER_NAME
+)
+
 class GameController:
     def __init__(self):
-        pygame.init()
-        pygame.mixer.init()
-
-        self.screen_flags = pygame.FULLSCREEN if gs.get_game_setting("FULLSCREEN_MODE") else 0
-        self.screen = pygame.display.set_mode((gs.get_game_setting("WIDTH"), gs.get_game_setting("HEIGHT")), self.screen_flags)
-        pygame.display.set_caption("HYPERDRONE")
-
-        self.asset_manager = AssetManager(base_asset_folder_name="assets")
-        self.drone_system = DroneSystem()
+        with startup_profiler.phase("pygame_init"):
+            pygame.init()
+            pygame.mixer.init()
+
+        with startup_profiler.phase("display"):
+            self.screen_flags = self._get_display_flags()
+            self.screen = pygame.display.set_mode((gs.get_game_setting("WIDTH"), gs.get_game_setting("HEIGHT")), self.screen_flags)
+            pygame.display.set_caption("HYPERDRONE")
+
+        with startup_profiler.phase("asset_manager"):
+            self.asset_manager = AssetManager(base_asset_folder_name="assets")
+            self.audio_manager = self.asset_manager.audio_manager = AudioManager(self.asset_manager) # Entities play sounds through the AssetManager
+        with startup_profiler.phase("drone_system"): self.drone_system = DroneSystem()
         
-        self._preload_all_assets()
+        with startup_profiler.phase("asset_manifests"): self._register_asset_manifests()
 
         self.clock = pygame.time.Clock()
-        self.scene_manager = SceneManager(self)
-        self.player_actions = PlayerActions(self)
-        self.combat_controller = CombatController(self, self.asset_manager)
-        self.puzzle_controller = PuzzleController(self, self.asset_manager)
-        self.ui_flow_controller = UIFlowController(self)
-        self.ui_manager = UIManager(self.screen, self.asset_manager, self, self.scene_manager, self.drone_system)
+        self.frame_presenter = FramePresenter(gs.get_game_setting("DIRTY_RECT_PRESENTATION", True), gs.get_game_setting("DIRTY_RECT_FULL_FLIP_RATIO", 0.5))
+        self.frame_pacer = FramePacer(self.clock, gs.get_game_setting("IDLE_THROTTLE_ENABLED", True), gs.get_game_setting("IDLE_FPS", 20),
+                                      gs.get_game_setting("IDLE_INPUT_TIMEOUT_MS", 10000), gs.get_game_setting("IDLE_STATIC_WAIT_MS", 250))
+        self.sprite_interpolator = SpriteInterpolator(gs.get_game_setting("SPRITE_INTERPOLATION", True))
+        self.camera = Camera((WIDTH, GAME_PLAY_AREA_HEIGHT), (gs.WORLD_WIDTH, gs.WORLD_HEIGHT), gs.get_game_setting("CAMERA_CULL_MARGIN", 64))
+        self.render_queue = RenderQueue()
+        self.simulation_accumulator_ms = 0.0
+        self.frame_profiler = FrameProfiler(gs.get_game_setting("FRAME_STATS_WINDOW", 120), gs.get_game_setting("FRAME_STATS_LOG_INTERVAL_MS", 0))
+        with startup_profiler.phase("scene_manager"): self.scene_manager = SceneManager(self) # Loads the first scene's assets
+        with startup_profiler.phase("controllers"):
+            self.player_actions = PlayerActions(self)
+            self.combat_controller = CombatController(self, self.asset_manager)
+            self.puzzle_controller = PuzzleController(self, self.asset_manager)
+            self.ui_flow_controller = UIFlowController(self)
+        with startup_profiler.phase("ui_manager"): self.ui_manager = UIManager(self.screen, self.asset_manager, self, self.scene_manager, self.drone_system)
         
         self.event_manager = EventManager(self, self.scene_manager, self.combat_controller, self.puzzle_controller, self.ui_flow_controller)
         self.ui_flow_controller.set_dependencies(self.scene_manager, self.ui_manager, self.drone_system)
@@ -130,101 +158,41 @@ class GameController:
         self.intro_font_key = "codex_category_font"
 
         if self.drone_system:
-            self.drone_system.unlock_lore_entry_by_id("architect_legacy_intro")
-            self.drone_system.check_and_unlock_lore_entries(event_trigger="game_start")
+            with startup_profiler.phase("lore_unlocks"):
+                self.drone_system.unlock_lore_entry_by_id("architect_legacy_intro")
+                self.drone_system.check_and_unlock_lore_entries(event_trigger="game_start")
             
         if self.ui_flow_controller:
             self.ui_flow_controller.settings_items_data = self._get_settings_menu_items_data_structure()
-            self.ui_flow_controller.intro_screens_data = self._load_intro_data_from_json_internal()
+            with startup_profiler.phase("intro_data"): self.ui_flow_controller.intro_screens_data = self._load_intro_data_from_json_internal()
 
-        self.scene_manager.set_game_state(GAME_STATE_MAIN_MENU)
+        with startup_profiler.phase("main_menu"): self.scene_manager.set_game_state(GAME_STATE_MAIN_MENU)
         logger_gc.info("GameController initialized successfully with AssetManager.")
 
-    def _preload_all_assets(self):
-        asset_manifest = {
-            "images": { "ring_ui_icon": {"path": "images/collectibles/ring_ui_icon.png"}, "ring_ui_icon_empty": {"path": "images/collectibles/ring_ui_icon_empty.png"}, "menu_logo_hyperdrone": {"path": "images/ui/menu_logo_hyperdrone.png"}, "core_fragment_empty_icon": {"path": "images/collectibles/fragment_ui_icon_empty.png"}, "reactor_hud_icon_key": {"path": "images/ui/reactor_icon.png"}, },
-            "sounds": { 'collect_ring': "sounds/collect_ring.wav", 'weapon_upgrade_collect': "sounds/weapon_upgrade_collect.wav", 'collect_fragment': "sounds/collect_fragment.wav", 'collect_log': "sounds/collect_log.wav", 'shoot': "sounds/shoot.wav", 'enemy_shoot': "sounds/enemy_shoot.wav", 'crash': "sounds/crash.wav", 'timer_out': "sounds/timer_out.wav", 'level_up': "sounds/level_up.wav", 'boss_intro': "sounds/boss_intro.wav", 'boss_hit': "sounds/boss_hit.wav", 'boss_death': "sounds/boss_death.wav", 'cloak_activate': "sounds/cloak_activate.wav", 'missile_launch': "sounds/missile_launch.wav", 'ui_select': "sounds/ui_select.wav", 'ui_confirm': "sounds/ui_confirm.wav", 'ui_denied': "sounds/ui_denied.wav", 'lore_unlock': "sounds/lore_unlock.wav", 'vault_alarm': "sounds/vault_alarm.wav", 'prototype_drone_explode': "sounds/prototype_drone_explode.wav", 'vault_barrier_disable': "sounds/vault_barrier_disable.wav", 'turret_place_placeholder': "sounds/turret_place.wav",  'reactor_hit_placeholder': "sounds/reactor_hit.wav",    'reactor_destroyed_placeholder': "sounds/reactor_destroyed.wav",  'turret_shoot_placeholder': "sounds/turret_shoot.wav"  },
-            "fonts": {
-                # This format tells the AssetManager to load ONE font file and create MULTIPLE sizes from it.
-                "ui_text": {"path": "fonts/neuropol.otf", "sizes": [28, 24, 16]},
-                "ui_values": {"path": "fonts/neuropol.otf", "sizes": [30]},
-                # --- START FIX ---
-                # Added size 24 to the manifest for the emoji font.
-                "ui_emoji_general": {"path": "fonts/seguiemj.ttf", "sizes": [32, 28, 24, 19]},
-                # --- END FIX ---
-                "ui_emoji_small": {"path": "fonts/seguiemj.ttf", "sizes": [20, 26]},
-                "small_text": {"path": "fonts/neuropol.otf", "sizes": [24]},
-                "medium_text": {"path": "fonts/neuropol.otf", "sizes": [48]},
-                "large_text": {"path": "fonts/neuropol.otf", "sizes": [74]},
-                "input_text": {"path": "fonts/neuropol.otf", "sizes": [50]},
-                "menu_text": {"path": "fonts/neuropol.otf", "sizes": [60, 54, 48]},
-                "title_text": {"path": "fonts/neuropol.otf", "sizes": [90]},
-                "drone_name_grid": {"path": "fonts/neuropol.otf", "sizes": [36]},
-                "drone_desc_grid": {"path": "fonts/neuropol.otf", "sizes": [22]},
-                "drone_unlock_grid": {"path": "fonts/neuropol.otf", "sizes": [20]},
-                "drone_name_cycle": {"path": "fonts/neuropol.otf", "sizes": [42]},
-                "drone_stats_label_cycle": {"path": "fonts/neuropol.otf", "sizes": [26]},
-                "drone_stats_value_cycle": {"path": "fonts/neuropol.otf", "sizes": [28]},
-                "drone_desc_cycle": {"path": "fonts/neuropol.otf", "sizes": [22]},
-                "drone_unlock_cycle": {"path": "fonts/neuropol.otf", "sizes": [20]},
-                "vault_message": {"path": "fonts/neuropol.otf", "sizes": [36]},
-                "vault_timer": {"path": "fonts/neuropol.otf", "sizes": [48]},
-                "leaderboard_header": {"path": "fonts/neuropol.otf", "sizes": [32]},
-                "leaderboard_entry": {"path": "fonts/neuropol.otf", "sizes": [28]},
-                "arrow_font_key": {"path": "fonts/seguiemj.ttf", "sizes": [60]},
-                "story_message_font": {"path": "fonts/neuropol.otf", "sizes": [26]},
-                "codex_title_font": {"path": "fonts/neuropol.otf", "sizes": [60]},
-                "codex_category_font": {"path": "fonts/neuropol.otf", "sizes": [38]},
-                "codex_entry_font": {"path": "fonts/neuropol.otf", "sizes": [30]},
-                "codex_content_font": {"path": "fonts/neuropol.otf", "sizes": [24]},
-            },
-            "music": { "menu_theme": "sounds/menu_music.wav", "gameplay_theme": "sounds/gameplay_music.wav", "architect_vault_theme": "sounds/architect_vault_theme.wav", "defense_theme": "sounds/defense_mode_music.wav" }
-        }
-        
-        if CORE_FRAGMENT_DETAILS:
-            for _, details in CORE_FRAGMENT_DETAILS.items():
-                if details and "id" in details and "icon_filename" in details: asset_manifest["images"][f"fragment_{details['id']}_icon"] = {"path": f"images/collectibles/{details['icon_filename']}"}
-        for drone_id, config in DRONE_DATA.items():
-            if config.get("sprite_path"): asset_manifest["images"][f"drone_{drone_id}_select_preview"] = {"path": config["sprite_path"].replace("assets/", ""), "alpha": True}
-            if config.get("icon_path"): asset_manifest["images"][f"drone_{drone_id}_hud_icon"] = {"path": config["icon_path"].replace("assets/", ""), "alpha": True}
-            if config.get("ingame_sprite_path"): asset_manifest["images"][f"drone_{drone_id}_ingame_sprite"] = {"path": config["ingame_sprite_path"].replace("assets/", ""), "alpha": True}
-        entity_sprite_key_map = { "regular_enemy_sprite_key": gs.REGULAR_ENEMY_SPRITE_PATH, "prototype_drone_sprite_key": gs.PROTOTYPE_DRONE_SPRITE_PATH, "sentinel_drone_sprite_key": gs.SENTINEL_DRONE_SPRITE_PATH, "maze_guardian_sprite_key": gs.MAZE_GUARDIAN_SPRITE_PATH, }
-        for key, path_val in entity_sprite_key_map.items():
-            if path_val: asset_manifest["images"][key] = {"path": path_val.replace("assets/", ""), "alpha": True}
-        if 'shield' in POWERUP_TYPES and 'image_filename' in POWERUP_TYPES['shield']: asset_manifest["images"]["shield_powerup_icon"] = {"path": f"images/powerups/{POWERUP_TYPES['shield']['image_filename']}"}
-        if 'speed_boost' in POWERUP_TYPES and 'image_filename' in POWERUP_TYPES['speed_boost']: asset_manifest["images"]["speed_boost_powerup_icon"] = {"path": f"images/powerups/{POWERUP_TYPES['speed_boost']['image_filename']}"}
-        if 'weapon_upgrade' in POWERUP_TYPES and 'image_filename' in POWERUP_TYPES['weapon_upgrade']: asset_manifest["images"]["weapon_upgrade_powerup_icon"] = {"path": f"images/powerups/{POWERUP_TYPES['weapon_upgrade']['image_filename']}"}
-        ring_puzzle_image_keys = { "ring_puzzle_ring1_img": "images/puzzles/ring1.png", "ring_puzzle_ring2_img": "images/puzzles/ring2.png", "ring_puzzle_ring3_img": "images/puzzles/ring3.png" }
-        for key, path in ring_puzzle_image_keys.items(): asset_manifest["images"][key] = {"path": path, "alpha": True}
-        asset_manifest["images"]["ancient_terminal_sprite_img"] = {"path": "images/world/ancient_terminal.png", "alpha": True}
-        turret_image_path_map = { "turret_default_base_img": "level_elements/turret1.png", "turret_trishot_base_img": "level_elements/turret2.png", "turret_seeker_base_img": "level_elements/turret3.png", "turret_lightning_base_img": "level_elements/turret4.png", }
-        for key, rel_path in turret_image_path_map.items():
-            if rel_path: asset_manifest["images"][key] = {"path": f"images/{rel_path}", "alpha": True}
-        intro_data = self._load_intro_data_from_json_internal()
-        for screen in intro_data:
-            key = screen.get("image_path_key")
-            if key: asset_manifest["images"][key] = {"path": key, "alpha": True}
-        if hasattr(self.drone_system, 'all_lore_entries'):
-            for lore_id_val, lore_entry_val in self.drone_system.all_lore_entries.items():
-                if lore_entry_val and "image_path" in lore_entry_val and lore_entry_val["image_path"]:
-                    relative_lore_path = lore_entry_val["image_path"].replace("assets/", "", 1)
-                    asset_manifest["images"][f"lore_{lore_id_val}_image"] = {"path": relative_lore_path, "alpha": True}
-        self.asset_manager.preload_manifest(asset_manifest)
-        logger_gc.info("GameController: All assets preloaded via AssetManager.")
+    def _register_asset_manifests(self):
+        """
+        Registers every asset in the external manifest (ASSET_MANIFEST_PATH, kept in step with assets/ by
+        tools/validate_assets.py) with the AssetManager, and declares what each scene needs from its scene tags.
+        Images and sounds decode on the loader thread when their scene is entered (see SceneManager) or on first use;
+        ASSET_PRELOAD_ALL restores decoding the whole manifest before the first frame.
+        """
+        asset_manifest = load_asset_manifest(get_game_setting("ASSET_MANIFEST_PATH", os.path.join("data", "asset_manifest.json")))
+        if get_game_setting("ASSET_PRELOAD_ALL", False):
+            with startup_profiler.phase("preload_all"): self.asset_manager.preload_manifest(asset_manifest)
+            logger_gc.info("GameController: All assets preloaded via AssetManager.")
+        else: self.asset_manager.register_manifest(asset_manifest)
+
+        scene_assets = get_scene_assets(asset_manifest)
+        if "main_menu" in scene_assets: # The lives icon depends on the drone selected when the game starts, so it can't be a static tag
+            selected_drone_icon_key = f"drone_{self.drone_system.get_selected_drone_id()}_hud_icon"
+            scene_assets["main_menu"]["images"].append(selected_drone_icon_key); scene_assets["main_menu"]["critical"].append(selected_drone_icon_key)
+        for scene_key, assets in scene_assets.items():
+            self.asset_manager.register_scene_manifest(scene_key, assets["images"], assets["sounds"], assets["critical"])
 
     # --- ALL OTHER GameController methods are included below ---
     # ... (omitting for brevity, but the full code is in the Canvas)
     def play_sound(self, sound_asset_key, volume_multiplier=0.7):
-        sound = self.asset_manager.get_sound(sound_asset_key)
-        if sound:
-            try:
-                base_sfx_volume = gs.get_game_setting("SFX_VOLUME_MULTIPLIER", 0.7)
-                sound.set_volume(base_sfx_volume * volume_multiplier)
-                sound.play()
-            except pygame.error as e:
-                logger_gc.error(f"Error playing sound '{sound_asset_key}': {e}")
-        else:
-            logger_gc.debug(f"Sound with key '{sound_asset_key}' not found. Play attempt skipped.")
+        self.audio_manager.play(sound_asset_key, volume_multiplier) # Channel groups, voice limits and throttling (see AudioManager)
             
     def _create_or_reset_player(self, position, is_vault=False, preserve_weapon_on_reset=False):
         selected_drone_id = self.drone_system.get_selected_drone_id()
@@ -256,11 +224,13 @@ class GameController:
         return [
             {"label":"Base Max Health","key":"PLAYER_MAX_HEALTH","type":"numeric","min":50,"max":200,"step":10,"note":"Original Drone base, others vary"},
             {"label":"Starting Lives","key":"PLAYER_LIVES","type":"numeric","min":1,"max":9,"step":1},
-            {"label":"Base Speed","key":"PLAYER_SPEED","type":"numeric","min":1,"max":10,"step":1,"note":"Original Drone base, others vary"},
+            {"label":"Base Speed","key":"PLAYER_SPEED","type":"numeric","min":gs.scaled_px(1),"max":gs.scaled_px(10),"step":gs.scaled_px(1),
+             "is_scaled_px":True, "display_format": "{:g}", "note":"Original Drone base, others vary"},
             {"label":"Initial Weapon","key":"INITIAL_WEAPON_MODE","type":"choice",
              "choices":WEAPON_MODES_SEQUENCE, "get_display":lambda val:WEAPON_MODE_NAMES.get(val,"Unknown")},
             {"label":"Missile Damage","key":"MISSILE_DAMAGE","type":"numeric","min":10,"max":100,"step":5},
-            {"label":"Enemy Speed","key":"ENEMY_SPEED","type":"numeric","min":0.5,"max":5,"step":0.5},
+            {"label":"Enemy Speed","key":"ENEMY_SPEED","type":"numeric","min":gs.scaled_px(0.5),"max":gs.scaled_px(5),"step":gs.scaled_px(0.5),
+             "is_scaled_px":True, "display_format": "{:g}"},
             {"label":"Enemy Health","key":"ENEMY_HEALTH","type":"numeric","min":25,"max":300,"step":25},
             {"label":"Level Timer (sec)","key":"LEVEL_TIMER_DURATION","type":"numeric","min":60000,"max":300000,"step":15000,
              "is_ms_to_sec":True, "display_format": "{:.0f}s"},
@@ -370,38 +340,86 @@ class GameController:
         if state.startswith("architect_vault"): bg_color = ARCHITECT_VAULT_BG_COLOR
         elif state == GAME_STATE_MAZE_DEFENSE: bg_color = gs.DARK_GREY
         self.screen.fill(bg_color)
-        if self.maze: self.maze.draw(self.screen)
+        if not self.paused: self.frame_presenter.mark_full() # A running simulation can change anything; a paused one repaints the same frame
+        # The camera follows the (interpolated) player across mazes larger than the screen; everything below draws through it and skips what's out of view
+        camera = self.camera
+        camera.set_world_size(self.maze.get_world_size() if self.maze and hasattr(self.maze, 'get_world_size') else (WIDTH, GAME_PLAY_AREA_HEIGHT))
+        camera.follow(self.player.rect if self.player and self.player.alive else None); camera.reset_stats()
+        if self.maze: self.maze.draw(self.screen, camera) # Walls are line primitives under every layer, so they draw straight away
+        # Everything else is queued by layer and flushed in a handful of blits calls, health bars last in one overlay pass
+        render_queue = self.render_queue
         if state != GAME_STATE_MAZE_DEFENSE:
             for group in [self.collectible_rings_group, self.core_fragments_group, self.vault_logs_group, self.glyph_tablets_group, self.architect_echoes_group, self.alien_terminals_group]:
-                group.draw(self.screen)
-        self.power_ups_group.draw(self.screen); self.escape_zone_group.draw(self.screen); self.explosion_particles_group.draw(self.screen)
-        if state == GAME_STATE_ARCHITECT_VAULT_ENTRY_PUZZLE: self.architect_vault_puzzle_terminals_group.draw(self.screen)
+                render_queue.submit_sprites(render_queue.LAYER_GROUND, group, camera)
+        for group in [self.power_ups_group, self.escape_zone_group, self.explosion_particles_group]: render_queue.submit_sprites(render_queue.LAYER_GROUND, group, camera)
+        if state == GAME_STATE_ARCHITECT_VAULT_ENTRY_PUZZLE: render_queue.submit_sprites(render_queue.LAYER_GROUND, self.architect_vault_puzzle_terminals_group, camera)
         if state == GAME_STATE_MAZE_DEFENSE:
-            self.reactor_group.draw(self.screen)
-            for turret in self.turrets_group: turret.draw(self.screen)
-            if self.player and self.player.alive: self.player.draw(self.screen)
+            render_queue.submit_sprites(render_queue.LAYER_STRUCTURES, self.reactor_group, camera)
+            for turret in self.turrets_group: turret.submit_draw(render_queue, camera)
         if self.combat_controller:
-            if self.combat_controller.enemy_manager: self.combat_controller.enemy_manager.draw_all(self.screen)
-            if self.combat_controller.boss_active and self.combat_controller.maze_guardian: self.combat_controller.maze_guardian.draw(self.screen)
-        if self.player and (state != GAME_STATE_MAZE_DEFENSE or (self.player and self.player.alive)):
+            if self.combat_controller.enemy_manager: self.combat_controller.enemy_manager.submit_all(render_queue, camera)
+            if self.combat_controller.boss_active and self.combat_controller.maze_guardian: self.combat_controller.maze_guardian.submit_draw(render_queue, camera)
+        if self.player and (state != GAME_STATE_MAZE_DEFENSE or self.player.alive):
              if self.player.alive or any(getattr(self.player, g, None) for g in ['bullets_group', 'missiles_group', 'lightning_zaps_group']):
-                 self.player.draw(self.screen)
+                 self.player.submit_draw(render_queue, camera)
+        render_queue.flush(self.screen)
     
     def run(self):
         self.check_and_apply_screen_settings_change()
+        pixels_presented = None
+        startup_profiler.begin("first_frame")
         while True:
-            delta_time_ms = self.clock.tick(gs.get_game_setting("FPS", 60))
+            current_game_state = self.scene_manager.get_current_state()
+            delta_time_ms = self.frame_pacer.tick(gs.get_game_setting("FPS", 60), (current_game_state, self.paused), scene_static=pixels_presented == 0,
+                                                  idle_allowed=self.paused or current_game_state in IDLE_THROTTLE_STATES)
             self.event_manager.process_events()
-            self.update(delta_time_ms)
+            interpolation_alpha = self._advance_simulation(delta_time_ms)
             current_game_state = self.scene_manager.get_current_state()
             if current_game_state == GAME_STATE_GAME_INTRO_SCROLL: self.ui_manager.draw_current_scene_ui()
             elif current_game_state == GAME_STATE_RING_PUZZLE:
-                self.screen.fill(gs.DARK_GREY); self.puzzle_controller.draw_active_puzzle(self.screen)
+                self.screen.fill(gs.DARK_GREY); self.puzzle_controller.draw_active_puzzle(self.screen); self.frame_presenter.mark_full()
             elif current_game_state in [GAME_STATE_PLAYING, GAME_STATE_BONUS_LEVEL_PLAYING, GAME_STATE_MAZE_DEFENSE] or current_game_state.startswith("architect_vault"):
-                self._draw_game_world(); self.ui_manager.draw_current_scene_ui() 
+                self.sprite_interpolator.apply(interpolation_alpha)
+                try: self._draw_game_world()
+                finally: self.sprite_interpolator.restore()
+                self.ui_manager.draw_current_scene_ui() 
             else: self.ui_manager.draw_current_scene_ui()
-            pygame.display.flip()
+            pixels_presented = self.frame_presenter.present()
+            if not startup_profiler.finished: startup_profiler.finish() # The first frame is on screen
+            self.frame_profiler.record_frame(delta_time_ms, pixels_presented)
             
+    def _advance_simulation(self, delta_time_ms):
+        """
+        Runs as many fixed SIMULATION_TICK_RATE ticks as the elapsed frame time allows, at most
+        SIMULATION_MAX_TICKS_PER_FRAME (any further backlog is dropped, so a slow machine loses
+        smoothness rather than game speed). Returns how far the leftover time reaches into the
+        next tick, used to interpolate sprite positions when drawing.
+        """
+        tick_ms = 1000.0 / max(1, gs.get_game_setting("SIMULATION_TICK_RATE", 60))
+        max_ticks = max(1, gs.get_game_setting("SIMULATION_MAX_TICKS_PER_FRAME", 5))
+        self.simulation_accumulator_ms += delta_time_ms
+        ticks_run = 0
+        while self.simulation_accumulator_ms >= tick_ms:
+            if ticks_run >= max_ticks:
+                logger_gc.debug(f"Simulation fell behind, dropping {self.simulation_accumulator_ms:.1f} ms of backlog.")
+                self.simulation_accumulator_ms %= tick_ms; break
+            self.sprite_interpolator.capture(self._get_interpolated_sprites())
+            self.event_manager.process_continuous_input()
+            self.update(tick_ms)
+            self.simulation_accumulator_ms -= tick_ms; ticks_run += 1
+        return self.simulation_accumulator_ms / tick_ms
+
+    def _get_interpolated_sprites(self):
+        """Moving world sprites whose drawn positions are interpolated between simulation ticks."""
+        sprites = list(self.explosion_particles_group)
+        if self.player: sprites.append(self.player); sprites.extend(self.player.bullets_group); sprites.extend(self.player.missiles_group)
+        if self.combat_controller:
+            if self.combat_controller.enemy_manager:
+                for enemy in self.combat_controller.enemy_manager.get_sprites(): sprites.append(enemy); sprites.extend(getattr(enemy, 'bullets', ()))
+            if self.combat_controller.boss_active and self.combat_controller.maze_guardian:
+                sprites.append(self.combat_controller.maze_guardian); sprites.extend(getattr(self.combat_controller.maze_guardian, 'bullets', ()))
+        return sprites
+
     def update(self, delta_time_ms):
         current_time_ms = pygame.time.get_ticks()
         current_game_state = self.scene_manager.get_current_state()
@@ -493,7 +511,7 @@ class GameController:
         for ring_sprite in pygame.sprite.spritecollide(self.player, self.collectible_rings_group, True, pygame.sprite.collide_rect_ratio(0.7)):
             self.score += 10; self.play_sound('collect_ring'); self.collected_rings_count += 1; self.drone_system.add_player_cores(5)
             anim_surf = self.asset_manager.get_image("ring_ui_icon", scale_to_size=(15, 15))
-            if anim_surf: self.animating_rings_to_hud.append({'pos': list(ring_sprite.rect.center), 'target_pos': self.ring_ui_target_pos, 'speed': 15, 'surface': anim_surf})
+            if anim_surf: self.animating_rings_to_hud.append({'pos': list(self.camera.apply_point(ring_sprite.rect.center)), 'target_pos': self.ring_ui_target_pos, 'speed': 15, 'surface': anim_surf})
             self._check_level_clear_condition();
             if self.level_cleared_pending_animation: break
         for frag_sprite in pygame.sprite.spritecollide(self.player, self.core_fragments_group, True, pygame.sprite.collide_rect_ratio(0.7)):
@@ -506,7 +524,7 @@ class GameController:
                     if unlocked_lore: self.set_story_message(f"Lore: {self.drone_system.get_lore_entry_details(unlocked_lore[0]).get('title', 'New Data')}")
                 if frag_id and not any(a.get('id') == frag_id for a in self.animating_fragments_to_hud) and frag_id not in self.hud_displayed_fragments:
                     icon_surf = self.asset_manager.get_image(f"fragment_{frag_id}_icon", scale_to_size=(28,28)); target_pos = self.fragment_ui_target_positions.get(frag_id)
-                    if icon_surf and target_pos: self.animating_fragments_to_hud.append({'pos': list(frag_sprite.rect.center), 'target_pos': target_pos, 'speed': 12, 'surface': icon_surf, 'id': frag_id})
+                    if icon_surf and target_pos: self.animating_fragments_to_hud.append({'pos': list(self.camera.apply_point(frag_sprite.rect.center)), 'target_pos': target_pos, 'speed': 12, 'surface': icon_surf, 'id': frag_id})
                 if self.drone_system and self.drone_system.are_all_core_fragments_collected(): self.set_story_message("All Core Fragments Acquired! Vault Access Imminent!", 4000)
                 self._check_level_clear_condition()
         for item_group, sound_key, score_val, lore_prefix in [(self.vault_logs_group, 'collect_log', 50, "collect_log_"), (self.glyph_tablets_group, 'collect_log', 75, "collect_glyph_tablet_"), (self.architect_echoes_group, 'collect_fragment', 150, "collect_echo_")]:
@@ -536,9 +554,17 @@ class GameController:
             state = self.scene_manager.get_current_state()
             if state == GAME_STATE_PLAYING or (state == GAME_STATE_BONUS_LEVEL_PLAYING and self.player): self._reset_level_timer_internal()
 
+    def _get_display_flags(self):
+        """
+        Below a RENDER_SCALE of 1 the display surface is the smaller internal render target, and
+        pygame.SCALED has SDL upscale it to the window or screen on the GPU when presenting.
+        """
+        flags = pygame.FULLSCREEN if gs.get_game_setting("FULLSCREEN_MODE") else 0
+        if gs.RENDER_SCALE < 1.0: flags |= pygame.SCALED # The same module constant scaled_px, WIDTH and HEIGHT were derived from
+        return flags
+
     def check_and_apply_screen_settings_change(self):
-        fullscreen = gs.get_game_setting("FULLSCREEN_MODE")
-        flags = pygame.FULLSCREEN if fullscreen else 0
+        flags = self._get_display_flags()
         w, h = gs.get_game_setting("WIDTH"), gs.get_game_setting("HEIGHT")
         current_w, current_h = self.screen.get_size()
         if self.screen_flags != flags or current_w != w or current_h != h:
@@ -775,6 +801,7 @@ class GameController:
         self.scene_manager.set_game_state(GAME_STATE_LEADERBOARD)
     def toggle_pause(self):
         self.paused = not self.paused; logger_gc.debug(f"Pause state: {self.paused}")
+        self.frame_presenter.mark_full()
         if self.scene_manager: self.scene_manager._update_music()
         if not self.paused:
             t = pygame.time.get_ticks(); state = self.scene_manager.get_current_state()
@@ -822,14 +849,15 @@ class GameController:
             self.puzzle_controller.set_active_entities(self.player, self.drone_system, self.scene_manager, architect_vault_terminals_group=self.architect_vault_puzzle_terminals_group)
             self.initialize_architect_vault_session_phases(kwargs.get('phase_to_start', 'intro'))
         elif mode_type == "maze_defense":
+            from entities import MazeChapter2, CoreReactor # Imported the first time defense mode starts
             self.level, self.score, self.lives = 1, 0, get_game_setting("PLAYER_LIVES")
             if self.drone_system: self.drone_system.reset_collected_fragments_in_storage(); self.drone_system.reset_architect_vault_status()
             self.maze, self.player = MazeChapter2(game_area_x_offset=0, maze_type="chapter2_tilemap"), None
             if pos := self.maze.get_core_reactor_spawn_position_abs(): self.reactor_group.add(CoreReactor(pos[0], pos[1], health=gs.get_game_setting("DEFENSE_REACTOR_HEALTH", 1000)))
             else: self.scene_manager.set_game_state(GAME_STATE_MAIN_MENU); return
             self.combat_controller.set_active_entities(player=None, maze=self.maze, core_reactor=self.reactor_group.sprite, turrets_group=self.turrets_group, explosion_particles_group=self.explosion_particles_group)
-            self.combat_controller.wave_manager.start_first_build_phase(); self.is_build_phase = True
-            if hasattr(self.ui_manager, 'build_menu') and self.ui_manager.build_menu: self.ui_manager.build_menu.activate()
+            self.combat_controller.get_wave_manager().start_first_build_phase(); self.is_build_phase = True
+            if build_menu := self.ui_manager.get_build_menu(): build_menu.activate()
         elif mode_type == "bonus_level_start":
             if hasattr(self.ui_manager, 'build_menu') and self.ui_manager.build_menu: self.ui_manager.build_menu.deactivate()
             self.maze = Maze(game_area_x_offset=0, maze_type="bonus")
@@ -9,7 +9,6 @@ from game_settings import (
 )
 
 from entities import AncientAlienTerminal
-from .ring_puzzle_module import RingPuzzle
 
 class PuzzleController:
     """
@@ -108,6 +107,7 @@ class PuzzleController:
         ]
         
         try:
+            from .ring_puzzle_module import RingPuzzle # Loaded with the first terminal, not at startup
             self.current_ring_puzzle = RingPuzzle(
                 gs.get_game_setting("WIDTH"), 
                 gs.get_game_setting("HEIGHT"),
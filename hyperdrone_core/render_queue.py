@@ -0,0 +1,79 @@
+# hyperdrone_core/render_queue.py
+import logging
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+class RenderQueue:
+    """
+    Collects the game world's draw commands for one frame and emits them in layer order.
+    Entities submit (layer, surface, position) blits, plus callbacks for the few primitives that aren't
+    blits (shield outlines, lightning), via their submit_draw(render_queue, camera) methods.
+    flush() walks the layers once and sends each run of consecutive blits to the target in a single
+    Surface.blits call. Health bars are collected separately and drawn in one overlay pass above
+    every layer, from small cached bar surfaces.
+    Entities can't import hyperdrone_core, so they read the layer numbers off the queue instance.
+    """
+    LAYER_GROUND = 0 # Collectibles, power-ups, escape zones, explosion particles
+    LAYER_STRUCTURES = 10 # Core reactor, turrets
+    LAYER_UNITS = 20 # Enemies, the guardian, the player
+    LAYER_PROJECTILES = 30 # Bullets, missiles, lightning, laser beams
+
+    def __init__(self, max_cached_health_bars=512):
+        self._layers = {}
+        self._health_bars = []
+        self._health_bar_cache = {}
+        self.max_cached_health_bars = max_cached_health_bars
+        self.last_frame_commands = 0
+        self.last_frame_blit_calls = 0
+
+    def submit(self, layer, surface, dest):
+        self._layers.setdefault(layer, []).append((surface, dest))
+
+    def submit_callback(self, layer, draw_callback):
+        """Queues draw_callback(target) for a primitive that can't be expressed as a blit."""
+        self._layers.setdefault(layer, []).append(draw_callback)
+
+    def submit_sprites(self, layer, sprites, camera):
+        """Queues the image of every sprite in view, shifted into view space."""
+        offset_x, offset_y = camera.offset
+        self._layers.setdefault(layer, []).extend((sprite.image, sprite.rect.move(-offset_x, -offset_y)) for sprite in camera.visible_sprites(sprites) if getattr(sprite, 'image', None))
+
+    def submit_health_bar(self, bar_rect, filled_width, fill_color, background_color, border_color=(255, 255, 255)):
+        """Queues a health bar for the overlay pass: background, a fill filled_width pixels wide, a 1px border."""
+        self._health_bars.append((pygame.Rect(bar_rect), int(filled_width), fill_color, background_color, border_color))
+
+    def _get_health_bar_surface(self, size, filled_width, fill_color, background_color, border_color):
+        cache_key = (size, filled_width, fill_color, background_color, border_color)
+        bar_surface = self._health_bar_cache.get(cache_key)
+        if bar_surface is None:
+            if len(self._health_bar_cache) >= self.max_cached_health_bars: self._health_bar_cache.clear()
+            bar_surface = pygame.Surface(size).convert()
+            bar_surface.fill(background_color)
+            if filled_width > 0: bar_surface.fill(fill_color, (0, 0, filled_width, size[1]))
+            pygame.draw.rect(bar_surface, border_color, bar_surface.get_rect(), 1)
+            self._health_bar_cache[cache_key] = bar_surface
+        return bar_surface
+
+    def _blits(self, target, blit_sequence):
+        target.blits(blit_sequence, False)
+        self.last_frame_blit_calls += 1
+
+    def flush(self, target):
+        """Draws everything queued this frame onto target and empties the queue."""
+        self.last_frame_commands = sum(len(commands) for commands in self._layers.values()) + len(self._health_bars)
+        self.last_frame_blit_calls = 0
+        for layer in sorted(self._layers):
+            blit_run = []
+            for command in self._layers[layer]:
+                if callable(command):
+                    if blit_run: self._blits(target, blit_run); blit_run = []
+                    command(target)
+                else: blit_run.append(command)
+            if blit_run: self._blits(target, blit_run)
+        if self._health_bars:
+            self._blits(target, [(self._get_health_bar_surface(bar_rect.size, filled_width, fill_color, background_color, border_color), bar_rect.topleft)
+                                 for bar_rect, filled_width, fill_color, background_color, border_color in self._health_bars if bar_rect.width > 0 and bar_rect.height > 0])
+        self._layers.clear(); self._health_bars.clear()
@@ -11,7 +11,7 @@ from game_settings import (
     GAME_STATE_ARCHITECT_VAULT_INTRO, GAME_STATE_ARCHITECT_VAULT_ENTRY_PUZZLE,
     GAME_STATE_ARCHITECT_VAULT_GAUNTLET, GAME_STATE_ARCHITECT_VAULT_EXTRACTION,
     GAME_STATE_ARCHITECT_VAULT_SUCCESS, GAME_STATE_ARCHITECT_VAULT_FAILURE,
-    GAME_STATE_RING_PUZZLE, GAME_STATE_GAME_INTRO_SCROLL, GAME_STATE_MAZE_DEFENSE
+    GAME_STATE_RING_PUZZLE, GAME_STATE_GAME_INTRO_SCROLL, GAME_STATE_MAZE_DEFENSE, GAME_STATE_LOADING
 )
 
 class SceneManager:
@@ -28,6 +28,11 @@ class SceneManager:
         # Music paths are now handled by AssetManager. We only need to track the current music's key.
         self.current_music_context_key = None 
 
+        # A transition whose critical assets are still loading waits in GAME_STATE_LOADING
+        self.pending_transition = None # (new_state, kwargs) entered once the assets are ready
+        self.state_before_loading = None
+
+        self.asset_manager.load_scene_assets(*self._get_asset_scene_keys(self.current_state)) # Nothing can draw a loading screen yet
         self._update_music() # Initial music play
 
     def get_current_state(self):
@@ -107,6 +112,22 @@ class SceneManager:
                     self._play_music(self.current_music_context_key)
 
 
+    def _get_asset_scene_keys(self, state):
+        """The asset scenes (registered by GameController) a game state draws from."""
+        gameplay_states = (GAME_STATE_PLAYING, GAME_STATE_BONUS_LEVEL_START, GAME_STATE_BONUS_LEVEL_PLAYING)
+        asset_scene_map = {
+            GAME_STATE_MAIN_MENU: ("main_menu",),
+            GAME_STATE_DRONE_SELECT: ("main_menu", "drone_select"),
+            GAME_STATE_CODEX: ("main_menu", "codex"),
+            GAME_STATE_GAME_INTRO_SCROLL: ("intro",),
+            GAME_STATE_RING_PUZZLE: ("puzzle",),
+            GAME_STATE_MAZE_DEFENSE: ("gameplay", "defense"),
+        }
+        if state in asset_scene_map: return asset_scene_map[state]
+        elif state in gameplay_states: return ("gameplay",)
+        elif state.startswith("architect_vault"): return ("gameplay", "vault")
+        return ("main_menu",) # Settings, leaderboard, name entry, game over
+
     def set_game_state(self, new_state, **kwargs):
         """
         Sets the current game state and notifies the GameController to initialize
@@ -120,7 +141,17 @@ class SceneManager:
             if not (is_gameplay_state and hasattr(self.game_controller, 'paused') and self.game_controller.paused):
                 return
 
+        if not self.asset_manager.request_scene_assets(*self._get_asset_scene_keys(new_state)):
+            # Critical assets are still decoding: show the loading scene and finish the transition from update()
+            if self.current_state != GAME_STATE_LOADING: self.state_before_loading = self.current_state
+            self.pending_transition = (new_state, kwargs)
+            self.current_state = GAME_STATE_LOADING
+            print(f"SceneManager: Loading assets for '{new_state}'...")
+            return
+
         old_state = self.current_state
+        if old_state == GAME_STATE_LOADING: old_state = self.state_before_loading # The scene being left, as far as the game is concerned
+        self.pending_transition = None
         self.current_state = new_state
         print(f"SceneManager: Game state changed from '{old_state}' to: '{self.current_state}'")
 
@@ -139,6 +170,13 @@ class SceneManager:
         current_time = pygame.time.get_ticks()
         current_state = self.get_current_state()
 
+        self.asset_manager.process_async_loads(gs.get_game_setting("ASSET_CONVERT_BUDGET_MS", 4))
+        if current_state == GAME_STATE_LOADING:
+            if self.pending_transition and self.asset_manager.scene_assets_ready():
+                new_state, kwargs = self.pending_transition
+                self.set_game_state(new_state, **kwargs)
+            return
+
         if current_state == GAME_STATE_ARCHITECT_VAULT_INTRO:
             if hasattr(self.game_controller, 'architect_vault_message_timer') and \
                hasattr(self.game_controller, 'architect_vault_current_phase') and \
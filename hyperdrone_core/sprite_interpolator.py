@@ -0,0 +1,40 @@
+# hyperdrone_core/sprite_interpolator.py
+import logging
+
+import game_settings as gs
+
+logger = logging.getLogger(__name__)
+
+
+class SpriteInterpolator:
+    """
+    Smooths rendering between fixed simulation ticks. capture() records where each moving sprite's rect
+    was centred before a tick; apply(alpha) re-centres every tracked rect on previous + (current - previous) * alpha
+    for drawing, and restore() puts the simulated positions back before anything else reads them. Centres rather
+    than corners are interpolated because rotating sprites swap to frames of a different size every tick.
+    Sprites that appeared during the tick, or jumped further than max_jump layout pixels (respawns, wrap-arounds),
+    are drawn where the simulation left them.
+    """
+    def __init__(self, enabled=True, max_jump=96):
+        self.enabled = enabled
+        self.max_jump = gs.scaled_px(max_jump)
+        self._previous = {} # sprite -> rect.center before the last tick
+        self._applied = [] # (sprite, simulated center) for rects moved by apply()
+
+    def capture(self, sprites):
+        self._previous = {sprite: sprite.rect.center for sprite in sprites if getattr(sprite, 'rect', None)} if self.enabled else {}
+
+    def apply(self, alpha):
+        if self._applied: self.restore()
+        for sprite, (prev_x, prev_y) in self._previous.items():
+            rect = getattr(sprite, 'rect', None)
+            if not rect: continue
+            dx, dy = rect.centerx - prev_x, rect.centery - prev_y
+            if (dx == 0 and dy == 0) or abs(dx) > self.max_jump or abs(dy) > self.max_jump: continue
+            self._applied.append((sprite, rect.center))
+            rect.center = (round(prev_x + dx * alpha), round(prev_y + dy * alpha))
+
+    def restore(self):
+        for sprite, center in self._applied:
+            if getattr(sprite, 'rect', None): sprite.rect.center = center
+        self._applied.clear()
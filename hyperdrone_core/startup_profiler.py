@@ -0,0 +1,108 @@
+# hyperdrone_core/startup_profiler.py
+import contextlib
+import json
+import logging
+import threading
+import time
+
+import game_settings as gs
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfiler:
+    """
+    Timeline of the launch, from the first line of main.py to the first presented frame. Named phases nest
+    (begin()/end() or the phase() context manager) and record wall and main-thread CPU time; AssetManager
+    reports every file it loads through measure_asset(), which adds up per-category totals and lists files
+    slower than file_threshold_ms under the phase that loaded them. finish() closes the timeline, logs a
+    summary and, if report_path is set (main.py --startup-report), writes the report as JSON.
+    Everything becomes a no-op once finished, so the hooks cost nothing after startup.
+    """
+    REPORT_VERSION = 1
+
+    def __init__(self, file_threshold_ms=5.0):
+        self.origin_wall = time.perf_counter()
+        self.origin_cpu = time.thread_time()
+        self.file_threshold_ms = file_threshold_ms
+        self.report_path = None
+        self.finished = False
+        self.phases = [] # {"name", "path", "depth", "start_ms", "wall_ms", "cpu_ms"} in completion order
+        self.asset_totals = {} # category -> {"count", "wall_ms", "cpu_ms"}
+        self.slow_files = [] # {"category", "path", "phase", "wall_ms", "cpu_ms"}
+        self._open_phases = [] # (name, start wall, start cpu)
+        self._lock = threading.Lock() # The asset loader thread reports files too
+        self._report = None
+
+    def set_origin(self, wall_time, cpu_time):
+        """Moves the start of the timeline back to an earlier perf_counter()/thread_time() reading (taken before imports)."""
+        self.origin_wall, self.origin_cpu = wall_time, cpu_time
+
+    def _current_path(self):
+        return "/".join(name for name, _, _ in self._open_phases)
+
+    def begin(self, name):
+        if self.finished: return
+        self._open_phases.append((name, time.perf_counter(), time.thread_time()))
+
+    def end(self):
+        if self.finished or not self._open_phases: return
+        path = self._current_path()
+        name, start_wall, start_cpu = self._open_phases.pop()
+        self._record_phase(name, path, start_wall, start_cpu)
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        self.begin(name)
+        try: yield
+        finally: self.end()
+
+    def record_span(self, name, start_wall, start_cpu):
+        """Records a phase that was timed before the profiler could be reached (e.g. main.py's imports)."""
+        if self.finished: return
+        self._record_phase(name, "/".join(filter(None, (self._current_path(), name))), start_wall, start_cpu)
+
+    def _record_phase(self, name, path, start_wall, start_cpu):
+        self.phases.append({"name": name, "path": path, "depth": path.count("/"), "start_ms": (start_wall - self.origin_wall) * 1000.0,
+                            "wall_ms": (time.perf_counter() - start_wall) * 1000.0, "cpu_ms": (time.thread_time() - start_cpu) * 1000.0})
+
+    @contextlib.contextmanager
+    def measure_asset(self, category, path):
+        """Times loading one file of an asset category (images, sounds, fonts) on whichever thread loads it."""
+        if self.finished:
+            yield; return
+        start_wall, start_cpu = time.perf_counter(), time.thread_time()
+        try: yield
+        finally:
+            if not self.finished:
+                wall_ms, cpu_ms = (time.perf_counter() - start_wall) * 1000.0, (time.thread_time() - start_cpu) * 1000.0
+                with self._lock:
+                    totals = self.asset_totals.setdefault(category, {"count": 0, "wall_ms": 0.0, "cpu_ms": 0.0})
+                    totals["count"] += 1; totals["wall_ms"] += wall_ms; totals["cpu_ms"] += cpu_ms
+                    if wall_ms >= self.file_threshold_ms:
+                        self.slow_files.append({"category": category, "path": str(path), "phase": self._current_path() if threading.current_thread() is threading.main_thread() else "background",
+                                                "wall_ms": wall_ms, "cpu_ms": cpu_ms})
+
+    def finish(self):
+        """Closes the timeline (and any phase left open), logs a summary and writes the report if asked to. Returns the report."""
+        if self.finished: return self._report
+        while self._open_phases: self.end()
+        self.finished = True
+        with self._lock:
+            self._report = {
+                "version": self.REPORT_VERSION, "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "total_wall_ms": (time.perf_counter() - self.origin_wall) * 1000.0, "total_cpu_ms": (time.thread_time() - self.origin_cpu) * 1000.0,
+                "phases": sorted(self.phases, key=lambda phase: phase["start_ms"]), "asset_totals": self.asset_totals,
+                "slow_files": sorted(self.slow_files, key=lambda entry: -entry["wall_ms"]), "file_threshold_ms": self.file_threshold_ms
+            }
+        top_phases = ", ".join(f"{phase['name']} {phase['wall_ms']:.0f}" for phase in self._report["phases"] if phase["depth"] == 0)
+        logger.info(f"StartupProfiler: First frame after {self._report['total_wall_ms']:.0f} ms ({top_phases} ms).")
+        if self.report_path:
+            try:
+                with open(self.report_path, "w", encoding="utf-8") as report_file: json.dump(self._report, report_file, indent=2)
+                logger.info(f"StartupProfiler: Report written to '{self.report_path}'.")
+            except OSError as e: logger.error(f"StartupProfiler: Could not write report to '{self.report_path}': {e}")
+        return self._report
+
+
+startup_profiler = StartupProfiler(gs.get_game_setting("STARTUP_SLOW_FILE_MS", 5.0)) # Shared by main.py, GameController and AssetManager
@@ -0,0 +1,78 @@
+# hyperdrone_core/texture_atlas.py
+import logging
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+class TextureAtlas:
+    """
+    Packs small images (AssetManager only hands it the manifest's original icons, glyphs and small sprites,
+    a fixed set) into a few large per-pixel-alpha pages.
+    add() copies an image into the first shelf with room and returns a subsurface of its page, which
+    callers use exactly like the original Surface; directory maps each key to its (page index, rect).
+    Images larger than max_image_size on either side, or without per-pixel alpha, aren't accepted.
+    Nothing is ever removed, so subsurfaces stay valid for the atlas's lifetime; like the sprite cache,
+    they are shared and must be copied before being drawn on or alpha-modified.
+    """
+    def __init__(self, page_size=512, max_image_size=128):
+        self.page_size = max(1, int(page_size))
+        self.max_image_size = min(self.page_size, max(1, int(max_image_size)))
+        self.pages = []
+        self.directory = {} # key -> (page index, Rect)
+        self._subsurfaces = {} # key -> subsurface handed out by add()
+        self._shelves = [] # per page: [[y, height, next free x], ...]
+        self._page_heights = [] # per page: first y not used by a shelf
+
+    def accepts(self, surface):
+        width, height = surface.get_size()
+        return 0 < width <= self.max_image_size and 0 < height <= self.max_image_size and bool(surface.get_flags() & pygame.SRCALPHA)
+
+    def get(self, key):
+        return self._subsurfaces.get(key)
+
+    def _new_page(self):
+        page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+        try: page = page.convert_alpha() # Same pixel format as the converted images it holds
+        except pygame.error: pass
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page); self._shelves.append([]); self._page_heights.append(0)
+        logger.info(f"TextureAtlas: Opened page {len(self.pages)} ({self.page_size}x{self.page_size}).")
+        return len(self.pages) - 1
+
+    def _allocate(self, width, height):
+        """Finds room for a width x height image: the snuggest existing shelf, else a new shelf, else a new page."""
+        best = None
+        for page_index, shelves in enumerate(self._shelves):
+            for shelf in shelves:
+                if height <= shelf[1] and shelf[2] + width <= self.page_size and (best is None or shelf[1] < best[1][1]): best = (page_index, shelf)
+        if best is None:
+            page_index = next((i for i, used_height in enumerate(self._page_heights) if used_height + height <= self.page_size), None)
+            if page_index is None: page_index = self._new_page()
+            shelf = [self._page_heights[page_index], height, 0]
+            self._shelves[page_index].append(shelf); self._page_heights[page_index] += height
+            best = (page_index, shelf)
+        page_index, shelf = best
+        rect = pygame.Rect(shelf[2], shelf[0], width, height); shelf[2] += width
+        return page_index, rect
+
+    def add(self, key, surface):
+        """Packs surface under key and returns its subsurface (the existing one if key is already packed)."""
+        subsurface = self._subsurfaces.get(key)
+        if subsurface is not None: return subsurface
+        page_index, rect = self._allocate(*surface.get_size())
+        page = self.pages[page_index]
+        page.blit(surface, rect, special_flags=pygame.BLEND_RGBA_MAX) # Onto transparent pixels, MAX copies colour and alpha exactly
+        subsurface = self._subsurfaces[key] = page.subsurface(rect)
+        self.directory[key] = (page_index, rect)
+        return subsurface
+
+    def get_page_bytes(self):
+        """Pixel memory of every page, used or not."""
+        return sum(page.get_width() * page.get_height() * page.get_bytesize() for page in self.pages)
+
+    def get_stats(self):
+        used_pixels = sum(rect.width * rect.height for _, rect in self.directory.values())
+        total_pixels = len(self.pages) * self.page_size * self.page_size
+        return {"pages": len(self.pages), "images": len(self.directory), "fill_ratio": used_pixels / total_pixels if total_pixels else 0.0}
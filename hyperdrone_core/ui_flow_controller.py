@@ -1,6 +1,5 @@
 # hyperdrone_core/ui_flow_controller.py
 import pygame
-import random
 import logging
 
 import game_settings as gs
@@ -16,6 +15,8 @@ from game_settings import (
     SETTINGS_MODIFIED
 )
 
+from ui.starfield import Starfield
+
 logger = logging.getLogger(__name__)
 
 class UIFlowController:
@@ -33,7 +34,7 @@ class UIFlowController:
         # Menu state variables
         self.menu_options = ["Start Game", "Maze Defense", "Select Drone", "Codex", "Settings", "Leaderboard", "Quit"]
         self.selected_menu_option = 0
-        self.menu_stars = self._create_stars(200)
+        self.menu_stars = Starfield(gs.get_game_setting("MENU_STAR_COUNT", 200), WIDTH, HEIGHT, layers=gs.get_game_setting("MENU_STAR_LAYERS", 1))
 
         # Drone Select state variables
         self.drone_select_options = []
@@ -106,23 +107,7 @@ class UIFlowController:
     def update(self, current_time_ms, delta_time_ms, current_game_state):
         """Called every frame to update UI animations or timed transitions."""
         if current_game_state == GAME_STATE_MAIN_MENU:
-            if self.menu_stars:
-                for star in self.menu_stars:
-                    star[1] += star[2] * (delta_time_ms / 1000.0)
-                    if star[1] > HEIGHT:
-                        star[0] = random.randint(0, WIDTH)
-                        star[1] = 0
-
-    def _create_stars(self, num_stars):
-        """Helper to create a list of star parameters for background effects."""
-        stars = []
-        for _ in range(num_stars):
-            x = random.randint(0, WIDTH)
-            y = random.randint(0, HEIGHT)
-            speed = random.uniform(10, 50)
-            size = random.uniform(0.5, 2)
-            stars.append([x, y, speed, size])
-        return stars
+            if self.menu_stars: self.menu_stars.update(delta_time_ms)
 
     # --- Initialization Methods for Each UI State ---
     def initialize_main_menu(self):
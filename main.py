@@ -1,3 +1,6 @@
+import time
+launch_wall_time, launch_cpu_time = time.perf_counter(), time.thread_time() # Start of the startup timeline, before any heavy import
+
 import sys
 import traceback
 import pygame
@@ -5,7 +8,21 @@ import logging
 
 logging.basicConfig(level=logging.INFO)
 
+import game_settings as gs
 from hyperdrone_core.game_loop import GameController
+from hyperdrone_core.startup_profiler import startup_profiler
+
+startup_profiler.set_origin(launch_wall_time, launch_cpu_time)
+startup_profiler.record_span("imports", launch_wall_time, launch_cpu_time)
+
+
+def get_startup_report_path(argv):
+    """The report path requested with --startup-report [path] (STARTUP_REPORT_PATH when no path follows), or None."""
+    if "--startup-report" not in argv: return None
+    flag_index = argv.index("--startup-report")
+    if flag_index + 1 < len(argv) and not argv[flag_index + 1].startswith("--"): return argv[flag_index + 1]
+    return gs.get_game_setting("STARTUP_REPORT_PATH", "startup_report.json")
+
 
 if __name__ == '__main__':
     """
@@ -13,9 +30,10 @@ if __name__ == '__main__':
     Initializes the GameController and starts the game loop.
     """
     logging.info("Starting Hyperdrone...")
+    startup_profiler.report_path = get_startup_report_path(sys.argv[1:])
     try:
         # Create an instance of the GameController
-        game_controller = GameController() #
+        with startup_profiler.phase("game_controller"): game_controller = GameController() #
         # Start the main game loop
         game_controller.run() #
     except Exception as e: #
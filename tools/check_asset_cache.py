@@ -0,0 +1,51 @@
+# tools/check_asset_cache.py
+"""
+Self-check of the disk cache's invalidation (hyperdrone_core/asset_cache.py), run in a temporary folder:
+an entry named by the manifest hash must survive a touch that only changes the mtime, and must miss once the
+source is edited in place to different pixels of the same byte size. Exits with status 1 on any failure.
+
+    python tools/check_asset_cache.py
+"""
+import os
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import pygame
+
+from hyperdrone_core.asset_cache import AssetDiskCache
+from hyperdrone_core.asset_manifest import hash_asset_file
+
+
+def _write_image(file_path, color):
+    surface = pygame.Surface((4, 4), pygame.SRCALPHA); surface.fill(color)
+    pygame.image.save(surface, file_path)
+    return surface
+
+
+def main():
+    failures = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source_path = os.path.join(temp_dir, "icon.png")
+        surface = _write_image(source_path, (255, 0, 0, 255))
+        content_hash = hash_asset_file(source_path)
+        disk_cache = AssetDiskCache(os.path.join(temp_dir, "cache"), temp_dir)
+        disk_cache.store(source_path, surface, content_hash=content_hash)
+
+        source_stat = os.stat(source_path)
+        os.utime(source_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns + 1_000_000_000))
+        cached = disk_cache.load(source_path, convert=False, content_hash=content_hash)
+        if cached is None or cached.get_at((0, 0)) != (255, 0, 0, 255): failures.append("a touched but unchanged source missed its hash-named entry")
+
+        _write_image(source_path, (0, 0, 255, 255)) # Same size, different pixels, manifest not updated
+        if os.path.getsize(source_path) != source_stat.st_size: failures.append("the edited source changed size, the check proves nothing")
+        if disk_cache.load(source_path, convert=False, content_hash=content_hash) is not None: failures.append("an edited source of the same size hit the stale cache entry")
+    for failure in failures: print(f"error: {failure}")
+    print(f"Asset cache check: {len(failures)} failures.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
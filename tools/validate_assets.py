@@ -0,0 +1,48 @@
+# tools/validate_assets.py
+"""
+Offline check of the asset manifest (ASSET_MANIFEST_PATH, data/asset_manifest.json) against the assets/ folder:
+every entry's file must exist and match the size, format and SHA-256 recorded for it, and every scene tag must be
+a declared scene. Files nothing refers to are reported as warnings. Exits with status 1 on any error.
+
+    python tools/validate_assets.py                 # validate
+    python tools/validate_assets.py --update        # after adding or editing assets: refresh sizes, formats and hashes
+    python tools/validate_assets.py --skip-hashes   # sizes and formats only
+"""
+import argparse
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import game_settings as gs
+from hyperdrone_core.asset_manifest import ASSET_CATEGORIES, read_asset_manifest, validate_asset_manifest, update_asset_manifest, save_asset_manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate the asset manifest against the assets folder.")
+    parser.add_argument("--manifest", default=os.path.join(PROJECT_ROOT, gs.get_game_setting("ASSET_MANIFEST_PATH", os.path.join("data", "asset_manifest.json"))))
+    parser.add_argument("--assets", default=os.path.join(PROJECT_ROOT, "assets"))
+    parser.add_argument("--update", action="store_true", help="rewrite each entry's bytes, format and sha256 from its file before validating")
+    parser.add_argument("--skip-hashes", action="store_true", help="don't hash files, check sizes and formats only")
+    parser.add_argument("--strict", action="store_true", help="treat files missing from the manifest as errors")
+    args = parser.parse_args(argv)
+
+    try: manifest = read_asset_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"error: could not read '{args.manifest}': {e}"); return 1
+    if args.update:
+        changed_count = update_asset_manifest(manifest, args.assets)
+        save_asset_manifest(manifest, args.manifest)
+        print(f"Updated {changed_count} entries in '{args.manifest}'.")
+
+    errors, warnings = validate_asset_manifest(manifest, args.assets, check_hashes=not args.skip_hashes)
+    for warning in warnings: print(f"warning: {warning}")
+    for error in errors: print(f"error: {error}")
+    entry_count = sum(len(manifest[category]) for category in ASSET_CATEGORIES)
+    print(f"{entry_count} manifest entries, {len(errors)} errors, {len(warnings)} warnings.")
+    return 1 if errors or (args.strict and warnings) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,24 @@
+import importlib
+
 from .ui import UIManager
-from .build_menu import BuildMenu
+from .text_cache import TextRenderCache
+from .hud_widgets import HudWidget, RetainedHudPanel
+from .starfield import Starfield
 
 __all__ = [
 "BuildMenu",
+"HudWidget",
+"RetainedHudPanel",
+"Starfield",
+"TextRenderCache",
 "UIManager"
-]
\ No newline at end of file
+]
+
+# The maze defense build menu is only imported once UIManager.get_build_menu() (or an importer) asks for it
+_LAZY_EXPORTS = {"BuildMenu": ".build_menu"}
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None: raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(importlib.import_module(module_name, __name__), name)
+    return value
@@ -38,11 +38,11 @@ class BuildMenu:
         # self.fonts = fonts # REMOVED
 
         self.is_active = False 
-        self.panel_height = 90
-        self.panel_width = 280
+        self.panel_height = gs.scaled_px(90, as_int=True)
+        self.panel_width = gs.scaled_px(280, as_int=True)
         self.panel_rect = pygame.Rect(
-            20, 
-            gs.HEIGHT - BOTTOM_PANEL_HEIGHT - self.panel_height - 10,
+            gs.scaled_px(20, as_int=True), 
+            gs.HEIGHT - BOTTOM_PANEL_HEIGHT - self.panel_height - gs.scaled_px(10, as_int=True),
             self.panel_width, 
             self.panel_height
         )
@@ -143,24 +143,20 @@ class BuildMenu:
         font_small_key = "small_text"; font_small_size = 24
         font_ui_key = "ui_text"; font_ui_size = 28
         
-        font_small = self.asset_manager.get_font(font_small_key, font_small_size)
-        font_ui = self.asset_manager.get_font(font_ui_key, font_ui_size)
-
-        # Fallback if fonts aren't loaded
-        if not font_small: font_small = pygame.font.Font(None, font_small_size)
-        if not font_ui: font_ui = pygame.font.Font(None, font_ui_size)
+        # Labels go through the UIManager's shared text cache
+        render_text = self.ui_manager._render_text_safe
         
         y_offset = self.panel_rect.top + 10
 
         # Draw Title
-        title_surf = font_ui.render("Build Mode", True, WHITE)
+        title_surf = render_text("Build Mode", font_ui_key, WHITE, fallback_size=font_ui_size)
         surface.blit(title_surf, (self.panel_rect.left + 10, y_offset))
         y_offset += title_surf.get_height() + 10
 
         # Draw "Place Turret" button/text
         turret_cost = Turret.TURRET_COST if hasattr(Turret, 'TURRET_COST') else 50
         self.place_turret_button_text = f"Place Turret (T): {turret_cost}c"
-        place_surf = font_small.render(self.place_turret_button_text, True, GREEN)
+        place_surf = render_text(self.place_turret_button_text, font_small_key, GREEN, fallback_size=font_small_size)
         self.place_turret_rect = place_surf.get_rect(topleft=(self.panel_rect.left + 10, y_offset)) 
         surface.blit(place_surf, self.place_turret_rect)
         y_offset += place_surf.get_height() + 5
@@ -179,7 +175,7 @@ class BuildMenu:
         else:
             self.upgrade_turret_button_text = "Select Turret to Upgrade (U)"
         
-        upgrade_surf = font_small.render(self.upgrade_turret_button_text, True, upgrade_color)
+        upgrade_surf = render_text(self.upgrade_turret_button_text, font_small_key, upgrade_color, fallback_size=font_small_size)
         self.upgrade_turret_rect = upgrade_surf.get_rect(topleft=(self.panel_rect.left + 10, y_offset))
         surface.blit(upgrade_surf, self.upgrade_turret_rect)
 
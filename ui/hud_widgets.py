@@ -0,0 +1,72 @@
+# ui/hud_widgets.py
+import pygame
+
+
+class HudWidget:
+    """
+    A retained HUD element bound to a value. render_fn(value) is only called when
+    value_fn() returns something different from the last frame; the resulting surface
+    (or None to hide the widget) is kept until the value changes again.
+    Parts that change nearly every frame (cooldown and countdown fills) stay out of the value:
+    overlay_fn(surface, rect, value) draws them straight onto the target on top of the cached
+    surface each frame, so they never cause a redraw.
+    """
+    _UNSET = object()
+
+    def __init__(self, name, value_fn, render_fn, overlay_fn=None):
+        self.name = name
+        self.value_fn = value_fn
+        self.render_fn = render_fn
+        self.overlay_fn = overlay_fn
+        self.value = HudWidget._UNSET
+        self.surface = None
+        self.rect = None # Position within the owning layer, set by the layout function
+
+    def refresh(self):
+        """Re-reads the bound value and redraws the cached surface if it changed. Returns True on change."""
+        value = self.value_fn()
+        if value == self.value: return False
+        self.value = value
+        self.surface = self.render_fn(value)
+        return True
+
+    def invalidate(self):
+        """Forces a redraw on the next refresh, for when what render_fn draws with changed but the value didn't (reloaded icons)."""
+        self.value = HudWidget._UNSET
+
+
+class RetainedHudPanel:
+    """
+    Composites a fixed background and a set of HudWidgets into one cached layer.
+    The layer is only rebuilt when at least one widget's bound value changed, so an
+    unchanged HUD costs a single blit per frame, plus whatever the widgets' overlays draw.
+    layout_fn(layer, widgets) blits the widget surfaces onto the layer and sets their rects.
+    """
+    def __init__(self, size, background, layout_fn):
+        self.size = size
+        self.background = background
+        self.layout_fn = layout_fn
+        self.widgets = {}
+        self.layer = None
+
+    def add_widget(self, name, value_fn, render_fn, overlay_fn=None):
+        widget = self.widgets[name] = HudWidget(name, value_fn, render_fn, overlay_fn)
+        return widget
+
+    def update(self):
+        """Refreshes every widget and recomposites the layer if any of them changed. Returns True on recomposite."""
+        changed = [widget.refresh() for widget in self.widgets.values()]
+        if self.layer is not None and not any(changed): return False
+        self.layer = self.background.copy() if self.background else pygame.Surface(self.size, pygame.SRCALPHA)
+        self.layout_fn(self.layer, self.widgets)
+        return True
+
+    def draw(self, surface, topleft):
+        self.update()
+        surface.blit(self.layer, topleft)
+        for widget in self.widgets.values():
+            if widget.overlay_fn and widget.rect: widget.overlay_fn(surface, widget.rect.move(topleft), widget.value)
+
+    def invalidate(self):
+        for widget in self.widgets.values(): widget.invalidate()
+        self.layer = None
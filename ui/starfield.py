@@ -0,0 +1,92 @@
+# ui/starfield.py
+import random
+import logging
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+    logger.warning("Starfield: NumPy not available, menu stars fall back to per-star updates and draws.")
+
+
+class Starfield:
+    """
+    Scrolling menu starfield. With NumPy, star positions, speeds and radii are kept in arrays,
+    advanced in one vectorized step, and drawn by writing each radius' pixel footprint straight
+    into the target surface through pygame.surfarray. Without NumPy (or on surfaces surfarray
+    can't reference) it falls back to one pygame.draw.circle per star, which produces the same pixels.
+    Stars are spread over `layers` parallax depths; nearer layers scroll faster and draw larger.
+    """
+    _footprints = {} # int radius -> (dx, dy) pixel offsets covered by pygame.draw.circle
+
+    def __init__(self, num_stars, width, height, layers=1, speed_range=(10, 50), size_range=(0.5, 2)):
+        self.width, self.height = int(width), int(height)
+        self.num_stars = max(0, int(num_stars))
+        layers = max(1, int(layers))
+        depth = [((i % layers) + 1) / layers for i in range(self.num_stars)] # Layer 1/layers (far) .. 1 (near)
+        if np is not None:
+            rng = self._rng = np.random.default_rng()
+            depth = np.asarray(depth, dtype=np.float64)
+            self.x = rng.integers(0, self.width + 1, self.num_stars).astype(np.float64)
+            self.y = rng.integers(0, self.height + 1, self.num_stars).astype(np.float64)
+            self.speed = rng.uniform(speed_range[0], speed_range[1], self.num_stars) * depth
+            self.radius = (rng.uniform(size_range[0], size_range[1], self.num_stars) * depth).astype(np.int32) # draw.circle truncates
+        else:
+            self.stars = [[random.randint(0, self.width), random.randint(0, self.height),
+                           random.uniform(*speed_range) * d, int(random.uniform(*size_range) * d)] for d in depth]
+
+    def __len__(self):
+        return self.num_stars
+
+    def update(self, delta_time_ms):
+        """Scrolls every star down by speed * dt and respawns the ones that left the bottom edge at the top."""
+        dt = delta_time_ms / 1000.0
+        if np is None:
+            for star in self.stars:
+                star[1] += star[2] * dt
+                if star[1] > self.height: star[0] = random.randint(0, self.width); star[1] = 0
+            return
+        self.y += self.speed * dt
+        wrapped = self.y > self.height
+        wrapped_count = int(np.count_nonzero(wrapped))
+        if wrapped_count:
+            self.x[wrapped] = self._rng.integers(0, self.width + 1, wrapped_count)
+            self.y[wrapped] = 0
+
+    @classmethod
+    def _get_footprint(cls, radius):
+        """Pixel offsets pygame.draw.circle fills for an integer radius, measured once so both draw paths match exactly."""
+        footprint = cls._footprints.get(radius)
+        if footprint is None:
+            probe = pygame.Surface((radius * 2 + 3, radius * 2 + 3))
+            if radius > 0: pygame.draw.circle(probe, (255, 255, 255), (radius + 1, radius + 1), radius)
+            covered = np.argwhere(pygame.surfarray.array2d(probe) != 0)
+            footprint = cls._footprints[radius] = (covered[:, 0] - (radius + 1), covered[:, 1] - (radius + 1))
+        return footprint
+
+    def draw(self, surface, color):
+        if np is None:
+            for x, y, _, radius in self.stars:
+                if radius > 0: pygame.draw.circle(surface, color, (int(x), int(y)), radius)
+            return
+        try:
+            pixels = pygame.surfarray.pixels3d(surface)
+        except (ValueError, pygame.error):
+            for x, y, radius in zip(self.x.astype(np.int32), self.y.astype(np.int32), self.radius):
+                if radius > 0: pygame.draw.circle(surface, color, (int(x), int(y)), int(radius))
+            return
+        clip = surface.get_clip()
+        xs, ys = self.x.astype(np.int32), self.y.astype(np.int32)
+        rgb = np.asarray(color[:3], dtype=np.uint8)
+        for radius in np.unique(self.radius):
+            if radius <= 0: continue
+            dx, dy = self._get_footprint(int(radius))
+            selected = self.radius == radius
+            px = (xs[selected][:, None] + dx).ravel(); py = (ys[selected][:, None] + dy).ravel()
+            visible = (px >= clip.left) & (px < clip.right) & (py >= clip.top) & (py < clip.bottom)
+            pixels[px[visible], py[visible]] = rgb
+        del pixels # Releases the surface lock
@@ -0,0 +1,58 @@
+# ui/text_cache.py
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class TextRenderCache:
+    """
+    LRU cache of rendered text surfaces keyed by (font key, size, text, color, antialias).
+    Surfaces are shared between callers and must be treated as read-only (copy before set_alpha).
+    Entries are evicted least-recently-used first once the total pixel bytes exceed max_bytes.
+    """
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        self.max_bytes = int(max_bytes)
+        self._entries = OrderedDict() # key -> (surface, byte_size)
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(font_key, size, text, color, antialias=True):
+        return (font_key, int(size), str(text), tuple(color), bool(antialias))
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, surface):
+        byte_size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        if byte_size > self.max_bytes: return surface # Too large to ever fit, hand it back uncached
+        old_entry = self._entries.pop(key, None)
+        if old_entry: self.current_bytes -= old_entry[1]
+        self._entries[key] = (surface, byte_size)
+        self.current_bytes += byte_size
+        while self.current_bytes > self.max_bytes and self._entries:
+            _, (_, evicted_bytes) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_bytes
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def get_stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries), "bytes": self.current_bytes, "max_bytes": self.max_bytes,
+            "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0
+        }
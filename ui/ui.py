@@ -18,18 +18,14 @@ from game_settings import (
     GAME_STATE_ARCHITECT_VAULT_INTRO, GAME_STATE_ARCHITECT_VAULT_ENTRY_PUZZLE,
     GAME_STATE_ARCHITECT_VAULT_GAUNTLET, GAME_STATE_ARCHITECT_VAULT_EXTRACTION,
     GAME_STATE_ARCHITECT_VAULT_SUCCESS, GAME_STATE_ARCHITECT_VAULT_FAILURE,
-    GAME_STATE_GAME_INTRO_SCROLL, GAME_STATE_RING_PUZZLE, GAME_STATE_MAZE_DEFENSE,
+    GAME_STATE_GAME_INTRO_SCROLL, GAME_STATE_RING_PUZZLE, GAME_STATE_MAZE_DEFENSE, GAME_STATE_LOADING,
     DEFAULT_SETTINGS,
     TOTAL_CORE_FRAGMENTS_NEEDED, CORE_FRAGMENT_DETAILS,
     get_game_setting
 )
 
-# Import BuildMenu
-try:
-    from .build_menu import BuildMenu
-except ImportError:
-    logging.warning("UIManager: Could not import BuildMenu. Build UI will not be available.")
-    BuildMenu = None 
+from .text_cache import TextRenderCache
+from .hud_widgets import HudWidget, RetainedHudPanel
 
 logger = logging.getLogger(__name__)
 # BasicConfig should ideally be called once at the application entry point.
@@ -50,31 +46,53 @@ class UIManager:
             "current_drone_life_icon": None, "core_fragment_icons": {},
             "core_fragment_empty_icon": None, "reactor_icon_placeholder": None
         }
-        self.ui_icon_size_lives = (30, 30)
-        self.ui_icon_size_rings = (20, 20)
-        self.ui_icon_size_fragments = (28, 28)
-        self.ui_icon_size_reactor = (32, 32)
+        # Fixed-pixel layout is authored for 1080p and shrinks with RENDER_SCALE (a no-op at 1.0)
+        self.ui_icon_size_lives = (gs.scaled_px(30, as_int=True),) * 2
+        self.ui_icon_size_rings = (gs.scaled_px(20, as_int=True),) * 2
+        self.ui_icon_size_fragments = (gs.scaled_px(28, as_int=True),) * 2
+        self.ui_icon_size_reactor = (gs.scaled_px(32, as_int=True),) * 2
 
         self.codex_list_item_height = 0
         self.codex_max_visible_items_list = 0
         self.codex_max_visible_lines_content = 0
 
-        self.BOTTOM_INSTRUCTION_CENTER_Y = HEIGHT - 50
-        self.SECONDARY_INSTRUCTION_CENTER_Y = HEIGHT - 80
+        self.BOTTOM_INSTRUCTION_CENTER_Y = HEIGHT - gs.scaled_px(50, as_int=True)
+        self.SECONDARY_INSTRUCTION_CENTER_Y = HEIGHT - gs.scaled_px(80, as_int=True)
         self.INSTRUCTION_TEXT_COLOR = CYAN
         self.INSTRUCTION_BG_COLOR = (30, 30, 30, 150)
-        self.INSTRUCTION_PADDING_X = 20
-        self.INSTRUCTION_PADDING_Y = 10
+        self.INSTRUCTION_PADDING_X = gs.scaled_px(20, as_int=True)
+        self.INSTRUCTION_PADDING_Y = gs.scaled_px(10, as_int=True)
 
-        if BuildMenu:
-            self.build_menu = BuildMenu(self.game_controller, self, self.asset_manager) 
-        else:
-            self.build_menu = None
+        self.text_cache = TextRenderCache(get_game_setting("TEXT_CACHE_MAX_BYTES", 8 * 1024 * 1024))
+
+        # Retained HUD layers, built on first draw and only recomposited when a bound value changes
+        self.gameplay_hud = None
+        self.maze_defense_hud = None
+        self._hud_fragment_order = None
+        self.reactor_hud_widget = HudWidget("reactor", self._hud_reactor_value, self._render_hud_reactor)
+        self.vault_timer_widget = HudWidget("vault_timer", self._hud_vault_timer_value, self._render_hud_vault_timer)
+
+        # Static menu layers (layout and text), rebuilt only when the screen's state key changes
+        self._menu_layers = {}
+        self._menu_layers_state = None
+        self._menu_background_cache = None # (size, pre-scaled opaque background)
+        self._story_overlay_rect = None # Screen area covered by last frame's story message, repainted once it's gone
+
+        self.build_menu = None # Maze defense only, created by get_build_menu() when that mode starts
 
         self._load_ui_assets_from_manager()
         self.update_player_life_icon_surface()
         logger.info("UIManager initialized and UI assets loaded via AssetManager.")
 
+    def get_build_menu(self):
+        """The maze defense build menu, imported and created on first use; None if it can't be loaded."""
+        if self.build_menu is None:
+            try: from .build_menu import BuildMenu
+            except ImportError:
+                logger.warning("UIManager: Could not import BuildMenu. Build UI will not be available."); return None
+            self.build_menu = BuildMenu(self.game_controller, self, self.asset_manager)
+        return self.build_menu
+
     def _load_ui_assets_from_manager(self):
         self.ui_asset_surfaces["ring_icon"] = self.asset_manager.get_image("ring_ui_icon", scale_to_size=self.ui_icon_size_rings)
         if not self.ui_asset_surfaces["ring_icon"]: self.ui_asset_surfaces["ring_icon"] = self._create_fallback_icon_surface(self.ui_icon_size_rings, "O", GOLD)
@@ -112,6 +130,8 @@ class UIManager:
         else:
             logger.warning(f"UIManager: Life icon for drone '{selected_drone_id}' (key: '{life_icon_asset_key}') not found. Using fallback.")
             self.ui_asset_surfaces["current_drone_life_icon"] = self._create_fallback_icon_surface(size=self.ui_icon_size_lives, text="♥", color=CYAN, font_key="ui_emoji_small")
+        for hud_panel in (self.gameplay_hud, self.maze_defense_hud): # A new drone redraws every row, not just the lives
+            if hud_panel: hud_panel.invalidate()
 
     def _create_fallback_icon_surface(self, size=(30,30), text="?", color=GREY, text_color=WHITE, font_key="ui_text"):
         surface = pygame.Surface(size, pygame.SRCALPHA)
@@ -125,13 +145,17 @@ class UIManager:
             except Exception as e: logger.error(f"UIManager: Error rendering fallback icon text '{text}' with font key '{font_key}': {e}")
         return surface
 
-    def _render_text_safe(self, text, font_key, color, fallback_size=24):
+    def _render_text_safe(self, text, font_key, color, fallback_size=24, antialias=True):
+        """Renders text through the shared LRU text cache. The returned surface is shared, never modify it in place."""
+        cache_key = self.text_cache.make_key(font_key, fallback_size, text, color, antialias)
+        cached_surf = self.text_cache.get(cache_key)
+        if cached_surf is not None: return cached_surf
         font = self.asset_manager.get_font(font_key, fallback_size)
         if not font: font = pygame.font.Font(None, fallback_size)
-        try: return font.render(str(text), True, color)
+        try: return self.text_cache.put(cache_key, font.render(str(text), antialias, color))
         except Exception as e:
             logger.error(f"UIManager: Error rendering text '{text}' with font key '{font_key}': {e}")
-            return pygame.font.Font(None, fallback_size).render("ERR", True, RED)
+            return self.asset_manager.get_font(None, fallback_size).render("ERR", True, RED)
 
     def _wrap_text(self, text, font_key_for_size_calc, size_for_font, max_width):
         font = self.asset_manager.get_font(font_key_for_size_calc, size_for_font) or pygame.font.Font(None, size_for_font)
@@ -165,11 +189,18 @@ class UIManager:
             GAME_STATE_GAME_OVER, GAME_STATE_ENTER_NAME
         ]
         
+        if current_state != self._menu_layers_state: # Layers only live while their screen is shown
+            self._menu_layers.clear(); self._menu_layers_state = current_state
+            self._mark_dirty()
+
         if is_menu_like_state: 
-            self.screen.fill(BLACK)
+            menu_bg_surface = self._get_menu_background() if current_state == GAME_STATE_MAIN_MENU else None
+            if menu_bg_surface: self.screen.blit(menu_bg_surface, (0, 0))
+            else: self.screen.fill(BLACK)
+            star_color = (50,50,50) if current_state == GAME_STATE_CODEX else WHITE # Codex uses a dimmed starfield
+            if current_state == GAME_STATE_MAIN_MENU: self._mark_dirty() # Stars only scroll on the main menu
             if ui_flow_ctrl and hasattr(ui_flow_ctrl, 'menu_stars') and ui_flow_ctrl.menu_stars:
-                 for star_params in ui_flow_ctrl.menu_stars:
-                    pygame.draw.circle(self.screen, WHITE, (int(star_params[0]), int(star_params[1])), star_params[3])
+                ui_flow_ctrl.menu_stars.draw(self.screen, star_color)
 
         # Route to specific draw methods
         if current_state == GAME_STATE_MAIN_MENU: self.draw_main_menu()
@@ -180,6 +211,7 @@ class UIManager:
         elif current_state == GAME_STATE_GAME_OVER: self.draw_game_over_overlay()
         elif current_state == GAME_STATE_ENTER_NAME: self.draw_enter_name_overlay()
         elif current_state == GAME_STATE_GAME_INTRO_SCROLL: self.draw_game_intro_scroll() 
+        elif current_state == GAME_STATE_LOADING: self.draw_loading_screen()
         
         # <<< FIX: Added call to missing method >>>
         elif current_state.startswith("architect_vault"):
@@ -206,11 +238,66 @@ class UIManager:
                 fallback_surf = self._render_text_safe("Loading Puzzle...", "medium_text", WHITE, fallback_size=48)
                 self.screen.blit(fallback_surf, fallback_surf.get_rect(center=(WIDTH // 2, HEIGHT // 2)))
 
+        if self._story_overlay_rect: self._mark_dirty(self._story_overlay_rect); self._story_overlay_rect = None
         if hasattr(self.game_controller, 'story_message_active') and self.game_controller.story_message_active and \
            hasattr(self.game_controller, 'story_message') and self.game_controller.story_message:
             if current_state != GAME_STATE_GAME_INTRO_SCROLL:
                 self.draw_story_message_overlay(self.game_controller.story_message)
+
+    def _mark_dirty(self, rect=None):
+        """Reports a changed screen area, or the whole screen when rect is None, to the game's frame presenter."""
+        frame_presenter = getattr(self.game_controller, 'frame_presenter', None)
+        if frame_presenter is None: return
+        if rect is None: frame_presenter.mark_full()
+        else: frame_presenter.mark_dirty(rect)
     
+    def _get_menu_background(self):
+        """The menu background scaled to the screen and flattened onto black once, instead of smoothscaled every frame."""
+        menu_bg_surface = self.ui_asset_surfaces.get("menu_background")
+        if not menu_bg_surface: return None
+        if self._menu_background_cache is None or self._menu_background_cache[0] != (WIDTH, HEIGHT):
+            try:
+                scaled_bg = pygame.Surface((WIDTH, HEIGHT)); scaled_bg.fill(BLACK)
+                scaled_bg.blit(pygame.transform.smoothscale(menu_bg_surface, (WIDTH, HEIGHT)), (0,0))
+                self._menu_background_cache = ((WIDTH, HEIGHT), scaled_bg)
+            except Exception as e: 
+                logger.error(f"UIManager: Error scaling menu background: {e}")
+                return None
+        return self._menu_background_cache[1]
+
+    def _blit_static_menu_layer(self, layer_name, state_key, draw_fn):
+        """
+        Blits the cached static layer of a menu screen. draw_fn draws to self.screen as usual, but is only
+        run (into a transparent layer cropped to its content) when state_key or the screen size changes.
+        """
+        layer_key = (self.screen.get_size(), state_key)
+        cached_layer = self._menu_layers.get(layer_name)
+        if cached_layer is None or cached_layer[0] != layer_key:
+            if cached_layer: self._mark_dirty(cached_layer[1].get_rect(topleft=cached_layer[2]))
+            layer_surf = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+            target_screen = self.screen; self.screen = layer_surf
+            try: draw_fn()
+            finally: self.screen = target_screen
+            content_rect = layer_surf.get_bounding_rect()
+            cached_layer = self._menu_layers[layer_name] = (layer_key, layer_surf.subsurface(content_rect).copy(), content_rect.topleft)
+            self._mark_dirty(content_rect)
+        self.screen.blit(cached_layer[1], cached_layer[2])
+
+    def _hud_vault_timer_value(self):
+        gc = self.game_controller
+        if gc.architect_vault_current_phase not in ["gauntlet_wave_1", "extraction"]: return None
+        time_left_sec = gc.level_time_remaining_ms / 1000.0
+        return (f"TIMER: {time_left_sec:.1f}s", RED if time_left_sec < 10 else YELLOW)
+
+    def _render_hud_vault_timer(self, value):
+        if value is None: return None
+        timer_text, timer_color = value
+        timer_surf = self._render_text_safe(timer_text, "vault_timer", timer_color, fallback_size=48)
+        bg_surf = pygame.Surface(timer_surf.get_rect().inflate(gs.scaled_px(20, as_int=True), gs.scaled_px(10, as_int=True)).size, pygame.SRCALPHA)
+        bg_surf.fill((0,0,0,150))
+        bg_surf.blit(timer_surf, timer_surf.get_rect(center=bg_surf.get_rect().center))
+        return bg_surf
+
     def draw_architect_vault_hud_elements(self):
         """Draws HUD elements specific to the Architect's Vault mode."""
         gc = self.game_controller
@@ -218,33 +305,34 @@ class UIManager:
 
         panel_y_start = GAME_PLAY_AREA_HEIGHT
         
-        # Display a phase timer if relevant
-        if gc.architect_vault_current_phase in ["gauntlet_wave_1", "extraction"]:
-            time_left_ms = gc.level_time_remaining_ms
-            time_left_sec = time_left_ms / 1000.0
-            timer_text = f"TIMER: {time_left_sec:.1f}s"
-            timer_color = RED if time_left_sec < 10 else YELLOW
-            timer_surf = self._render_text_safe(timer_text, "vault_timer", timer_color, fallback_size=48)
-            
-            timer_rect = timer_surf.get_rect(centerx=WIDTH / 2, top=15)
-            bg_rect = timer_rect.inflate(20, 10)
-            bg_surf = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-            bg_surf.fill((0,0,0,150))
-            self.screen.blit(bg_surf, bg_rect)
-            self.screen.blit(timer_surf, timer_rect)
+        # Display a phase timer if relevant (redrawn only when the tenths digit changes)
+        self.vault_timer_widget.refresh()
+        if self.vault_timer_widget.surface:
+            self.screen.blit(self.vault_timer_widget.surface, self.vault_timer_widget.surface.get_rect(centerx=WIDTH / 2, top=gs.scaled_px(10, as_int=True)))
 
         # Display current wave or phase message
         if gc.architect_vault_message:
             msg_surf = self._render_text_safe(gc.architect_vault_message, "vault_message", CYAN, fallback_size=36)
-            msg_rect = msg_surf.get_rect(centerx=WIDTH / 2, bottom=panel_y_start - 20)
+            msg_rect = msg_surf.get_rect(centerx=WIDTH / 2, bottom=panel_y_start - gs.scaled_px(20, as_int=True))
             self.screen.blit(msg_surf, msg_rect)
 
         # Re-use the standard gameplay HUD for common elements like health, score, etc.
         self.draw_gameplay_hud()
 
+    def draw_loading_screen(self):
+        """Shown while the next scene's critical assets decode in the background."""
+        self.screen.fill(BLACK); self._mark_dirty()
+        loading_surf = self._render_text_safe("LOADING", "medium_text", CYAN, fallback_size=48)
+        self.screen.blit(loading_surf, loading_surf.get_rect(center=(WIDTH // 2, HEIGHT // 2 - gs.scaled_px(30, as_int=True))))
+        bar_width, bar_height = WIDTH // 3, gs.scaled_px(25, as_int=True)
+        bar_rect = pygame.Rect(0, 0, bar_width, bar_height); bar_rect.center = (WIDTH // 2, HEIGHT // 2 + gs.scaled_px(30, as_int=True))
+        progress = max(0.0, min(1.0, self.asset_manager.get_load_progress()))
+        if progress > 0: pygame.draw.rect(self.screen, CYAN, (bar_rect.x, bar_rect.y, int(bar_width * progress), bar_height))
+        pygame.draw.rect(self.screen, WHITE, bar_rect, 2)
+
     def draw_game_intro_scroll(self):
         ui_flow_ctrl = self.game_controller.ui_flow_controller
-        self.screen.fill(BLACK)
+        self.screen.fill(BLACK); self._mark_dirty()
 
         # Get current image from GameController (which got it from UIFlowController, which got key from JSON)
         # GameController's self.current_intro_image_surface is now an asset KEY.
@@ -270,20 +358,14 @@ class UIManager:
                 self.screen.blit(pygame.transform.smoothscale(current_image_surface, (scaled_w, scaled_h)), (pos_x, pos_y))
             except pygame.error as e:
                 logger.error(f"UIManager: Error scaling/blitting intro image (key: {image_asset_key}): {e}")
-                if ui_flow_ctrl and ui_flow_ctrl.menu_stars:
-                    for star_params in ui_flow_ctrl.menu_stars: 
-                        pygame.draw.circle(self.screen, WHITE, (int(star_params[0]), int(star_params[1])), star_params[3])
+                if ui_flow_ctrl and ui_flow_ctrl.menu_stars: ui_flow_ctrl.menu_stars.draw(self.screen, WHITE)
         else: 
-            if ui_flow_ctrl and ui_flow_ctrl.menu_stars:
-                for star_params in ui_flow_ctrl.menu_stars: 
-                    pygame.draw.circle(self.screen, WHITE, (int(star_params[0]), int(star_params[1])), star_params[3])
+            if ui_flow_ctrl and ui_flow_ctrl.menu_stars: ui_flow_ctrl.menu_stars.draw(self.screen, WHITE)
         
         if not current_text_surfaces: 
             if ui_flow_ctrl.intro_sequence_finished:
-                prompt_font = self.asset_manager.get_font("small_text", 24) # Request font
-                if not prompt_font: prompt_font = pygame.font.Font(None, 24)
-                prompt_surf = prompt_font.render("Press SPACE or ENTER to Continue", True, CYAN)
-                self.screen.blit(prompt_surf, prompt_surf.get_rect(centerx=WIDTH // 2, bottom=HEIGHT - 30))
+                prompt_surf = self._render_text_safe("Press SPACE or ENTER to Continue", "small_text", CYAN, fallback_size=24)
+                self.screen.blit(prompt_surf, prompt_surf.get_rect(centerx=WIDTH // 2, bottom=HEIGHT - gs.scaled_px(30, as_int=True)))
             return
         
         # ... (text positioning and fading logic remains the same) ...
@@ -316,10 +398,8 @@ class UIManager:
             current_y += text_surf.get_height() + line_spacing
         
         if ui_flow_ctrl.intro_sequence_finished:
-            prompt_font = self.asset_manager.get_font("small_text", 24)
-            if not prompt_font: prompt_font = pygame.font.Font(None, 24)
-            prompt_surf = prompt_font.render("Press SPACE or ENTER to Continue", True, CYAN)
-            self.screen.blit(prompt_surf, prompt_surf.get_rect(centerx=WIDTH // 2, bottom=HEIGHT - 30))
+            prompt_surf = self._render_text_safe("Press SPACE or ENTER to Continue", "small_text", CYAN, fallback_size=24)
+            self.screen.blit(prompt_surf, prompt_surf.get_rect(centerx=WIDTH // 2, bottom=HEIGHT - gs.scaled_px(30, as_int=True)))
 
     def draw_story_message_overlay(self, message):
         # Use _render_text_safe which uses AssetManager
@@ -332,7 +412,7 @@ class UIManager:
         font_for_wrap = self.asset_manager.get_font(story_font_key, story_font_size)
         if not font_for_wrap: font_for_wrap = pygame.font.Font(None, story_font_size)
 
-        max_width = WIDTH * 0.7; padding = 20; line_spacing_ratio = 0.2
+        max_width = WIDTH * 0.7; padding = gs.scaled_px(20, as_int=True); line_spacing_ratio = 0.2
 
         wrapped_lines_text = self._wrap_text(message, story_font_key, story_font_size, max_width - 2 * padding)
         
@@ -348,11 +428,11 @@ class UIManager:
         box_width = max_line_width + 2 * padding
         box_height = total_text_height + 2 * padding
         box_x = (WIDTH - box_width) // 2
-        box_y = GAME_PLAY_AREA_HEIGHT - box_height - 20 
+        box_y = GAME_PLAY_AREA_HEIGHT - box_height - gs.scaled_px(20, as_int=True)
         
         overlay_surf = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
         overlay_surf.fill((10, 20, 40, 220))
-        pygame.draw.rect(overlay_surf, GOLD, overlay_surf.get_rect(), 2, border_radius=10)
+        pygame.draw.rect(overlay_surf, GOLD, overlay_surf.get_rect(), 2, border_radius=gs.scaled_px(10, as_int=True))
         
         current_text_y = padding
         for line_surf in rendered_lines:
@@ -360,13 +440,17 @@ class UIManager:
             current_text_y += line_surf.get_height() + effective_line_spacing
             
         self.screen.blit(overlay_surf, (box_x, box_y))
+        self._story_overlay_rect = overlay_surf.get_rect(topleft=(box_x, box_y)); self._mark_dirty(self._story_overlay_rect)
 
     def draw_codex_screen(self):
         ui_flow_ctrl = self.game_controller.ui_flow_controller
-        self.screen.fill(BLACK)
-        if ui_flow_ctrl.menu_stars:
-            for star_params in ui_flow_ctrl.menu_stars: 
-                pygame.draw.circle(self.screen, (50,50,50), (int(star_params[0]), int(star_params[1])), star_params[3])
+        layer_state = (ui_flow_ctrl.codex_current_view, list(ui_flow_ctrl.codex_categories_list or []), ui_flow_ctrl.codex_selected_category_index,
+                       ui_flow_ctrl.codex_current_category_name, list(ui_flow_ctrl.codex_entries_in_category_list or []),
+                       ui_flow_ctrl.codex_selected_entry_index_in_category, ui_flow_ctrl.codex_selected_entry_id, ui_flow_ctrl.codex_content_scroll_offset)
+        self._blit_static_menu_layer("codex", layer_state, self._draw_codex_layout)
+
+    def _draw_codex_layout(self):
+        ui_flow_ctrl = self.game_controller.ui_flow_controller
         
         # Define font keys and sizes (must match manifest)
         codex_title_font_key = "codex_title_font"; codex_title_font_size = 60
@@ -377,18 +461,18 @@ class UIManager:
         medium_text_font_key = "medium_text"; medium_text_font_size = 48
         
         title_surf = self._render_text_safe("Lore Codex", codex_title_font_key, GOLD, fallback_size=codex_title_font_size)
-        title_rect = title_surf.get_rect(center=(WIDTH // 2, 60))
+        title_rect = title_surf.get_rect(center=(WIDTH // 2, gs.scaled_px(60, as_int=True)))
         self.screen.blit(title_surf, title_rect)
         
         # ... (rest of the layout logic for panels remains similar) ...
         current_view = ui_flow_ctrl.codex_current_view 
-        padding = 50
+        padding = gs.scaled_px(50, as_int=True)
         list_panel_width = WIDTH // 3 - padding * 1.5
         list_panel_x = padding
         content_panel_x = list_panel_x + list_panel_width + padding / 2
         content_panel_width = WIDTH - content_panel_x - padding
-        top_y_start = title_rect.bottom + 30
-        bottom_y_end = HEIGHT - 80
+        top_y_start = title_rect.bottom + gs.scaled_px(30, as_int=True)
+        bottom_y_end = HEIGHT - gs.scaled_px(80, as_int=True)
 
         # Get actual font objects for measurements if needed, or rely on _render_text_safe for rendering
         font_category = self.asset_manager.get_font(codex_category_font_key, codex_category_font_size)
@@ -401,16 +485,16 @@ class UIManager:
             return
 
         if self.codex_list_item_height == 0:
-             self.codex_list_item_height = font_entry.get_height() + 15
+             self.codex_list_item_height = font_entry.get_height() + gs.scaled_px(15, as_int=True)
              if self.codex_list_item_height > 0: self.codex_max_visible_items_list = (bottom_y_end - top_y_start) // self.codex_list_item_height
              else: self.codex_max_visible_items_list = 1
         
         content_line_height = font_content.get_linesize()
         if self.codex_max_visible_lines_content == 0 and content_line_height > 0:
-             available_height_for_content_text_calc = bottom_y_end - (top_y_start + font_category.get_height() + 20)
+             available_height_for_content_text_calc = bottom_y_end - (top_y_start + font_category.get_height() + gs.scaled_px(20, as_int=True))
              self.codex_max_visible_lines_content = available_height_for_content_text_calc // content_line_height if content_line_height > 0 else 1
         
-        nav_instr = ""; current_list_y = top_y_start + 20 
+        nav_instr = ""; item_indent = gs.scaled_px(10, as_int=True); current_list_y = top_y_start + gs.scaled_px(20, as_int=True)
 
         if current_view == "categories":
             # ... (logic uses _render_text_safe with category_font_key and size) ...
@@ -429,7 +513,7 @@ class UIManager:
                     y_pos = current_list_y + i_display * self.codex_list_item_height
                     color = YELLOW if i_actual == selected_category_idx else WHITE
                     cat_name_surf = self._render_text_safe(category_name, codex_category_font_key, color, fallback_size=codex_category_font_size)
-                    self.screen.blit(cat_name_surf, (list_panel_x + 10, y_pos))
+                    self.screen.blit(cat_name_surf, (list_panel_x + item_indent, y_pos))
             nav_instr = "UP/DOWN: Select | ENTER: View Entries | ESC: Main Menu"
 
         elif current_view == "entries":
@@ -439,12 +523,12 @@ class UIManager:
             selected_entry_idx = ui_flow_ctrl.codex_selected_entry_index_in_category
             
             cat_title_surf = self._render_text_safe(f"{category_name}", codex_category_font_key, GOLD, fallback_size=codex_category_font_size)
-            self.screen.blit(cat_title_surf, (list_panel_x + 10, top_y_start))
-            current_list_y = top_y_start + cat_title_surf.get_height() + 15
+            self.screen.blit(cat_title_surf, (list_panel_x + item_indent, top_y_start))
+            current_list_y = top_y_start + cat_title_surf.get_height() + gs.scaled_px(15, as_int=True)
             
             if not entries: 
                 no_entries_surf = self._render_text_safe("No entries here.", codex_entry_font_key, GREY, fallback_size=codex_entry_font_size)
-                self.screen.blit(no_entries_surf, (list_panel_x + 20, current_list_y))
+                self.screen.blit(no_entries_surf, (list_panel_x + 2 * item_indent, current_list_y))
             else:
                 max_visible = self.codex_max_visible_items_list if self.codex_max_visible_items_list > 0 else 1
                 start_idx = max(0, selected_entry_idx - max_visible // 2)
@@ -455,7 +539,7 @@ class UIManager:
                     y_pos = current_list_y + i_display * self.codex_list_item_height
                     color = YELLOW if i_actual == selected_entry_idx else WHITE
                     entry_title_surf = self._render_text_safe(entry_data.get("title", "Untitled"), codex_entry_font_key, color, fallback_size=codex_entry_font_size)
-                    self.screen.blit(entry_title_surf, (list_panel_x + 20, y_pos))
+                    self.screen.blit(entry_title_surf, (list_panel_x + 2 * item_indent, y_pos))
             nav_instr = "UP/DOWN: Select | ENTER: Read | ESC: Back to Categories"
 
         elif current_view == "content":
@@ -472,24 +556,24 @@ class UIManager:
             if image_asset_key_from_lore and image_asset_key_from_lore.startswith("assets/"):
                 image_asset_key_from_lore = image_asset_key_from_lore[len("assets/"):]
             
-            current_image_y_pos = top_y_start + 20
+            current_image_y_pos = top_y_start + gs.scaled_px(20, as_int=True)
 
             if category_name_reminder:
                 cat_reminder_surf = self._render_text_safe(f"{category_name_reminder}", codex_entry_font_key, DARK_GREY, fallback_size=codex_entry_font_size)
-                self.screen.blit(cat_reminder_surf, (list_panel_x +10 , top_y_start ))
-                current_image_y_pos = top_y_start + cat_reminder_surf.get_height() + 20
+                self.screen.blit(cat_reminder_surf, (list_panel_x + item_indent, top_y_start))
+                current_image_y_pos = top_y_start + cat_reminder_surf.get_height() + gs.scaled_px(20, as_int=True)
 
             if entry_data:
                 content_title_surf = self._render_text_safe(entry_data.get("title", "Untitled"), codex_category_font_key, GOLD, fallback_size=codex_category_font_size)
                 self.screen.blit(content_title_surf, (content_panel_x, top_y_start))
-                content_text_render_y = top_y_start + content_title_surf.get_height() + 20
-                text_area_width = content_panel_width - 20
+                content_text_render_y = top_y_start + content_title_surf.get_height() + gs.scaled_px(20, as_int=True)
+                text_area_width = content_panel_width - 2 * item_indent
 
                 # Get image from AssetManager
                 codex_image_surf = None
                 if image_asset_key_from_lore:
                     # Determine scale for drone/race images if needed, or load as is
-                    img_max_w_drone = list_panel_width - 20
+                    img_max_w_drone = list_panel_width - 2 * item_indent
                     img_max_h_drone = HEIGHT * 0.3
                     img_max_w_race = content_panel_width * 0.6
                     img_max_h_race = HEIGHT * 0.25
@@ -529,13 +613,13 @@ class UIManager:
                 wrapped_lines = self._wrap_text(content_text, codex_content_font_key, codex_content_font_size, text_area_width)
                 ui_flow_ctrl.codex_current_entry_total_lines = len(wrapped_lines)
                 
-                text_content_area_available_height = bottom_y_end - content_text_render_y - 10
+                text_content_area_available_height = bottom_y_end - content_text_render_y - item_indent
                 race_image_to_draw_below_text_surf = None # This will hold the scaled surface for race image
                 scaled_race_img_h_val = 0
                 if is_race_entry and codex_image_surf: # If it's a race entry, codex_image_surf holds the scaled race image
                     race_image_to_draw_below_text_surf = codex_image_surf
                     scaled_race_img_h_val = race_image_to_draw_below_text_surf.get_height()
-                    text_content_area_available_height -= (scaled_race_img_h_val + 20)
+                    text_content_area_available_height -= (scaled_race_img_h_val + gs.scaled_px(20, as_int=True))
                 
                 max_lines = text_content_area_available_height // content_line_height if content_line_height > 0 else 0
                 if max_lines <= 0 and wrapped_lines: max_lines = 1
@@ -545,11 +629,11 @@ class UIManager:
                     line_idx = scroll_offset_lines + i
                     if 0 <= line_idx < len(wrapped_lines):
                         line_surf = self._render_text_safe(wrapped_lines[line_idx], codex_content_font_key, WHITE, fallback_size=codex_content_font_size)
-                        self.screen.blit(line_surf, (content_panel_x + 10, content_text_render_y + i * content_line_height))
+                        self.screen.blit(line_surf, (content_panel_x + item_indent, content_text_render_y + i * content_line_height))
                         lines_drawn_y_end = content_text_render_y + (i + 1) * content_line_height
                 
                 if race_image_to_draw_below_text_surf:
-                    race_img_y_pos = lines_drawn_y_end + 20
+                    race_img_y_pos = lines_drawn_y_end + gs.scaled_px(20, as_int=True)
                     if race_img_y_pos + scaled_race_img_h_val < bottom_y_end:
                         self.screen.blit(race_image_to_draw_below_text_surf, 
                                          (content_panel_x + (text_area_width - race_image_to_draw_below_text_surf.get_width()) // 2, race_img_y_pos))
@@ -559,13 +643,13 @@ class UIManager:
                     up_arrow_surf = self._render_text_safe("▲ Up", small_text_font_key, YELLOW, fallback_size=small_text_font_size)
                     down_arrow_surf = self._render_text_safe("▼ Down", small_text_font_key, YELLOW, fallback_size=small_text_font_size)
                     if scroll_offset_lines > 0: 
-                        self.screen.blit(up_arrow_surf, (content_panel_x + text_area_width - up_arrow_surf.get_width(), content_text_render_y - 25))
+                        self.screen.blit(up_arrow_surf, (content_panel_x + text_area_width - up_arrow_surf.get_width(), content_text_render_y - gs.scaled_px(25, as_int=True)))
                     if scroll_offset_lines + max_lines < len(wrapped_lines):
-                        scroll_down_y_pos = lines_drawn_y_end + 5 
-                        if race_image_to_draw_below_text_surf and (race_img_y_pos + scaled_race_img_h_val + down_arrow_surf.get_height() > bottom_y_end -5):
-                            scroll_down_y_pos = lines_drawn_y_end + 5 
+                        arrow_gap = gs.scaled_px(5, as_int=True); scroll_down_y_pos = lines_drawn_y_end + arrow_gap
+                        if race_image_to_draw_below_text_surf and (race_img_y_pos + scaled_race_img_h_val + down_arrow_surf.get_height() > bottom_y_end - arrow_gap):
+                            scroll_down_y_pos = lines_drawn_y_end + arrow_gap
                         elif not race_image_to_draw_below_text_surf: 
-                            scroll_down_y_pos = bottom_y_end - down_arrow_surf.get_height() -5
+                            scroll_down_y_pos = bottom_y_end - down_arrow_surf.get_height() - arrow_gap
                         self.screen.blit(down_arrow_surf, (content_panel_x + text_area_width - down_arrow_surf.get_width(), scroll_down_y_pos ))
                 nav_instr = "UP/DOWN: Scroll | ESC: Back to Entries List"
             else: 
@@ -585,29 +669,18 @@ class UIManager:
 
     def draw_main_menu(self):
         ui_flow_ctrl = self.game_controller.ui_flow_controller
-        menu_bg_surface = self.ui_asset_surfaces.get("menu_background")
-        if menu_bg_surface:
-            try: 
-                self.screen.blit(pygame.transform.smoothscale(menu_bg_surface, (WIDTH, HEIGHT)), (0,0))
-            except Exception as e: 
-                logger.error(f"UIManager: Error blitting menu background: {e}")
-                self.screen.fill(BLACK)
-        else: 
-            self.screen.fill(BLACK) 
-        
-        if ui_flow_ctrl.menu_stars:
-            for star_params in ui_flow_ctrl.menu_stars: 
-                pygame.draw.circle(self.screen, WHITE, (int(star_params[0]), int(star_params[1])), star_params[3])
-        
+        layer_state = (ui_flow_ctrl.selected_menu_option, tuple(ui_flow_ctrl.menu_options), gs.SETTINGS_MODIFIED)
+        self._blit_static_menu_layer("main_menu", layer_state, self._draw_main_menu_layout)
+
+    def _draw_main_menu_layout(self):
+        ui_flow_ctrl = self.game_controller.ui_flow_controller
         selected_option_idx = ui_flow_ctrl.selected_menu_option
-        menu_item_start_y = HEIGHT // 2 - 80 
-        item_spacing = 85 
+        menu_item_start_y = HEIGHT // 2 - gs.scaled_px(80, as_int=True)
+        item_spacing = gs.scaled_px(85, as_int=True)
         unselected_label_font_size = 48
         selected_label_font_size = 54
         # Font for icons (emoji or symbols) - use key from manifest
-        temp_icon_font = self.asset_manager.get_font("ui_emoji_general", 32) # Example size, adjust as needed
-        if not temp_icon_font: temp_icon_font = self.asset_manager.get_font("menu_text", 60) # Fallback
-        if not temp_icon_font: temp_icon_font = pygame.font.Font(None, 32) # Final fallback
+        icon_font_key = "ui_emoji_general"; icon_font_size = 32
 
         # Menu font path is no longer needed here, GameController preloads "neuropol_title" etc.
         # font_path_neuropol = self.game_controller.font_path_neuropol # REMOVE
@@ -627,11 +700,8 @@ class UIManager:
                 icon_char_calc = full_label_calc[0]; label_text_calc = full_label_calc[2:]
             
             # Font for label text - key "menu_text" from manifest, with specific size
-            temp_label_font_for_calc = self.asset_manager.get_font("menu_text", selected_label_font_size)
-            if not temp_label_font_for_calc: temp_label_font_for_calc = pygame.font.Font(None, selected_label_font_size)
-            
-            icon_surf_calc = temp_icon_font.render(icon_char_calc, True, WHITE) if icon_char_calc else None
-            label_surf_calc = temp_label_font_for_calc.render(label_text_calc, True, WHITE)
+            icon_surf_calc = self._render_text_safe(icon_char_calc, icon_font_key, WHITE, fallback_size=icon_font_size) if icon_char_calc else None
+            label_surf_calc = self._render_text_safe(label_text_calc, "menu_text", WHITE, fallback_size=selected_label_font_size)
             
             current_combined_width = 0; current_content_height = 0
             if icon_surf_calc: 
@@ -643,7 +713,7 @@ class UIManager:
             max_combined_width = max(max_combined_width, current_combined_width)
             max_content_height = max(max_content_height, current_content_height)
         
-        horizontal_padding = 30; vertical_padding = 15; min_button_width = 280
+        horizontal_padding = gs.scaled_px(30, as_int=True); vertical_padding = gs.scaled_px(15, as_int=True); min_button_width = gs.scaled_px(280, as_int=True)
         fixed_button_width = max(min_button_width, max_combined_width + horizontal_padding)
         fixed_button_height = max_content_height + vertical_padding
 
@@ -658,12 +728,8 @@ class UIManager:
             
             current_label_font_size = selected_label_font_size if is_selected else unselected_label_font_size
             # Use the same "menu_text" key but with dynamic size
-            label_font = self.asset_manager.get_font("menu_text", current_label_font_size)
-            if not label_font: label_font = pygame.font.Font(None, current_label_font_size) # Fallback
-            
-            icon_font = temp_icon_font # Already fetched
-            icon_surf = icon_font.render(icon_char, True, text_color) if icon_char else None
-            label_surf = label_font.render(label_text, True, text_color)
+            icon_surf = self._render_text_safe(icon_char, icon_font_key, text_color, fallback_size=icon_font_size) if icon_char else None
+            label_surf = self._render_text_safe(label_text, "menu_text", text_color, fallback_size=current_label_font_size)
             
             button_surface = pygame.Surface((fixed_button_width, fixed_button_height), pygame.SRCALPHA)
             bg_color = (70, 70, 70, 220) if is_selected else (50, 50, 50, 180)
@@ -691,10 +757,18 @@ class UIManager:
             self.screen.blit(warning_bg_box, warning_bg_box.get_rect(center=(WIDTH // 2, self.SECONDARY_INSTRUCTION_CENTER_Y)))
 
     def draw_drone_select_menu(self):
+        ui_flow_ctrl = self.game_controller.ui_flow_controller
+        drone_options_ids = ui_flow_ctrl.drone_select_options
+        current_drone_id = drone_options_ids[ui_flow_ctrl.selected_drone_preview_index] if drone_options_ids else None
+        layer_state = (tuple(drone_options_ids), ui_flow_ctrl.selected_drone_preview_index, self.drone_system.get_selected_drone_id(),
+                       self.drone_system.get_player_cores(), self.drone_system.is_drone_unlocked(current_drone_id) if current_drone_id else False)
+        self._blit_static_menu_layer("drone_select", layer_state, self._draw_drone_select_layout)
+
+    def _draw_drone_select_layout(self):
         ui_flow_ctrl = self.game_controller.ui_flow_controller
         # Use specific font keys and sizes for rendering
         title_surf = self._render_text_safe("Select Drone", "title_text", GOLD, fallback_size=90)
-        title_rect = title_surf.get_rect(center=(WIDTH // 2, 70))
+        title_rect = title_surf.get_rect(center=(WIDTH // 2, gs.scaled_px(70, as_int=True)))
         self.screen.blit(title_surf, title_rect)
 
         drone_options_ids = ui_flow_ctrl.drone_select_options
@@ -719,7 +793,7 @@ class UIManager:
         # Let's assume GameController's manifest does not scale these and UIManager scales as needed.
         unscaled_drone_image_surf = self.asset_manager.get_image(drone_image_asset_key)
         drone_image_surf_display = None
-        target_display_size = (200,200) # Target display size for drone image on this screen
+        target_display_size = (gs.scaled_px(200, as_int=True),) * 2 # Target display size for drone image on this screen
 
         if unscaled_drone_image_surf:
             try:
@@ -775,7 +849,7 @@ class UIManager:
             stats_content_surfaces.append((label_s, value_s))
             max_stat_label_w = max(max_stat_label_w, label_s.get_width()); max_stat_value_w = max(max_stat_value_w, value_s.get_width())
         
-        stats_box_padding = 15
+        stats_box_padding = gs.scaled_px(15, as_int=True)
         stats_box_visual_width = max_stat_label_w + max_stat_value_w + 3 * stats_box_padding
         stats_box_visual_height = (len(stats_content_surfaces) * stat_line_h) - (5 if stats_content_surfaces else 0) + 2 * stats_box_padding
 
@@ -814,7 +888,7 @@ class UIManager:
         unlock_info_height = unlock_info_surf.get_height() if unlock_info_surf else 0
 
         # ... (card dimension calculation and drawing remains similar, using rendered surfaces) ...
-        spacing_between_elements = 15; padding_inside_card = 25
+        spacing_between_elements = gs.scaled_px(15, as_int=True); padding_inside_card = gs.scaled_px(25, as_int=True)
         card_content_total_h = (img_height + spacing_between_elements + name_height + 
                                 spacing_between_elements + stats_box_visual_height + 
                                 spacing_between_elements + total_desc_height + 
@@ -825,10 +899,10 @@ class UIManager:
         card_w = max(max_content_width_for_card + 2 * padding_inside_card, WIDTH * 0.5); card_w = min(card_w, WIDTH * 0.65)
         card_h = card_content_total_h + 2 * padding_inside_card + 20
         title_bottom = title_rect.bottom if title_rect else 100
-        main_card_x = (WIDTH - card_w) // 2; main_card_y = title_bottom + 30 # Slightly less gap
+        main_card_x = (WIDTH - card_w) // 2; main_card_y = title_bottom + gs.scaled_px(30, as_int=True) # Slightly less gap
         main_card_rect = pygame.Rect(main_card_x, main_card_y, card_w, card_h)
         
-        pygame.draw.rect(self.screen, (25,30,40,230), main_card_rect, border_radius=20)
+        pygame.draw.rect(self.screen, (25,30,40), main_card_rect, border_radius=20) # Opaque, as on the display surface
         pygame.draw.rect(self.screen, GOLD, main_card_rect, 3, border_radius=20)
 
         current_y_in_card = main_card_rect.top + padding_inside_card
@@ -849,7 +923,7 @@ class UIManager:
 
         # Stats Box
         final_stats_box_draw_rect = pygame.Rect(main_card_rect.centerx - stats_box_visual_width // 2, current_y_in_card, stats_box_visual_width, stats_box_visual_height)
-        pygame.draw.rect(self.screen, (40,45,55,200), final_stats_box_draw_rect, border_radius=10)
+        pygame.draw.rect(self.screen, (40,45,55), final_stats_box_draw_rect, border_radius=10)
         pygame.draw.rect(self.screen, CYAN, final_stats_box_draw_rect, 1, border_radius=10)
         stat_y_pos_render = final_stats_box_draw_rect.top + stats_box_padding
         for i, (label_s, value_s) in enumerate(stats_content_surfaces):
@@ -870,12 +944,9 @@ class UIManager:
             self.screen.blit(unlock_info_surf, unlock_info_rect)
 
         # Navigation Arrows
-        arrow_font = self.asset_manager.get_font("arrow_font_key", 60) # Default size defined in manifest
-        if not arrow_font: arrow_font = self.asset_manager.get_font("large_text", 74) # Fallback
-        if not arrow_font: arrow_font = pygame.font.Font(None, 60) # Final fallback
-        
-        left_arrow_surf = arrow_font.render("◀", True, WHITE if len(drone_options_ids) > 1 else GREY)
-        right_arrow_surf = arrow_font.render("▶", True, WHITE if len(drone_options_ids) > 1 else GREY)
+        arrow_color = WHITE if len(drone_options_ids) > 1 else GREY
+        left_arrow_surf = self._render_text_safe("◀", "arrow_font_key", arrow_color, fallback_size=60) # Default size defined in manifest
+        right_arrow_surf = self._render_text_safe("▶", "arrow_font_key", arrow_color, fallback_size=60)
         arrow_y_center = main_card_rect.centery; arrow_padding_from_card_edge = 40
         if len(drone_options_ids) > 1:
             left_arrow_rect = left_arrow_surf.get_rect(centery=arrow_y_center, right=main_card_rect.left - arrow_padding_from_card_edge)
@@ -898,9 +969,9 @@ class UIManager:
         
         # ... (cores display positioning remains the same) ...
         total_cores_display_width = cores_label_text_surf.get_width() + cores_value_text_surf.get_width() + cores_emoji_surf.get_width()
-        cores_start_x = WIDTH - 20 - total_cores_display_width
+        cores_start_x = WIDTH - gs.scaled_px(20, as_int=True) - total_cores_display_width
         max_element_height_cores = max(cores_label_text_surf.get_height(), cores_value_text_surf.get_height(), cores_emoji_surf.get_height())
-        cores_y_baseline = self.BOTTOM_INSTRUCTION_CENTER_Y - (instr_bg_box.get_height() // 2) - 10 - max_element_height_cores 
+        cores_y_baseline = self.BOTTOM_INSTRUCTION_CENTER_Y - (instr_bg_box.get_height() // 2) - gs.scaled_px(10, as_int=True) - max_element_height_cores
         current_x_offset_cores = cores_start_x
         self.screen.blit(cores_label_text_surf, (current_x_offset_cores, cores_y_baseline + (max_element_height_cores - cores_label_text_surf.get_height()) // 2))
         current_x_offset_cores += cores_label_text_surf.get_width()
@@ -929,61 +1000,80 @@ class UIManager:
         lines.append(current_line.strip())
         return lines
 
-    def draw_gameplay_hud(self):
-        if not self.game_controller.player: return
-
-        panel_y_start = GAME_PLAY_AREA_HEIGHT; panel_height = BOTTOM_PANEL_HEIGHT
-        panel_surf = pygame.Surface((WIDTH, panel_height), pygame.SRCALPHA)
+    def _create_hud_panel_background(self):
+        panel_surf = pygame.Surface((WIDTH, BOTTOM_PANEL_HEIGHT), pygame.SRCALPHA)
         panel_surf.fill((20,25,35,220)); pygame.draw.line(panel_surf, (80,120,170,200), (0,0), (WIDTH,0), 2)
-        self.screen.blit(panel_surf, (0, panel_y_start))
-
-        h_padding = 20; v_padding = 10; element_spacing = 6; bar_height = 18
-        icon_to_bar_gap = 10; icon_spacing = 5; text_icon_spacing = 2
-        current_time_ticks = pygame.time.get_ticks()
-        
-        # Font keys and sizes (match manifest)
-        ui_text_font_key = "ui_text"; ui_text_font_size = 28
-        ui_values_font_key = "ui_values"; ui_values_font_size = 30
-        ui_emoji_general_key = "ui_emoji_general"; ui_emoji_general_size = 32
-        ui_emoji_small_key = "ui_emoji_small"; ui_emoji_small_size = 20
-        small_text_font_key = "small_text"; small_text_font_size = 24
-        
-        # --- Left Side ---
-        vitals_x_start = h_padding; current_vitals_y = panel_y_start + panel_height - v_padding
+        return panel_surf
+
+    def _get_hud_fragment_order(self):
+        """Fragment IDs in HUD slot order. Sorted once instead of on every frame."""
+        if self._hud_fragment_order is None:
+            fragment_display_order_ids = []
+            if CORE_FRAGMENT_DETAILS:
+                try: 
+                    sorted_frag_keys = sorted([k for k in CORE_FRAGMENT_DETAILS.keys() if k != "fragment_vault_core"])
+                    fragment_display_order_ids = [CORE_FRAGMENT_DETAILS[key]["id"] for key in sorted_frag_keys if "id" in CORE_FRAGMENT_DETAILS[key]]
+                except Exception as e: 
+                    logger.error(f"UIManager: Error creating fragment display order: {e}. Using unsorted.")
+                    fragment_display_order_ids = [details["id"] for _, details in CORE_FRAGMENT_DETAILS.items() if details and "id" in details and details.get("id") != "vault_core"]
+            self._hud_fragment_order = fragment_display_order_ids[:TOTAL_CORE_FRAGMENTS_NEEDED]
+        return self._hud_fragment_order
+
+    def _draw_hud_bar(self, surface, bar_rect, fill_width, fill_color):
+        pygame.draw.rect(surface, DARK_GREY, bar_rect)
+        if fill_width > 0: pygame.draw.rect(surface, fill_color, (bar_rect[0], bar_rect[1], fill_width, bar_rect[3]))
+        pygame.draw.rect(surface, WHITE, bar_rect, 1)
+
+    def _hud_bar_segment_width(self, icon_surf, icon_to_bar_gap=gs.scaled_px(10, as_int=True)):
         vitals_section_width = int(WIDTH / 3.2)
-        max_icon_width_left = 0
+        available_width_for_bar = vitals_section_width - ((icon_surf.get_width() + icon_to_bar_gap) if icon_surf else 0)
+        return max(25, int(available_width_for_bar * 0.85))
+
+    def _hud_bar_row_top(self, bar_height, *surfaces):
+        """Bar offset inside a row surface that keeps taller items centred on the bar. The row is 2 * offset + bar_height tall."""
+        return max([0] + [-((bar_height - surf.get_height()) // 2) for surf in surfaces if surf])
+
+    def _render_hud_icon_bar(self, icon_char, icon_color, bar_width, fill_width, fill_color, bar_height=gs.scaled_px(18, as_int=True), icon_to_bar_gap=gs.scaled_px(10, as_int=True)):
+        """One HUD row: an emoji icon followed by a fill bar, both vertically centred. The bar ends the row."""
+        icon_surf = self._render_text_safe(icon_char, "ui_emoji_small", icon_color, fallback_size=20)
+        icon_w = icon_surf.get_width() + icon_to_bar_gap if icon_surf else 0
+        bar_y = self._hud_bar_row_top(bar_height, icon_surf)
+        row_surf = pygame.Surface((icon_w + bar_width, bar_height + 2 * bar_y), pygame.SRCALPHA)
+        if icon_surf: row_surf.blit(icon_surf, (0, bar_y + (bar_height - icon_surf.get_height()) // 2))
+        self._draw_hud_bar(row_surf, (icon_w, bar_y, bar_width, bar_height), fill_width, fill_color)
+        return row_surf
+
+    def _draw_hud_bar_fill(self, surface, row_rect, bar_width, fill_fraction, fill_color, bar_height=gs.scaled_px(18, as_int=True)):
+        """Draws a bar's fill (and its border back over it) onto the empty bar of a _render_hud_icon_bar row at row_rect."""
+        bar_rect = pygame.Rect(row_rect.right - bar_width, row_rect.y + (row_rect.height - bar_height) // 2, bar_width, bar_height)
+        fill_width = int(bar_width * fill_fraction)
+        if fill_width <= 0: return
+        pygame.draw.rect(surface, fill_color, (bar_rect.x, bar_rect.y, fill_width, bar_rect.height))
+        pygame.draw.rect(surface, WHITE, bar_rect, 1)
+
+    def _render_hud_icon_row(self, icons, icon_spacing=gs.scaled_px(5, as_int=True)):
+        """Lays a list of equally sized icon surfaces out left to right on one surface."""
+        icon_w, icon_h = icons[0].get_size() if icons else (1, 1)
+        row_surf = pygame.Surface((max(1, len(icons) * (icon_w + icon_spacing) - icon_spacing), icon_h), pygame.SRCALPHA)
+        for i, icon in enumerate(icons):
+            if icon: row_surf.blit(icon, (i * (icon_w + icon_spacing), 0))
+        return row_surf
+
+    def _hud_lives_value(self):
+        life_icon_surf = self.ui_asset_surfaces.get("current_drone_life_icon")
+        return (self.game_controller.lives, life_icon_surf) if life_icon_surf else None
+
+    def _render_hud_lives(self, value):
+        if value is None: return None
+        lives, life_icon_surf = value
+        if lives <= 0: return pygame.Surface((1, self.ui_icon_size_lives[1]), pygame.SRCALPHA) # Keeps the row's height in the layout
+        return self._render_hud_icon_row([life_icon_surf] * lives)
+
+    def _hud_weapon_state(self):
+        """(icon, charge fraction, fill colour) of the current weapon's cooldown bar."""
         player_obj = self.game_controller.player
-        
-        # Weapon Icon (using _render_text_safe for emoji)
+        current_time_ticks = pygame.time.get_ticks()
         weapon_icon_char = WEAPON_MODE_ICONS.get(player_obj.current_weapon_mode, "💥")
-        temp_weapon_icon_surf = self._render_text_safe(weapon_icon_char, ui_emoji_small_key, ORANGE, fallback_size=ui_emoji_small_size)
-        if temp_weapon_icon_surf: max_icon_width_left = max(max_icon_width_left, temp_weapon_icon_surf.get_width())
-        
-        # Player Lives Icon (from ui_asset_surfaces, loaded via AssetManager)
-        life_icon_surf = self.ui_asset_surfaces.get("current_drone_life_icon")
-        if life_icon_surf: max_icon_width_left = max(max_icon_width_left, life_icon_surf.get_width())
-        
-        if life_icon_surf:
-            lives_y_pos = current_vitals_y - self.ui_icon_size_lives[1]
-            lives_draw_x = vitals_x_start
-            for i in range(self.game_controller.lives):
-                self.screen.blit(life_icon_surf, (lives_draw_x + i * (self.ui_icon_size_lives[0] + icon_spacing), lives_y_pos))
-            current_vitals_y = lives_y_pos - element_spacing
-        
-        # Weapon Charge Bar
-        weapon_bar_y_pos = current_vitals_y - bar_height
-        if temp_weapon_icon_surf:
-             self.screen.blit(temp_weapon_icon_surf, (vitals_x_start, weapon_bar_y_pos + (bar_height - temp_weapon_icon_surf.get_height()) // 2))
-             bar_start_x_weapon = vitals_x_start + temp_weapon_icon_surf.get_width() + icon_to_bar_gap
-        else: # Fallback if icon surface failed to render
-             bar_start_x_weapon = vitals_x_start 
-        
-        min_bar_segment_width = 25 
-        bar_segment_reduction_factor = 0.85
-        available_width_for_bar = vitals_section_width - (bar_start_x_weapon - vitals_x_start) # Width from bar start to section end
-        bar_segment_width_weapon = max(min_bar_segment_width, int(available_width_for_bar * bar_segment_reduction_factor))
-        
-        # ... (weapon charge calculation logic remains the same) ...
         charge_fill_pct = 0.0; weapon_ready_color = PLAYER_BULLET_COLOR
         cooldown_duration = player_obj.current_shoot_cooldown; time_since_last_shot = current_time_ticks - player_obj.last_shot_time
         if player_obj.current_weapon_mode == gs.WEAPON_MODE_HEATSEEKER or player_obj.current_weapon_mode == gs.WEAPON_MODE_HEATSEEKER_PLUS_BULLETS:
@@ -993,55 +1083,61 @@ class UIManager:
         if cooldown_duration > 0: charge_fill_pct = min(1.0, time_since_last_shot / cooldown_duration)
         else: charge_fill_pct = 1.0
         charge_bar_fill_color = weapon_ready_color if charge_fill_pct >= 1.0 else ORANGE
-        weapon_bar_width_fill = int(bar_segment_width_weapon * charge_fill_pct)
-        
-        pygame.draw.rect(self.screen, DARK_GREY, (bar_start_x_weapon, weapon_bar_y_pos, bar_segment_width_weapon, bar_height))
-        if weapon_bar_width_fill > 0: pygame.draw.rect(self.screen, charge_bar_fill_color, (bar_start_x_weapon, weapon_bar_y_pos, weapon_bar_width_fill, bar_height))
-        pygame.draw.rect(self.screen, WHITE, (bar_start_x_weapon, weapon_bar_y_pos, bar_segment_width_weapon, bar_height), 1)
-        current_vitals_y = weapon_bar_y_pos - element_spacing
+        return (weapon_icon_char, charge_fill_pct, charge_bar_fill_color)
+
+    def _hud_weapon_value(self):
+        # Only the icon and the bar's size; the charge moves every tick while firing and is drawn by _draw_hud_weapon_fill
+        weapon_icon_char = self._hud_weapon_state()[0]
+        return (weapon_icon_char, self._hud_bar_segment_width(self._render_text_safe(weapon_icon_char, "ui_emoji_small", ORANGE, fallback_size=20)))
+
+    def _render_hud_weapon(self, value):
+        weapon_icon_char, bar_width = value
+        return self._render_hud_icon_bar(weapon_icon_char, ORANGE, bar_width, 0, ORANGE)
 
-        # Active Power-up Bar
-        # ... (power-up bar logic remains, using _render_text_safe for emoji icons) ...
+    def _draw_hud_weapon_fill(self, surface, row_rect, value):
+        _, charge_fill_pct, charge_bar_fill_color = self._hud_weapon_state()
+        self._draw_hud_bar_fill(surface, row_rect, value[1], charge_fill_pct, charge_bar_fill_color)
+
+    def _hud_powerup_state(self):
+        """(icon, remaining fraction, fill colour) of the active timed power-up, or None."""
+        player_obj = self.game_controller.player
         active_powerup_for_ui = player_obj.active_powerup_type
-        if active_powerup_for_ui and (player_obj.shield_active or player_obj.speed_boost_active):
-            powerup_bar_y_pos = current_vitals_y - bar_height
-            powerup_icon_char = ""; powerup_bar_fill_color = WHITE; powerup_fill_percentage = 0.0
-            powerup_details_config = POWERUP_TYPES.get(active_powerup_for_ui, {})
-
-            if active_powerup_for_ui == "shield" and player_obj.shield_active:
-                powerup_icon_char = "🛡️"; powerup_bar_fill_color = powerup_details_config.get("color", LIGHT_BLUE)
-                remaining_time = player_obj.shield_end_time - current_time_ticks
-                if player_obj.shield_duration > 0 and remaining_time > 0: powerup_fill_percentage = remaining_time / player_obj.shield_duration
-            elif active_powerup_for_ui == "speed_boost" and player_obj.speed_boost_active:
-                powerup_icon_char = "💨"; powerup_bar_fill_color = powerup_details_config.get("color", GREEN)
-                remaining_time = player_obj.speed_boost_end_time - current_time_ticks
-                if player_obj.speed_boost_duration > 0 and remaining_time > 0: powerup_fill_percentage = remaining_time / player_obj.speed_boost_duration
-            
-            powerup_fill_percentage = max(0, min(1, powerup_fill_percentage))
-            
-            if powerup_icon_char:
-                powerup_icon_surf = self._render_text_safe(powerup_icon_char, ui_emoji_small_key, WHITE, fallback_size=ui_emoji_small_size)
-                if powerup_icon_surf:
-                    self.screen.blit(powerup_icon_surf, (vitals_x_start, powerup_bar_y_pos + (bar_height - powerup_icon_surf.get_height()) // 2))
-                    bar_start_x_powerup = vitals_x_start + powerup_icon_surf.get_width() + icon_to_bar_gap
-                    available_width_powerup_bar = vitals_section_width - (powerup_icon_surf.get_width() + icon_to_bar_gap)
-                else: # Fallback if icon surface failed
-                    bar_start_x_powerup = vitals_x_start
-                    available_width_powerup_bar = vitals_section_width
-                
-                bar_segment_width_powerup = max(min_bar_segment_width, int(available_width_powerup_bar * bar_segment_reduction_factor))
-                bar_width_fill_powerup = int(bar_segment_width_powerup * powerup_fill_percentage)
-                
-                pygame.draw.rect(self.screen, DARK_GREY, (bar_start_x_powerup, powerup_bar_y_pos, bar_segment_width_powerup, bar_height))
-                if bar_width_fill_powerup > 0: pygame.draw.rect(self.screen, powerup_bar_fill_color, (bar_start_x_powerup, powerup_bar_y_pos, bar_width_fill_powerup, bar_height))
-                pygame.draw.rect(self.screen, WHITE, (bar_start_x_powerup, powerup_bar_y_pos, bar_segment_width_powerup, bar_height), 1)
-        
-        # --- Right Side of HUD ---
-        # ... (Collectible display logic uses self.ui_asset_surfaces for icons) ...
-        # ... (and _render_text_safe for text like core count) ...
-        collectibles_x_anchor = WIDTH - h_padding; current_collectibles_y_right = panel_y_start + panel_height - v_padding
+        if not (active_powerup_for_ui and (player_obj.shield_active or player_obj.speed_boost_active)): return None
+        current_time_ticks = pygame.time.get_ticks()
+        powerup_icon_char = ""; powerup_bar_fill_color = WHITE; powerup_fill_percentage = 0.0
+        powerup_details_config = POWERUP_TYPES.get(active_powerup_for_ui, {})
+        if active_powerup_for_ui == "shield" and player_obj.shield_active:
+            powerup_icon_char = "🛡️"; powerup_bar_fill_color = powerup_details_config.get("color", LIGHT_BLUE)
+            remaining_time = player_obj.shield_end_time - current_time_ticks
+            if player_obj.shield_duration > 0 and remaining_time > 0: powerup_fill_percentage = remaining_time / player_obj.shield_duration
+        elif active_powerup_for_ui == "speed_boost" and player_obj.speed_boost_active:
+            powerup_icon_char = "💨"; powerup_bar_fill_color = powerup_details_config.get("color", GREEN)
+            remaining_time = player_obj.speed_boost_end_time - current_time_ticks
+            if player_obj.speed_boost_duration > 0 and remaining_time > 0: powerup_fill_percentage = remaining_time / player_obj.speed_boost_duration
+        if not powerup_icon_char: return None
+        return (powerup_icon_char, max(0, min(1, powerup_fill_percentage)), powerup_bar_fill_color)
+
+    def _hud_powerup_value(self):
+        # Like the weapon bar, the countdown itself is drawn by _draw_hud_powerup_fill
+        powerup_state = self._hud_powerup_state()
+        if powerup_state is None: return None
+        powerup_icon_char = powerup_state[0]
+        return (powerup_icon_char, self._hud_bar_segment_width(self._render_text_safe(powerup_icon_char, "ui_emoji_small", WHITE, fallback_size=20)))
+
+    def _render_hud_powerup(self, value):
+        if value is None: return None
+        powerup_icon_char, bar_width = value
+        return self._render_hud_icon_bar(powerup_icon_char, WHITE, bar_width, 0, WHITE)
+
+    def _draw_hud_powerup_fill(self, surface, row_rect, value):
+        powerup_state = self._hud_powerup_state()
+        if value is None or powerup_state is None: return
+        _, powerup_fill_percentage, powerup_bar_fill_color = powerup_state
+        self._draw_hud_bar_fill(surface, row_rect, value[1], powerup_fill_percentage, powerup_bar_fill_color)
+
+    def _render_hud_core_bar(self, current_cores):
         core_milestone_data = [{'threshold': 1000, 'color': LIGHT_BLUE, 'label': '1K'}, {'threshold': 5000, 'color': GREEN, 'label': '5K'}, {'threshold': 10000, 'color': ORANGE, 'label': '10K'}, {'threshold': 20000, 'color': RED, 'label': '20K'}, {'threshold': 50000, 'color': PURPLE, 'label': '50K'}, {'threshold': 100000, 'color': GOLD, 'label': 'MAX'}]
-        current_cores = self.drone_system.get_player_cores(); lower_bound = 0; upper_bound = core_milestone_data[0]['threshold']
+        lower_bound = 0; upper_bound = core_milestone_data[0]['threshold']
         bar_color = core_milestone_data[0]['color']; milestone_label_str = core_milestone_data[0]['label']
         for i in range(len(core_milestone_data)):
             tier_info = core_milestone_data[i]
@@ -1054,32 +1150,88 @@ class UIManager:
             bar_color = tier_info['color']; milestone_label_str = tier_info['label']
         tier_range = upper_bound - lower_bound; progress_in_tier = current_cores - lower_bound; progress_percentage = 1.0
         if tier_range > 0: progress_percentage = min(1.0, progress_in_tier / tier_range)
-        core_bar_width = 150; core_bar_height = bar_height; core_bar_filled_width = int(core_bar_width * progress_percentage)
-        milestone_label_surf = self._render_text_safe(milestone_label_str, small_text_font_key, bar_color, fallback_size=small_text_font_size)
-        core_icon_surf = self._render_text_safe("💠", ui_emoji_small_key, GOLD, fallback_size=ui_emoji_small_size)
-        core_bar_y_pos = current_collectibles_y_right - core_bar_height
-        label_x = collectibles_x_anchor - milestone_label_surf.get_width()
-        core_bar_x_pos = label_x - core_bar_width - 5 
-        icon_x = core_bar_x_pos - core_icon_surf.get_width() - icon_to_bar_gap
-        self.screen.blit(core_icon_surf, (icon_x, core_bar_y_pos + (core_bar_height - core_icon_surf.get_height()) // 2))
-        pygame.draw.rect(self.screen, DARK_GREY, (core_bar_x_pos, core_bar_y_pos, core_bar_width, core_bar_height))
-        if core_bar_filled_width > 0: pygame.draw.rect(self.screen, bar_color, (core_bar_x_pos, core_bar_y_pos, core_bar_filled_width, core_bar_height))
-        pygame.draw.rect(self.screen, WHITE, (core_bar_x_pos, core_bar_y_pos, core_bar_width, core_bar_height), 1)
-        self.screen.blit(milestone_label_surf, (label_x, core_bar_y_pos + (core_bar_height - milestone_label_surf.get_height()) // 2))
-        current_collectibles_y_right = core_bar_y_pos - element_spacing
-
-        fragment_icon_h = self.ui_icon_size_fragments[1]; fragment_y_pos_hud = current_collectibles_y_right - fragment_icon_h
-        fragment_display_order_ids = []
-        if CORE_FRAGMENT_DETAILS:
-            try: 
-                sorted_frag_keys = sorted([k for k in CORE_FRAGMENT_DETAILS.keys() if k != "fragment_vault_core"])
-                fragment_display_order_ids = [CORE_FRAGMENT_DETAILS[key]["id"] for key in sorted_frag_keys if "id" in CORE_FRAGMENT_DETAILS[key]]
-            except Exception as e: 
-                logger.error(f"UIManager: Error creating fragment display order: {e}. Using unsorted.")
-                fragment_display_order_ids = [details["id"] for _, details in CORE_FRAGMENT_DETAILS.items() if details and "id" in details and details.get("id") != "vault_core"]
-        displayable_fragment_ids = fragment_display_order_ids[:TOTAL_CORE_FRAGMENTS_NEEDED]
-        
-        # Draw animating collectibles (rings, fragments) - logic remains, surfaces are already scaled if needed
+        core_bar_width = gs.scaled_px(150, as_int=True); core_bar_height = gs.scaled_px(18, as_int=True); icon_to_bar_gap = gs.scaled_px(10, as_int=True); label_gap = gs.scaled_px(5, as_int=True)
+        milestone_label_surf = self._render_text_safe(milestone_label_str, "small_text", bar_color, fallback_size=24)
+        core_icon_surf = self._render_text_safe("💠", "ui_emoji_small", GOLD, fallback_size=20)
+        bar_y = self._hud_bar_row_top(core_bar_height, core_icon_surf, milestone_label_surf)
+        row_surf = pygame.Surface((core_icon_surf.get_width() + icon_to_bar_gap + core_bar_width + label_gap + milestone_label_surf.get_width(), core_bar_height + 2 * bar_y), pygame.SRCALPHA)
+        core_bar_x_pos = core_icon_surf.get_width() + icon_to_bar_gap
+        row_surf.blit(core_icon_surf, (0, bar_y + (core_bar_height - core_icon_surf.get_height()) // 2))
+        self._draw_hud_bar(row_surf, (core_bar_x_pos, bar_y, core_bar_width, core_bar_height), int(core_bar_width * progress_percentage), bar_color)
+        row_surf.blit(milestone_label_surf, (core_bar_x_pos + core_bar_width + label_gap, bar_y + (core_bar_height - milestone_label_surf.get_height()) // 2))
+        return row_surf
+
+    def _hud_fragments_value(self):
+        if TOTAL_CORE_FRAGMENTS_NEEDED <= 0: return None
+        displayable_fragment_ids = self._get_hud_fragment_order()
+        return tuple(i < len(displayable_fragment_ids) and displayable_fragment_ids[i] in self.game_controller.hud_displayed_fragments for i in range(TOTAL_CORE_FRAGMENTS_NEEDED))
+
+    def _render_hud_fragments(self, slots_collected):
+        if slots_collected is None: return None
+        displayable_fragment_ids = self._get_hud_fragment_order()
+        empty_icon = self.ui_asset_surfaces["core_fragment_empty_icon"]
+        icons = [self.ui_asset_surfaces["core_fragment_icons"].get(displayable_fragment_ids[i], empty_icon) if collected else empty_icon for i, collected in enumerate(slots_collected)]
+        return self._render_hud_icon_row(icons)
+
+    def _hud_rings_value(self):
+        total_rings_this_level = self.game_controller.total_rings_per_level
+        if not self.ui_asset_surfaces.get("ring_icon") or total_rings_this_level <= 0: return None
+        return (total_rings_this_level, self.game_controller.displayed_collected_rings_count)
+
+    def _render_hud_rings(self, value):
+        if value is None: return None
+        total_rings_this_level, displayed_rings_count = value
+        ring_icon_surface = self.ui_asset_surfaces.get("ring_icon"); ring_icon_empty_surface = self.ui_asset_surfaces.get("ring_icon_empty")
+        return self._render_hud_icon_row([ring_icon_surface if i < displayed_rings_count else ring_icon_empty_surface for i in range(total_rings_this_level)])
+
+    def _layout_gameplay_hud(self, layer, widgets):
+        h_padding = gs.scaled_px(20, as_int=True); v_padding = gs.scaled_px(10, as_int=True); element_spacing = gs.scaled_px(6, as_int=True); icon_spacing = gs.scaled_px(5, as_int=True); bar_height = gs.scaled_px(18, as_int=True)
+        bar_rows = ("weapon", "powerup", "cores") # Stacked by bar height, taller icons and labels overhang the bar
+        current_vitals_y = current_collectibles_y_right = layer.get_height() - v_padding
+        for name in ("lives", "weapon", "powerup"):
+            widget = widgets[name]
+            if widget.surface is None: widget.rect = None; continue
+            row_h = bar_height if name in bar_rows else widget.surface.get_height()
+            current_vitals_y -= row_h
+            widget.rect = pygame.Rect((h_padding, current_vitals_y - (widget.surface.get_height() - row_h) // 2), widget.surface.get_size())
+            layer.blit(widget.surface, widget.rect); current_vitals_y -= element_spacing
+        for name in ("cores", "fragments", "rings"):
+            widget = widgets[name]
+            if widget.surface is None: widget.rect = None; continue
+            row_h = bar_height if name in bar_rows else widget.surface.get_height()
+            current_collectibles_y_right -= row_h
+            widget.rect = pygame.Rect((WIDTH - h_padding - widget.surface.get_width(), current_collectibles_y_right - (widget.surface.get_height() - row_h) // 2), widget.surface.get_size())
+            layer.blit(widget.surface, widget.rect); current_collectibles_y_right -= element_spacing
+
+        # Point the fly-in animations at the slots where the icons now sit on screen
+        fragments_rect = widgets["fragments"].rect
+        if fragments_rect and hasattr(self.game_controller, 'fragment_ui_target_positions'):
+            for i, frag_id in enumerate(self._get_hud_fragment_order()):
+                self.game_controller.fragment_ui_target_positions[frag_id] = \
+                    (fragments_rect.x + i * (self.ui_icon_size_fragments[0] + icon_spacing) + self.ui_icon_size_fragments[0] // 2, GAME_PLAY_AREA_HEIGHT + fragments_rect.y + self.ui_icon_size_fragments[1] // 2)
+        rings_widget = widgets["rings"]
+        if rings_widget.rect and hasattr(self.game_controller, 'ring_ui_target_pos'):
+            total_rings_this_level, displayed_rings_count = rings_widget.value
+            _next_ring_slot_index = max(0, min(displayed_rings_count, total_rings_this_level - 1))
+            self.game_controller.ring_ui_target_pos = (rings_widget.rect.x + _next_ring_slot_index * (self.ui_icon_size_rings[0] + icon_spacing) + self.ui_icon_size_rings[0] // 2,
+                                                       GAME_PLAY_AREA_HEIGHT + rings_widget.rect.y + self.ui_icon_size_rings[1] // 2)
+
+    def _build_gameplay_hud(self):
+        hud_panel = RetainedHudPanel((WIDTH, BOTTOM_PANEL_HEIGHT), self._create_hud_panel_background(), self._layout_gameplay_hud)
+        hud_panel.add_widget("lives", self._hud_lives_value, self._render_hud_lives)
+        hud_panel.add_widget("weapon", self._hud_weapon_value, self._render_hud_weapon, self._draw_hud_weapon_fill)
+        hud_panel.add_widget("powerup", self._hud_powerup_value, self._render_hud_powerup, self._draw_hud_powerup_fill)
+        hud_panel.add_widget("cores", self.drone_system.get_player_cores, self._render_hud_core_bar)
+        hud_panel.add_widget("fragments", self._hud_fragments_value, self._render_hud_fragments)
+        hud_panel.add_widget("rings", self._hud_rings_value, self._render_hud_rings)
+        return hud_panel
+
+    def draw_gameplay_hud(self):
+        if not self.game_controller.player: return
+        if self.gameplay_hud is None: self.gameplay_hud = self._build_gameplay_hud()
+        self.gameplay_hud.draw(self.screen, (0, GAME_PLAY_AREA_HEIGHT))
+
+        # Fly-in animations move every frame, so they stay immediate-mode on top of the cached panel
         if hasattr(self.game_controller, 'animating_rings_to_hud'):
             for ring_anim in self.game_controller.animating_rings_to_hud:
                 if 'surface' in ring_anim and ring_anim['surface']:
@@ -1095,40 +1247,6 @@ class UIManager:
                     draw_y = int(frag_anim['pos'][1] - anim_surf.get_height() / 2)
                     self.screen.blit(anim_surf, (draw_x, draw_y))
 
-        if TOTAL_CORE_FRAGMENTS_NEEDED > 0 :
-            total_fragments_width = TOTAL_CORE_FRAGMENTS_NEEDED * self.ui_icon_size_fragments[0] + max(0, TOTAL_CORE_FRAGMENTS_NEEDED - 1) * icon_spacing
-            fragments_block_start_x = collectibles_x_anchor - total_fragments_width
-            for i in range(TOTAL_CORE_FRAGMENTS_NEEDED):
-                frag_id_for_this_slot = displayable_fragment_ids[i] if i < len(displayable_fragment_ids) else None
-                icon_to_draw_surf = self.ui_asset_surfaces["core_fragment_empty_icon"]
-                if frag_id_for_this_slot and frag_id_for_this_slot in self.game_controller.hud_displayed_fragments:
-                    icon_to_draw_surf = self.ui_asset_surfaces["core_fragment_icons"].get(frag_id_for_this_slot, self.ui_asset_surfaces["core_fragment_empty_icon"])
-                current_frag_x = fragments_block_start_x + i * (self.ui_icon_size_fragments[0] + icon_spacing)
-                if icon_to_draw_surf: self.screen.blit(icon_to_draw_surf, (current_frag_x, fragment_y_pos_hud))
-                if frag_id_for_this_slot and hasattr(self.game_controller, 'fragment_ui_target_positions'):
-                    self.game_controller.fragment_ui_target_positions[frag_id_for_this_slot] = \
-                        (current_frag_x + self.ui_icon_size_fragments[0] // 2, fragment_y_pos_hud + self.ui_icon_size_fragments[1] // 2)
-            current_collectibles_y_right = fragment_y_pos_hud - element_spacing
-
-        total_rings_this_level = self.game_controller.total_rings_per_level
-        displayed_rings_count = self.game_controller.displayed_collected_rings_count
-        ring_icon_surface = self.ui_asset_surfaces.get("ring_icon")
-        ring_icon_empty_surface = self.ui_asset_surfaces.get("ring_icon_empty")
-
-        if ring_icon_surface and total_rings_this_level > 0:
-            ring_icon_h = self.ui_icon_size_rings[1]
-            rings_y_pos_hud = current_collectibles_y_right - ring_icon_h
-            total_ring_icons_width_only = total_rings_this_level * self.ui_icon_size_rings[0] + max(0, total_rings_this_level - 1) * icon_spacing
-            rings_block_start_x = collectibles_x_anchor - total_ring_icons_width_only
-            for i in range(total_rings_this_level):
-                icon_to_draw_ring = ring_icon_surface if i < displayed_rings_count else ring_icon_empty_surface
-                if icon_to_draw_ring: self.screen.blit(icon_to_draw_ring, (rings_block_start_x + i * (self.ui_icon_size_rings[0] + icon_spacing), rings_y_pos_hud))
-            _next_ring_slot_index = max(0, min(displayed_rings_count, total_rings_this_level - 1))
-            target_slot_x_offset = _next_ring_slot_index * (self.ui_icon_size_rings[0] + icon_spacing)
-            target_slot_center_x = rings_block_start_x + target_slot_x_offset + self.ui_icon_size_rings[0] // 2
-            target_slot_center_y = rings_y_pos_hud + self.ui_icon_size_rings[1] // 2
-            if hasattr(self.game_controller, 'ring_ui_target_pos'): self.game_controller.ring_ui_target_pos = (target_slot_center_x, target_slot_center_y)
-
     def get_scaled_fragment_icon_surface(self, fragment_id): # Renamed to avoid conflict if used elsewhere
         """Returns a pre-loaded and scaled icon surface for a given fragment ID."""
         # Assumes icons are loaded by _load_ui_assets_from_manager into self.ui_asset_surfaces["core_fragment_icons"]
@@ -1140,6 +1258,12 @@ class UIManager:
         return self._create_fallback_icon_surface(self.ui_icon_size_fragments, "?", PURPLE) # Fallback if not found
 
     def draw_settings_menu(self):
+        ui_flow_ctrl = self.game_controller.ui_flow_controller
+        settings_items = ui_flow_ctrl.settings_items_data or []
+        layer_state = (ui_flow_ctrl.selected_setting_index, tuple(get_game_setting(item["key"]) for item in settings_items if "key" in item), gs.SETTINGS_MODIFIED)
+        self._blit_static_menu_layer("settings", layer_state, self._draw_settings_layout)
+
+    def _draw_settings_layout(self):
         ui_flow_ctrl = self.game_controller.ui_flow_controller
         title_font_key = "title_text"; title_font_size = 90
         ui_text_font_key = "ui_text"; ui_text_font_size = 28
@@ -1147,18 +1271,18 @@ class UIManager:
 
         title_surf = self._render_text_safe("Settings", title_font_key, GOLD, fallback_size=title_font_size)
         # ... (rest of settings menu drawing logic, using _render_text_safe and font keys/sizes) ...
-        title_bg = pygame.Surface((title_surf.get_width()+30, title_surf.get_height()+15), pygame.SRCALPHA)
+        title_bg = pygame.Surface((title_surf.get_width() + gs.scaled_px(30, as_int=True), title_surf.get_height() + gs.scaled_px(15, as_int=True)), pygame.SRCALPHA)
         title_bg.fill((20,20,20,180)); title_bg.blit(title_surf, title_surf.get_rect(center=(title_bg.get_width()//2, title_bg.get_height()//2)))
-        self.screen.blit(title_bg, title_bg.get_rect(center=(WIDTH//2, 80)))
+        self.screen.blit(title_bg, title_bg.get_rect(center=(WIDTH//2, gs.scaled_px(80, as_int=True))))
         settings_items = ui_flow_ctrl.settings_items_data; selected_idx = ui_flow_ctrl.selected_setting_index
-        item_y_start = 180
+        item_y_start = gs.scaled_px(180, as_int=True); box_pad_x = gs.scaled_px(10, as_int=True); box_pad_y = gs.scaled_px(5, as_int=True)
         
         # Get font for line height calculation
         ui_font_obj = self.asset_manager.get_font(ui_text_font_key, ui_text_font_size)
         if not ui_font_obj: ui_font_obj = pygame.font.Font(None, ui_text_font_size) # Fallback
-        item_line_height = ui_font_obj.get_height() + 20
+        item_line_height = ui_font_obj.get_height() + gs.scaled_px(20, as_int=True)
         
-        max_items_on_screen = (HEIGHT - item_y_start - 120) // item_line_height if item_line_height > 0 else 1
+        max_items_on_screen = (HEIGHT - item_y_start - gs.scaled_px(120, as_int=True)) // item_line_height if item_line_height > 0 else 1
         view_start_index = 0
         if settings_items and len(settings_items) > max_items_on_screen :
             view_start_index = max(0, selected_idx - max_items_on_screen // 2)
@@ -1170,34 +1294,35 @@ class UIManager:
             item = settings_items[list_idx]; y_pos = item_y_start + i_display * item_line_height
             color = YELLOW if list_idx == selected_idx else WHITE
             label_surf = self._render_text_safe(item["label"], ui_text_font_key, color, fallback_size=ui_text_font_size)
-            label_bg_rect_width = max(250, label_surf.get_width() + 20)
-            label_bg_rect = pygame.Rect(WIDTH // 4 - 150, y_pos - 5, label_bg_rect_width, label_surf.get_height() + 10)
-            pygame.draw.rect(self.screen, (30,30,30,160), label_bg_rect, border_radius=5)
-            self.screen.blit(label_surf, (label_bg_rect.left + 10, y_pos))
+            label_bg_rect_width = max(gs.scaled_px(250, as_int=True), label_surf.get_width() + 2 * box_pad_x)
+            label_bg_rect = pygame.Rect(WIDTH // 4 - gs.scaled_px(150, as_int=True), y_pos - box_pad_y, label_bg_rect_width, label_surf.get_height() + 2 * box_pad_y)
+            pygame.draw.rect(self.screen, (30,30,30), label_bg_rect, border_radius=box_pad_y) # Opaque, as on the display surface
+            self.screen.blit(label_surf, (label_bg_rect.left + box_pad_x, y_pos))
             if "note" in item and list_idx == selected_idx:
                 note_surf = self._render_text_safe(item["note"], small_text_font_key, LIGHT_BLUE, fallback_size=small_text_font_size)
-                self.screen.blit(note_surf, note_surf.get_rect(left=label_bg_rect.right + 15, centery=label_bg_rect.centery))
+                self.screen.blit(note_surf, note_surf.get_rect(left=label_bg_rect.right + gs.scaled_px(15, as_int=True), centery=label_bg_rect.centery))
             if item["type"] != "action":
                 current_value = get_game_setting(item["key"]); display_value = ""
                 if item["type"] == "numeric":
                     display_format = item.get("display_format", "{}"); value_to_format = current_value
                     if item.get("is_ms_to_sec"): value_to_format = current_value / 1000
+                    if item.get("is_scaled_px"): value_to_format = current_value / gs.RENDER_SCALE # Shown in 1080p layout units
                     try: display_value = display_format.format(value_to_format)
                     except (ValueError, TypeError): display_value = str(value_to_format) if not item.get("is_ms_to_sec") else f"{value_to_format:.0f}s"
                 elif item["type"] == "choice": display_value = item["get_display"](current_value)
                 value_surf = self._render_text_safe(display_value, ui_text_font_key, color, fallback_size=ui_text_font_size)
-                value_bg_rect_width = max(100, value_surf.get_width() + 20)
-                value_bg_rect = pygame.Rect(WIDTH // 2 + 150, y_pos - 5, value_bg_rect_width, value_surf.get_height() + 10)
-                pygame.draw.rect(self.screen, (30,30,30,160), value_bg_rect, border_radius=5)
-                self.screen.blit(value_surf, (value_bg_rect.left + 10, y_pos))
+                value_bg_rect_width = max(gs.scaled_px(100, as_int=True), value_surf.get_width() + 2 * box_pad_x)
+                value_bg_rect = pygame.Rect(WIDTH // 2 + gs.scaled_px(150, as_int=True), y_pos - box_pad_y, value_bg_rect_width, value_surf.get_height() + 2 * box_pad_y)
+                pygame.draw.rect(self.screen, (30,30,30), value_bg_rect, border_radius=box_pad_y)
+                self.screen.blit(value_surf, (value_bg_rect.left + box_pad_x, y_pos))
                 if item["key"] in DEFAULT_SETTINGS and current_value != DEFAULT_SETTINGS[item["key"]]:
                     mod_surf = self._render_text_safe("*", small_text_font_key, RED, fallback_size=small_text_font_size)
-                    self.screen.blit(mod_surf, (value_bg_rect.right + 5, y_pos))
+                    self.screen.blit(mod_surf, (value_bg_rect.right + box_pad_y, y_pos))
             elif list_idx == selected_idx:
                  action_hint_surf = self._render_text_safe("<ENTER>", ui_text_font_key, YELLOW, fallback_size=ui_text_font_size)
-                 action_hint_bg_rect = pygame.Rect(WIDTH // 2 + 150, y_pos - 5, action_hint_surf.get_width() + 20, action_hint_surf.get_height() + 10)
-                 pygame.draw.rect(self.screen, (40,40,40,180), action_hint_bg_rect, border_radius=5)
-                 self.screen.blit(action_hint_surf, (action_hint_bg_rect.left + 10, y_pos))
+                 action_hint_bg_rect = pygame.Rect(WIDTH // 2 + gs.scaled_px(150, as_int=True), y_pos - box_pad_y, action_hint_surf.get_width() + 2 * box_pad_x, action_hint_surf.get_height() + 2 * box_pad_y)
+                 pygame.draw.rect(self.screen, (40,40,40), action_hint_bg_rect, border_radius=box_pad_y)
+                 self.screen.blit(action_hint_surf, (action_hint_bg_rect.left + box_pad_x, y_pos))
         instr_text = "UP/DOWN: Select | LEFT/RIGHT: Adjust | ENTER: Activate | ESC: Back"
         instr_surf = self._render_text_safe(instr_text, small_text_font_key, self.INSTRUCTION_TEXT_COLOR, fallback_size=small_text_font_size)
         instr_bg_box = pygame.Surface((instr_surf.get_width() + self.INSTRUCTION_PADDING_X, instr_surf.get_height() + self.INSTRUCTION_PADDING_Y), pygame.SRCALPHA)
@@ -1213,34 +1338,36 @@ class UIManager:
             self.screen.blit(warning_bg_box, warning_bg_box.get_rect(center=(WIDTH // 2, self.SECONDARY_INSTRUCTION_CENTER_Y)))
 
     def draw_leaderboard_overlay(self):
-        # Replace self.fonts.get with self.asset_manager.get_font or self._render_text_safe
-        # ...
+        ui_flow_ctrl = self.game_controller.ui_flow_controller
+        self._blit_static_menu_layer("leaderboard", list(ui_flow_ctrl.leaderboard_scores or []), self._draw_leaderboard_layout)
+
+    def _draw_leaderboard_layout(self):
         ui_flow_ctrl = self.game_controller.ui_flow_controller
         title_surf = self._render_text_safe("Leaderboard", "large_text", GOLD, fallback_size=74) # Example
-        title_bg_rect_width = title_surf.get_width() + 40
-        title_bg_rect_height = title_surf.get_height() + 20
+        title_bg_rect_width = title_surf.get_width() + gs.scaled_px(40, as_int=True)
+        title_bg_rect_height = title_surf.get_height() + gs.scaled_px(20, as_int=True)
         title_bg_surf = pygame.Surface((title_bg_rect_width, title_bg_rect_height), pygame.SRCALPHA)
         title_bg_surf.fill((20,20,20,180)) # Title background
         title_bg_surf.blit(title_surf, title_surf.get_rect(center=(title_bg_rect_width//2, title_bg_rect_height//2)))
-        self.screen.blit(title_bg_surf, title_bg_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - 300)))
+        self.screen.blit(title_bg_surf, title_bg_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - gs.scaled_px(300, as_int=True))))
         
         scores_to_display = ui_flow_ctrl.leaderboard_scores
-        header_y = HEIGHT // 2 - 250
-        score_item_y_start = HEIGHT // 2 - 200
+        header_y = HEIGHT // 2 - gs.scaled_px(250, as_int=True)
+        score_item_y_start = HEIGHT // 2 - gs.scaled_px(200, as_int=True)
         
         entry_font_obj = self.asset_manager.get_font("leaderboard_entry", 28) # Example size
         if not entry_font_obj: entry_font_obj = pygame.font.Font(None, 28)
-        item_line_height = entry_font_obj.get_height() + 15
+        item_line_height = entry_font_obj.get_height() + gs.scaled_px(15, as_int=True)
 
         if not scores_to_display:
             no_scores_surf = self._render_text_safe("No scores yet!", "medium_text", WHITE, fallback_size=48)
             # ... (bg box for no_scores_surf) ...
-            no_scores_bg = pygame.Surface((no_scores_surf.get_width()+20, no_scores_surf.get_height()+10), pygame.SRCALPHA)
+            no_scores_bg = pygame.Surface((no_scores_surf.get_width() + gs.scaled_px(20, as_int=True), no_scores_surf.get_height() + gs.scaled_px(10, as_int=True)), pygame.SRCALPHA)
             no_scores_bg.fill((30,30,30,160))
             no_scores_bg.blit(no_scores_surf, no_scores_surf.get_rect(center=(no_scores_bg.get_width()//2, no_scores_bg.get_height()//2)))
             self.screen.blit(no_scores_bg, no_scores_bg.get_rect(center=(WIDTH//2, HEIGHT//2)))
         else:
-            cols_x_positions = {"Rank": WIDTH//2 - 460, "Name": WIDTH//2 - 300, "Level": WIDTH//2 + 100, "Score": WIDTH//2 + 280}
+            cols_x_positions = {"Rank": WIDTH//2 - gs.scaled_px(460, as_int=True), "Name": WIDTH//2 - gs.scaled_px(300, as_int=True), "Level": WIDTH//2 + gs.scaled_px(100, as_int=True), "Score": WIDTH//2 + gs.scaled_px(280, as_int=True)}
             header_font_key = "leaderboard_header"; header_font_size = 32
             entry_font_key = "leaderboard_entry"; entry_font_size = 28
             
@@ -1270,19 +1397,23 @@ class UIManager:
         self.screen.blit(instr_bg_box, instr_bg_box.get_rect(center=(WIDTH // 2, self.BOTTOM_INSTRUCTION_CENTER_Y)))
 
     def draw_game_over_overlay(self):
-        # ... similar refactoring needed ...
+        # High-score status is looked up once per visit, when the layer is built
+        layer_state = (self.game_controller.score, self.game_controller.level, gs.SETTINGS_MODIFIED)
+        self._blit_static_menu_layer("game_over", layer_state, self._draw_game_over_layout)
+
+    def _draw_game_over_layout(self):
         go_text_surf = self._render_text_safe("GAME OVER", "large_text", RED, fallback_size=74)
         score_text_surf = self._render_text_safe(f"Final Score: {self.game_controller.score}", "medium_text", WHITE, fallback_size=48)
-        self.screen.blit(go_text_surf, go_text_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - 120)))
-        self.screen.blit(score_text_surf, score_text_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - 30)))
+        self.screen.blit(go_text_surf, go_text_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - gs.scaled_px(120, as_int=True))))
+        self.screen.blit(score_text_surf, score_text_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - gs.scaled_px(30, as_int=True))))
         can_submit_score = not gs.SETTINGS_MODIFIED
         is_high = self.game_controller.is_current_score_a_high_score()
-        prompt_y_offset = HEIGHT // 2 + 50; prompt_str = ""; prompt_color = WHITE
+        prompt_y_offset = HEIGHT // 2 + gs.scaled_px(50, as_int=True); prompt_str = ""; prompt_color = WHITE
         ui_text_font_key = "ui_text"; ui_text_font_size = 28
         if not can_submit_score:
             no_lb_text_surf = self._render_text_safe("Leaderboard disabled (custom settings active).", ui_text_font_key, YELLOW, fallback_size=ui_text_font_size)
             self.screen.blit(no_lb_text_surf, no_lb_text_surf.get_rect(center=(WIDTH//2, prompt_y_offset)))
-            prompt_y_offset += no_lb_text_surf.get_height() + 20 # Use actual height
+            prompt_y_offset += no_lb_text_surf.get_height() + gs.scaled_px(20, as_int=True) # Use actual height
             prompt_str = "R: Restart  M: Menu  Q: Quit"
         elif is_high:
             prompt_str = "New High Score! Press any key to enter name."
@@ -1293,132 +1424,166 @@ class UIManager:
         self.screen.blit(prompt_surf, prompt_surf.get_rect(center=(WIDTH//2, prompt_y_offset)))
 
     def draw_enter_name_overlay(self):
-        # ... similar refactoring needed ...
+        ui_flow_ctrl = self.game_controller.ui_flow_controller
+        layer_state = (self.game_controller.score, self.game_controller.level, ui_flow_ctrl.player_name_input_cache)
+        self._blit_static_menu_layer("enter_name", layer_state, self._draw_enter_name_layout)
+
+    def _draw_enter_name_layout(self):
         ui_flow_ctrl = self.game_controller.ui_flow_controller
         title_surf = self._render_text_safe("New High Score!", "large_text", GOLD, fallback_size=74)
-        self.screen.blit(title_surf, title_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - 180)))
+        self.screen.blit(title_surf, title_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - gs.scaled_px(180, as_int=True))))
         score_level_text = f"Your Score: {self.game_controller.score} (Level: {self.game_controller.level})"
         score_level_surf = self._render_text_safe(score_level_text, "medium_text", WHITE, fallback_size=48)
-        self.screen.blit(score_level_surf, score_level_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - 90)))
+        self.screen.blit(score_level_surf, score_level_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - gs.scaled_px(90, as_int=True))))
         prompt_name_surf = self._render_text_safe("Enter Name (max 6 chars, A-Z):", "ui_text", WHITE, fallback_size=28)
-        self.screen.blit(prompt_name_surf, prompt_name_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - 20)))
+        self.screen.blit(prompt_name_surf, prompt_name_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - gs.scaled_px(20, as_int=True))))
         player_name_input_str = ui_flow_ctrl.player_name_input_cache
-        input_box_width = 300; input_box_height = 60
-        input_box_rect = pygame.Rect(WIDTH//2 - input_box_width//2, HEIGHT//2 + 30, input_box_width, input_box_height)
-        pygame.draw.rect(self.screen, WHITE, input_box_rect, 2, border_radius=10)
+        input_box_width = gs.scaled_px(300, as_int=True); input_box_height = gs.scaled_px(60, as_int=True)
+        input_box_rect = pygame.Rect(WIDTH//2 - input_box_width//2, HEIGHT//2 + gs.scaled_px(30, as_int=True), input_box_width, input_box_height)
+        pygame.draw.rect(self.screen, WHITE, input_box_rect, 2, border_radius=gs.scaled_px(10, as_int=True))
         input_text_surf = self._render_text_safe(player_name_input_str, "input_text", WHITE, fallback_size=50)
         self.screen.blit(input_text_surf, input_text_surf.get_rect(center=input_box_rect.center))
         submit_prompt_surf = self._render_text_safe("Press ENTER to submit.", "ui_text", CYAN, fallback_size=28)
-        self.screen.blit(submit_prompt_surf, submit_prompt_surf.get_rect(center=(WIDTH//2, HEIGHT//2 + 120)))
+        self.screen.blit(submit_prompt_surf, submit_prompt_surf.get_rect(center=(WIDTH//2, HEIGHT//2 + gs.scaled_px(120, as_int=True))))
 
     def draw_architect_vault_success_overlay(self):
         # ... similar refactoring needed ...
         ui_flow_ctrl = self.game_controller.ui_flow_controller
         msg_surf = self._render_text_safe(ui_flow_ctrl.architect_vault_result_message, "large_text", ui_flow_ctrl.architect_vault_result_message_color, fallback_size=74)
-        self.screen.blit(msg_surf, msg_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - 80)))
+        self.screen.blit(msg_surf, msg_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - gs.scaled_px(80, as_int=True))))
         prompt_surf = self._render_text_safe("Press ENTER or M to Continue", "ui_text", WHITE, fallback_size=28)
-        self.screen.blit(prompt_surf, prompt_surf.get_rect(center=(WIDTH//2, HEIGHT//2 + 100)))
+        self.screen.blit(prompt_surf, prompt_surf.get_rect(center=(WIDTH//2, HEIGHT//2 + gs.scaled_px(100, as_int=True))))
 
     def draw_architect_vault_failure_overlay(self):
         # ... similar refactoring needed ...
         ui_flow_ctrl = self.game_controller.ui_flow_controller
         msg_surf = self._render_text_safe(ui_flow_ctrl.architect_vault_result_message, "large_text", ui_flow_ctrl.architect_vault_result_message_color, fallback_size=74)
-        self.screen.blit(msg_surf, msg_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - 50)))
+        self.screen.blit(msg_surf, msg_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - gs.scaled_px(50, as_int=True))))
         if hasattr(self.game_controller, 'architect_vault_failure_reason') and self.game_controller.architect_vault_failure_reason:
             reason_surf = self._render_text_safe(self.game_controller.architect_vault_failure_reason, "ui_text", YELLOW, fallback_size=28)
-            self.screen.blit(reason_surf, reason_surf.get_rect(center=(WIDTH//2, HEIGHT//2 + 20)))
+            self.screen.blit(reason_surf, reason_surf.get_rect(center=(WIDTH//2, HEIGHT//2 + gs.scaled_px(20, as_int=True))))
         prompt_surf = self._render_text_safe("Press ENTER or M to Return to Menu", "ui_text", WHITE, fallback_size=28)
-        self.screen.blit(prompt_surf, prompt_surf.get_rect(center=(WIDTH//2, HEIGHT//2 + 80)))
-
-    def draw_maze_defense_hud(self):
-        # ... similar refactoring needed for all text rendering ...
-        panel_y_start = GAME_PLAY_AREA_HEIGHT; panel_height = BOTTOM_PANEL_HEIGHT
-        panel_surf = pygame.Surface((WIDTH, panel_height), pygame.SRCALPHA); panel_surf.fill((20, 25, 35, 220)) 
-        pygame.draw.line(panel_surf, (80, 120, 170, 200), (0, 0), (WIDTH, 0), 2); self.screen.blit(panel_surf, (0, panel_y_start))
-        h_padding = 20; v_padding = 10; element_spacing = 8; text_icon_spacing = 3; icon_spacing = 5
-        current_hud_y = panel_y_start + panel_height - v_padding
-        ui_text_font_key = "ui_text"; ui_text_size = 28
-        ui_values_font_key = "ui_values"; ui_values_size = 30
-        ui_emoji_general_key = "ui_emoji_general"; ui_emoji_size = 32
-        small_text_key = "small_text"; small_text_size = 24
-
-        cores_emoji_char = "💠"; cores_value_str = str(self.drone_system.get_player_cores())
-        cores_icon_surf = self._render_text_safe(cores_emoji_char, ui_emoji_general_key, GOLD, fallback_size=ui_emoji_size)
-        cores_value_text_surf = self._render_text_safe(cores_value_str, ui_values_font_key, GOLD, fallback_size=ui_values_size)
-        core_display_element_height = max(cores_icon_surf.get_height(), cores_value_text_surf.get_height())
-        cores_y_pos = current_hud_y - core_display_element_height; cores_x_pos = h_padding
-        self.screen.blit(cores_icon_surf, (cores_x_pos, cores_y_pos + (core_display_element_height - cores_icon_surf.get_height()) // 2))
-        self.screen.blit(cores_value_text_surf, (cores_x_pos + cores_icon_surf.get_width() + text_icon_spacing, cores_y_pos + (core_display_element_height - cores_value_text_surf.get_height()) // 2))
-        current_hud_y = cores_y_pos - element_spacing
-        
-        if self.game_controller.player:
-            life_icon_surf = self.ui_asset_surfaces.get("current_drone_life_icon") # Already loaded
-            if life_icon_surf:
-                lives_y_pos = current_hud_y - self.ui_icon_size_lives[1]
-                for i in range(self.game_controller.lives):
-                    self.screen.blit(life_icon_surf, (h_padding + i * (self.ui_icon_size_lives[0] + icon_spacing), lives_y_pos))
-        
-        center_hud_x = WIDTH // 2; combat_ctrl = self.game_controller.combat_controller
-        if combat_ctrl and combat_ctrl.wave_manager:
-            wave_manager = combat_ctrl.wave_manager; wave_text_str = wave_manager.get_current_wave_display()
-            wave_surf = self._render_text_safe(wave_text_str, ui_text_font_key, CYAN, fallback_size=ui_text_size)
-            wave_rect = wave_surf.get_rect(centerx=center_hud_x, top=panel_y_start + v_padding); self.screen.blit(wave_surf, wave_rect)
-            prompt_y_start = wave_rect.bottom + 5
-            if wave_manager.is_build_phase_active:
-                build_time_str = wave_manager.get_build_phase_time_remaining_display()
-                build_time_surf = self._render_text_safe(build_time_str, ui_text_font_key, YELLOW, fallback_size=ui_text_size)
-                build_time_rect = build_time_surf.get_rect(centerx=center_hud_x, top=prompt_y_start); self.screen.blit(build_time_surf, build_time_rect)
-                prompt_y_start = build_time_rect.bottom + 3
-                turret_prompt_surf = self._render_text_safe("T: Place Turret", small_text_key, GREEN, fallback_size=small_text_size)
-                start_wave_prompt_surf = self._render_text_safe("SPACE: Start Wave", small_text_key, GREEN, fallback_size=small_text_size)
-                total_width_prompts = turret_prompt_surf.get_width() + start_wave_prompt_surf.get_width() + 20
-                start_x_prompts = center_hud_x - total_width_prompts // 2
-                turret_prompt_rect = turret_prompt_surf.get_rect(topleft=(start_x_prompts, prompt_y_start)); self.screen.blit(turret_prompt_surf, turret_prompt_rect)
-                start_wave_prompt_rect = start_wave_prompt_surf.get_rect(left=turret_prompt_rect.right + 20, centery=turret_prompt_rect.centery)
-                self.screen.blit(start_wave_prompt_surf, start_wave_prompt_rect)
-            else: 
-                wave_prog_surf = self._render_text_safe("Wave In Progress!", ui_text_font_key, ORANGE, fallback_size=ui_text_size)
-                self.screen.blit(wave_prog_surf, wave_prog_surf.get_rect(centerx=center_hud_x, top=prompt_y_start))
+        self.screen.blit(prompt_surf, prompt_surf.get_rect(center=(WIDTH//2, HEIGHT//2 + gs.scaled_px(80, as_int=True))))
+
+    def _render_hud_icon_text(self, icon_char, text, color, icon_font_key, icon_size, text_font_key, text_size, text_icon_spacing=gs.scaled_px(3, as_int=True)):
+        """One HUD row: an emoji icon followed by a text label, both vertically centred."""
+        icon_surf = self._render_text_safe(icon_char, icon_font_key, color, fallback_size=icon_size)
+        text_surf = self._render_text_safe(text, text_font_key, color, fallback_size=text_size)
+        row_h = max(icon_surf.get_height(), text_surf.get_height())
+        row_surf = pygame.Surface((icon_surf.get_width() + text_icon_spacing + text_surf.get_width(), row_h), pygame.SRCALPHA)
+        row_surf.blit(icon_surf, (0, (row_h - icon_surf.get_height()) // 2))
+        row_surf.blit(text_surf, (icon_surf.get_width() + text_icon_spacing, (row_h - text_surf.get_height()) // 2))
+        return row_surf
+
+    def _hud_wave_value(self):
+        combat_ctrl = self.game_controller.combat_controller
+        if not (combat_ctrl and combat_ctrl.wave_manager): return None
+        wave_manager = combat_ctrl.wave_manager
+        build_time_str = wave_manager.get_build_phase_time_remaining_display() if wave_manager.is_build_phase_active else None
+        return (wave_manager.get_current_wave_display(), wave_manager.is_build_phase_active, build_time_str)
+
+    def _render_hud_wave(self, value):
+        ui_text_font_key = "ui_text"; ui_text_size = 28; small_text_key = "small_text"; small_text_size = 24
+        if value is None:
+            return self._render_text_safe("Loading Defense...", ui_text_font_key, GREY, fallback_size=ui_text_size)
+        wave_text_str, is_build_phase_active, build_time_str = value
+        lines = [self._render_text_safe(wave_text_str, ui_text_font_key, CYAN, fallback_size=ui_text_size)]
+        if is_build_phase_active:
+            lines.append(self._render_text_safe(build_time_str, ui_text_font_key, YELLOW, fallback_size=ui_text_size))
+            turret_prompt_surf = self._render_text_safe("T: Place Turret", small_text_key, GREEN, fallback_size=small_text_size)
+            start_wave_prompt_surf = self._render_text_safe("SPACE: Start Wave", small_text_key, GREEN, fallback_size=small_text_size)
+            prompts_h = max(turret_prompt_surf.get_height(), start_wave_prompt_surf.get_height())
+            prompts_gap = gs.scaled_px(20, as_int=True)
+            prompts_surf = pygame.Surface((turret_prompt_surf.get_width() + prompts_gap + start_wave_prompt_surf.get_width(), prompts_h), pygame.SRCALPHA)
+            prompts_surf.blit(turret_prompt_surf, (0, (prompts_h - turret_prompt_surf.get_height()) // 2))
+            prompts_surf.blit(start_wave_prompt_surf, (turret_prompt_surf.get_width() + prompts_gap, (prompts_h - start_wave_prompt_surf.get_height()) // 2))
+            lines.append(prompts_surf); line_gaps = [gs.scaled_px(5, as_int=True), gs.scaled_px(3, as_int=True)]
         else:
-            loading_defense_surf = self._render_text_safe("Loading Defense...", ui_text_font_key, GREY, fallback_size=ui_text_size)
-            self.screen.blit(loading_defense_surf, loading_defense_surf.get_rect(centerx=center_hud_x, centery=panel_y_start + panel_height // 2))
-        
+            lines.append(self._render_text_safe("Wave In Progress!", ui_text_font_key, ORANGE, fallback_size=ui_text_size)); line_gaps = [gs.scaled_px(5, as_int=True)]
+        block_surf = pygame.Surface((max(line.get_width() for line in lines), sum(line.get_height() for line in lines) + sum(line_gaps)), pygame.SRCALPHA)
+        current_y = 0
+        for i, line in enumerate(lines):
+            block_surf.blit(line, line.get_rect(centerx=block_surf.get_width() // 2, top=current_y))
+            current_y += line.get_height() + (line_gaps[i] if i < len(line_gaps) else 0)
+        return block_surf
+
+    def _layout_maze_defense_hud(self, layer, widgets):
+        h_padding = gs.scaled_px(20, as_int=True); v_padding = gs.scaled_px(10, as_int=True); element_spacing = gs.scaled_px(8, as_int=True)
+        current_hud_y = layer.get_height() - v_padding
+        for name in ("cores", "lives"):
+            widget = widgets[name]
+            if widget.surface is None: widget.rect = None; continue
+            current_hud_y -= widget.surface.get_height()
+            widget.rect = pygame.Rect((h_padding, current_hud_y), widget.surface.get_size())
+            layer.blit(widget.surface, widget.rect); current_hud_y -= element_spacing
+        wave_widget = widgets["wave"]
+        if wave_widget.value is None: wave_widget.rect = wave_widget.surface.get_rect(centerx=WIDTH // 2, centery=layer.get_height() // 2)
+        else: wave_widget.rect = wave_widget.surface.get_rect(centerx=WIDTH // 2, top=v_padding)
+        layer.blit(wave_widget.surface, wave_widget.rect)
+        score_widget = widgets["score"]
+        score_widget.rect = score_widget.surface.get_rect(right=WIDTH - h_padding, bottom=layer.get_height() - v_padding)
+        layer.blit(score_widget.surface, score_widget.rect)
+
+    def _build_maze_defense_hud(self):
+        hud_panel = RetainedHudPanel((WIDTH, BOTTOM_PANEL_HEIGHT), self._create_hud_panel_background(), self._layout_maze_defense_hud)
+        hud_panel.add_widget("cores", self.drone_system.get_player_cores,
+                             lambda cores: self._render_hud_icon_text("💠", str(cores), GOLD, "ui_emoji_general", 32, "ui_values", 30))
+        hud_panel.add_widget("lives", lambda: self._hud_lives_value() if self.game_controller.player else None, self._render_hud_lives)
+        hud_panel.add_widget("wave", self._hud_wave_value, self._render_hud_wave)
+        hud_panel.add_widget("score", lambda: self.game_controller.score,
+                             lambda score: self._render_hud_icon_text("🏆 ", f"Score: {score}", GOLD, "ui_emoji_general", 32, "ui_text", 28))
+        return hud_panel
+
+    def _hud_reactor_value(self):
+        combat_ctrl = self.game_controller.combat_controller
         reactor = combat_ctrl.core_reactor if combat_ctrl else None
-        if reactor and (reactor.alive or reactor.current_health > 0):
-            bar_width = WIDTH * 0.35; bar_height_reactor = 22; bar_x = (WIDTH - bar_width) / 2; bar_y = 15
-            health_percentage = reactor.current_health / reactor.max_health if reactor.max_health > 0 else 0
-            filled_width = bar_width * health_percentage
-            pygame.draw.rect(self.screen, DARK_GREY, (bar_x, bar_y, bar_width, bar_height_reactor), border_radius=3)
-            fill_color = RED; 
-            if health_percentage > 0.66: fill_color = GREEN
-            elif health_percentage > 0.33: fill_color = YELLOW
-            if filled_width > 0: pygame.draw.rect(self.screen, fill_color, (bar_x, bar_y, int(filled_width), bar_height_reactor), border_radius=3)
-            pygame.draw.rect(self.screen, WHITE, (bar_x, bar_y, bar_width, bar_height_reactor), 2, border_radius=3)
-            reactor_label_icon_surf = self.ui_asset_surfaces.get("reactor_icon_placeholder") # Already loaded
-            if reactor_label_icon_surf: self.screen.blit(reactor_label_icon_surf, reactor_label_icon_surf.get_rect(midright=(bar_x - 10, bar_y + bar_height_reactor // 2)))
-            health_text_surf = self._render_text_safe(f"{int(reactor.current_health)}/{int(reactor.max_health)}", small_text_key, WHITE, fallback_size=small_text_size)
-            self.screen.blit(health_text_surf, health_text_surf.get_rect(midleft=(bar_x + bar_width + 10, bar_y + bar_height_reactor // 2)))
-        
-        score_x_anchor = WIDTH - h_padding; score_emoji_char = "🏆 "; score_text_str = f"Score: {self.game_controller.score}"
-        score_emoji_surf = self._render_text_safe(score_emoji_char, ui_emoji_general_key, GOLD, fallback_size=ui_emoji_size)
-        score_text_surf = self._render_text_safe(score_text_str, ui_text_font_key, GOLD, fallback_size=ui_text_size)
-        score_total_width = score_emoji_surf.get_width() + text_icon_spacing + score_text_surf.get_width()
-        score_start_x = score_x_anchor - score_total_width
-        score_max_height = max(score_emoji_surf.get_height(), score_text_surf.get_height())
-        score_y_pos = panel_y_start + panel_height - v_padding - score_max_height
-        self.screen.blit(score_emoji_surf, (score_start_x, score_y_pos + (score_max_height - score_emoji_surf.get_height()) // 2))
-        self.screen.blit(score_text_surf, (score_start_x + score_emoji_surf.get_width() + text_icon_spacing, score_y_pos + (score_max_height - score_text_surf.get_height()) // 2))
+        if not (reactor and (reactor.alive or reactor.current_health > 0)): return None
+        return (int(reactor.current_health), int(reactor.max_health))
+
+    def _render_hud_reactor(self, value):
+        """Reactor health bar with its icon on the left and the health readout on the right."""
+        if value is None: return None
+        current_health, max_health = value
+        bar_width = int(WIDTH * 0.35); bar_height_reactor = gs.scaled_px(22, as_int=True); label_gap = gs.scaled_px(10, as_int=True)
+        health_percentage = current_health / max_health if max_health > 0 else 0
+        fill_color = RED
+        if health_percentage > 0.66: fill_color = GREEN
+        elif health_percentage > 0.33: fill_color = YELLOW
+        reactor_label_icon_surf = self.ui_asset_surfaces.get("reactor_icon_placeholder") # Already loaded
+        health_text_surf = self._render_text_safe(f"{current_health}/{max_health}", "small_text", WHITE, fallback_size=24)
+        icon_w = reactor_label_icon_surf.get_width() + label_gap if reactor_label_icon_surf else 0
+        row_h = max(bar_height_reactor, reactor_label_icon_surf.get_height() if reactor_label_icon_surf else 0, health_text_surf.get_height())
+        row_surf = pygame.Surface((icon_w + bar_width + label_gap + health_text_surf.get_width(), row_h), pygame.SRCALPHA)
+        bar_rect = pygame.Rect(icon_w, (row_h - bar_height_reactor) // 2, bar_width, bar_height_reactor)
+        pygame.draw.rect(row_surf, DARK_GREY, bar_rect, border_radius=3)
+        if health_percentage > 0: pygame.draw.rect(row_surf, fill_color, (bar_rect.x, bar_rect.y, int(bar_width * health_percentage), bar_height_reactor), border_radius=3)
+        pygame.draw.rect(row_surf, WHITE, bar_rect, 2, border_radius=3)
+        if reactor_label_icon_surf: row_surf.blit(reactor_label_icon_surf, reactor_label_icon_surf.get_rect(midright=(bar_rect.x - label_gap, bar_rect.centery)))
+        row_surf.blit(health_text_surf, health_text_surf.get_rect(midleft=(bar_rect.right + label_gap, bar_rect.centery)))
+        return row_surf
+
+    def draw_maze_defense_hud(self):
+        if self.maze_defense_hud is None: self.maze_defense_hud = self._build_maze_defense_hud()
+        self.maze_defense_hud.draw(self.screen, (0, GAME_PLAY_AREA_HEIGHT))
+
+        # The reactor bar sits at the top of the play area, outside the panel layer
+        self.reactor_hud_widget.refresh()
+        if self.reactor_hud_widget.surface:
+            reactor_surf = self.reactor_hud_widget.surface
+            reactor_label_icon_surf = self.ui_asset_surfaces.get("reactor_icon_placeholder")
+            bar_x = int((WIDTH - WIDTH * 0.35) / 2) - (reactor_label_icon_surf.get_width() + gs.scaled_px(10, as_int=True) if reactor_label_icon_surf else 0); bar_y_center = gs.scaled_px(15, as_int=True) + gs.scaled_px(22, as_int=True) // 2
+            self.screen.blit(reactor_surf, (bar_x, bar_y_center - reactor_surf.get_height() // 2))
 
     def draw_pause_overlay(self):
         # ... similar refactoring needed ...
         overlay_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA); overlay_surface.fill((0,0,0,150))
         self.screen.blit(overlay_surface, (0,0))
         pause_title_surf = self._render_text_safe("PAUSED", "large_text", WHITE, fallback_size=74)
-        self.screen.blit(pause_title_surf, pause_title_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - 60)))
+        self.screen.blit(pause_title_surf, pause_title_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - gs.scaled_px(60, as_int=True))))
         current_game_state_when_paused = self.scene_manager.get_current_state()
         pause_text_options = "P: Continue | M: Menu | Q: Quit Game"
         if current_game_state_when_paused == GAME_STATE_PLAYING: pause_text_options = "P: Continue | L: Leaderboard | M: Menu | Q: Quit Game"
         elif current_game_state_when_paused.startswith("architect_vault"): pause_text_options = "P: Continue | ESC: Main Menu (Exit Vault) | Q: Quit Game"
         elif current_game_state_when_paused == GAME_STATE_MAZE_DEFENSE: pause_text_options = "P: Resume | M: Menu (End Defense) | Q: Quit"
         options_surf = self._render_text_safe(pause_text_options, "ui_text", WHITE, fallback_size=28)
-        self.screen.blit(options_surf, options_surf.get_rect(center=(WIDTH//2, HEIGHT//2 + 40)))
\ No newline at end of file
+        self.screen.blit(options_surf, options_surf.get_rect(center=(WIDTH//2, HEIGHT//2 + gs.scaled_px(40, as_int=True))))
\ No newline at end of file